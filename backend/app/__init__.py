@@ -3,8 +3,17 @@ import os
 from flask import Flask
 from flask_cors import CORS
 
+from .commands import (build_artifact_command, compact_irregulars_command,
+                       form_index_stats_command, import_lexicon_command,
+                       upgrade_db_command)
 from .extensions import db
+from .form_index import init_form_index
+from .glosses import init_gloss_index
+from .paradigm_artifact import ParadigmArtifact
+from .paradigm_store import ParadigmStore
 from .routes import main
+from .schema import init_schema
+from .verb_index import init_similarity_index, init_verb_completer
 from backend import config
 
 
@@ -27,6 +36,21 @@ def create_app():
 
     from . import models
     db.init_app(app)
+    init_schema(app)
+    ParadigmStore(app)
+
+    artifact_path = app.config.get('PARADIGM_ARTIFACT_PATH')
+    if artifact_path and os.path.exists(artifact_path):
+        ParadigmArtifact(artifact_path).init_app(app)
+    init_form_index(app)
+    init_verb_completer(app)
+    init_similarity_index(app)
+    init_gloss_index(app)
+    app.cli.add_command(build_artifact_command)
+    app.cli.add_command(compact_irregulars_command)
+    app.cli.add_command(import_lexicon_command)
+    app.cli.add_command(upgrade_db_command)
+    app.cli.add_command(form_index_stats_command)
 
     app.register_blueprint(main, url_prefix='/api')
     return app
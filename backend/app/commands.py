@@ -0,0 +1,277 @@
+from itertools import islice
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import func, inspect
+
+from .extensions import db
+from .form_index import describe_form_index, get_form_index
+from .glosses import create_gloss_index, has_gloss_index
+from .models import IrregularVerb, RegularVerb, Tense, Conjugation, VerbGloss
+from .schema import add_pattern_column
+from backend.app.resources.verb import Verb
+from backend.core.artifact import write_artifact
+from backend.core.lexicon import classify_entry, read_lexicon
+from backend.core.utils import PRONOUNS
+from backend.core.sources import PRONOUN_ATTRIBUTES
+from backend.core.utils.conjugate import ALL_TENSES, SIMPLE_TENSES
+from backend.core.utils.patterns import (classify_verb, diff_paradigm,
+                                         predict_conjugation,
+                                         predict_participles)
+
+
+def build_artifact(path: str) -> int:
+    """
+    Write every verb's conjugations, as produced by Verb.conjugate, to a
+    conjugation artifact and return the number of verbs written.
+    """
+    infinitives = {verb.infinitive for verb in RegularVerb.query.all()} | \
+                  {verb.infinitive for verb in IrregularVerb.query.all()}
+
+    def paradigms():
+        for infinitive in sorted(infinitives):
+            verb = Verb.get(infinitive)
+            forms = []
+            for tense in ALL_TENSES:
+                tense_forms = []
+                for pronoun in PRONOUNS:
+                    try:
+                        tense_forms.append(verb.conjugate(tense, pronoun))
+                    except ValueError:
+                        tense_forms.append(None)
+                forms.append(tense_forms)
+            yield infinitive, verb.id, verb.is_regular, forms
+
+    return write_artifact(path, list(ALL_TENSES), paradigms())
+
+
+@click.command('build-artifact')
+@click.argument('path', required=False)
+@with_appcontext
+def build_artifact_command(path: str | None) -> None:
+    """Write every verb's conjugations to a memory-mapped artifact."""
+    path = path or current_app.config.get('PARADIGM_ARTIFACT_PATH')
+    if not path:
+        raise click.UsageError("No PATH given and PARADIGM_ARTIFACT_PATH "
+                               "is not set")
+
+    # Build from the database rather than from a previously built artifact
+    artifact = current_app.extensions.pop('paradigm_artifact', None)
+    if artifact:
+        artifact.close()
+    count = build_artifact(path)
+    click.echo(f"Wrote {count} verbs to {path}")
+
+
+def upgrade_db() -> list[str]:
+    """Bring a database created by an earlier version up to the current
+    schema, creating missing tables, columns, and the SQLite gloss index,
+    and return a description of each change made."""
+    changes = []
+    missing_tables = set(db.metadata.tables) - set(
+        inspect(db.engine).get_table_names())
+    if missing_tables:
+        db.create_all()
+        changes.extend(f"Created table {table}"
+                       for table in sorted(missing_tables))
+    if add_pattern_column():
+        changes.append("Added column irregular_verb.pattern")
+    if db.engine.dialect.name == 'sqlite' and not has_gloss_index():
+        create_gloss_index()
+        changes.append("Created gloss index verb_gloss_fts")
+    return changes
+
+
+@click.command('upgrade-db')
+@with_appcontext
+def upgrade_db_command() -> None:
+    """Bring the database up to the current schema."""
+    changes = upgrade_db()
+    for change in changes:
+        click.echo(change)
+    if not changes:
+        click.echo("Database is up to date")
+
+
+@click.command('form-index-stats')
+@with_appcontext
+def form_index_stats_command() -> None:
+    """Build the form index and report its size."""
+    click.echo(describe_form_index(get_form_index()))
+
+
+def compact_irregulars() -> tuple[int, int, int]:
+    """
+    Assign a rule pattern to each irregular verb stored as complete rows
+    and replace its rows with the forms the pattern does not predict.
+    Return the number of verbs compacted and the number of stored forms
+    before and after.
+
+    Raises:
+        ValueError: if the Tense table is missing a simple tense or the
+                    participles.
+    """
+    # Databases created before patterns were added lack the column
+    add_pattern_column()
+
+    tenses = {tense.name: tense for tense in Tense.query.all()}
+    missing = [tense for tense in SIMPLE_TENSES + ('participles',)
+               if tense not in tenses]
+    if missing:
+        raise ValueError(f"Missing tenses: {', '.join(missing)}")
+
+    columns = PRONOUN_ATTRIBUTES + ('present_participle', 'past_participle')
+    compacted, before, after = 0, 0, 0
+    for verb in IrregularVerb.query.filter(
+            IrregularVerb.pattern.is_(None)).order_by(
+            IrregularVerb.id).all():
+        rows = {row.tense.name: row for row in verb.conjugations}
+
+        # Tenses without a row follow the regular rules
+        infinitive = verb.infinitive
+        conjugations = {
+            tense: tuple(getattr(rows[tense], attribute) for attribute in
+                         PRONOUN_ATTRIBUTES) if tense in rows
+            else predict_conjugation(infinitive, tense)
+            for tense in SIMPLE_TENSES}
+        participles = (
+            rows['participles'].present_participle,
+            rows['participles'].past_participle) if 'participles' in rows \
+            else predict_participles(infinitive)
+        pattern = classify_verb(infinitive, conjugations, participles)
+        if pattern is None:
+            continue
+
+        diffs = diff_paradigm(infinitive, pattern, conjugations,
+                              participles)
+        diffs['participles'] = (None,) * 6 + diffs['participles']
+        for tense, forms in diffs.items():
+            row = rows.get(tense)
+            before += 0 if row is None else sum(
+                getattr(row, column) is not None for column in columns)
+            after += sum(form is not None for form in forms)
+            if not any(forms):
+                if row is not None:
+                    db.session.delete(row)
+                continue
+            if row is None:
+                row = Conjugation(verb_id=verb.id, tense_id=tenses[tense].id)
+                db.session.add(row)
+            for column, form in zip(columns, forms):
+                setattr(row, column, form)
+        verb.pattern = pattern
+        compacted += 1
+
+    db.session.commit()
+    return compacted, before, after
+
+
+@click.command('compact-irregulars')
+@with_appcontext
+def compact_irregulars_command() -> None:
+    """Store irregular verbs as diffs against their rule patterns."""
+    try:
+        compacted, before, after = compact_irregulars()
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"Compacted {compacted} verbs from {before} to {after} "
+               f"stored forms")
+
+
+def import_lexicon(path: str, batch_size: int = 1000) -> dict:
+    """
+    Import the verbs of a .jsonl or .csv lexicon file, storing each verb
+    whose forms the regular rules predict as a regular verb and every other
+    verb as an irregular verb with its rule pattern and stored diffs. The
+    file is read lazily and each batch of verbs is inserted in one
+    transaction, so memory use does not grow with the file. Verbs already
+    in the database are skipped. Return the number of regular, irregular,
+    and skipped verbs.
+
+    Raises:
+        ValueError: if the file or an entry in it is invalid, or if the
+                    batch size is not positive.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    add_pattern_column()
+
+    tenses = {tense.name: tense.id for tense in Tense.query.all()}
+    for name in SIMPLE_TENSES + ('participles',):
+        if name not in tenses:
+            tense = Tense(name=name)
+            db.session.add(tense)
+            db.session.flush()
+            tenses[name] = tense.id
+    db.session.commit()
+
+    counts = {'regular': 0, 'irregular': 0, 'skipped': 0}
+    entries = read_lexicon(path)
+    while batch := list(islice(entries, batch_size)):
+        infinitives = {entry.infinitive for entry in batch}
+        existing = {
+            infinitive for model in (RegularVerb, IrregularVerb)
+            for infinitive, in db.session.query(model.infinitive).filter(
+                model.infinitive.in_(infinitives))}
+
+        # Irregular verb ids are assigned here so their conjugations can be
+        # inserted in the same executemany as every other row
+        next_id = (db.session.query(func.max(IrregularVerb.id)).scalar()
+                   or 0) + 1
+        regular_rows, irregular_rows, conjugation_rows, gloss_rows = \
+            [], [], [], []
+        for entry in batch:
+            if entry.infinitive in existing:
+                counts['skipped'] += 1
+                continue
+            existing.add(entry.infinitive)
+            classified = classify_entry(entry)
+            if entry.gloss:
+                gloss_rows.append({'infinitive': entry.infinitive,
+                                   'gloss': entry.gloss})
+            if classified.is_regular:
+                regular_rows.append({'infinitive': entry.infinitive})
+                counts['regular'] += 1
+                continue
+
+            irregular_rows.append({'id': next_id,
+                                   'infinitive': entry.infinitive,
+                                   'pattern': classified.pattern})
+            for tense, forms in classified.stored.items():
+                row = dict.fromkeys(PRONOUN_ATTRIBUTES + (
+                    'present_participle', 'past_participle'))
+                if tense == 'participles':
+                    row['present_participle'], row['past_participle'] = forms
+                else:
+                    row.update(zip(PRONOUN_ATTRIBUTES, forms))
+                row.update(verb_id=next_id, tense_id=tenses[tense])
+                conjugation_rows.append(row)
+            next_id += 1
+            counts['irregular'] += 1
+
+        for model, rows in ((RegularVerb, regular_rows),
+                            (IrregularVerb, irregular_rows),
+                            (Conjugation, conjugation_rows),
+                            (VerbGloss, gloss_rows)):
+            if rows:
+                db.session.execute(model.__table__.insert(), rows)
+        db.session.commit()
+    return counts
+
+
+@click.command('import-lexicon')
+@click.argument('path')
+@click.option('--batch-size', default=1000, show_default=True,
+              help="Number of verbs inserted per transaction.")
+@with_appcontext
+def import_lexicon_command(path: str, batch_size: int) -> None:
+    """Import the verbs of a .jsonl or .csv lexicon file."""
+    try:
+        counts = import_lexicon(path, batch_size)
+    except (OSError, ValueError) as e:
+        db.session.rollback()
+        raise click.ClickException(str(e))
+    click.echo(f"Imported {counts['regular']} regular and "
+               f"{counts['irregular']} irregular verbs, skipped "
+               f"{counts['skipped']} existing verbs")
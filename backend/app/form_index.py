@@ -0,0 +1,53 @@
+from flask import Flask, current_app
+from sqlalchemy.exc import SQLAlchemyError
+
+from .sources import get_verb_source
+from backend.core.form_index import FormIndex
+from backend.core.form_search import FormSearchIndex
+
+
+def describe_form_index(index: FormIndex) -> str:
+    """Return the size of a form index, in forms and memory."""
+    return (f"Form index: {len(index)} forms, "
+            f"{index.memory_usage() / 1024:.0f} KiB")
+
+
+def init_form_index(app: Flask) -> None:
+    """Build the app's form index at startup and report its size if the
+    app sets FORM_INDEX_PRELOAD, and its wildcard search index as well if
+    the app sets FORM_SEARCH_PRELOAD. Otherwise each is built by the first
+    request that needs it, which then waits for the build, and the
+    form-index-stats command reports the form index's size."""
+    preload_search = app.config.get('FORM_SEARCH_PRELOAD', False)
+    if not app.config.get('FORM_INDEX_PRELOAD', False) and \
+            not preload_search:
+        return
+    with app.app_context():
+        try:
+            # Logged as a warning so it shows with Flask's default level
+            app.logger.warning(describe_form_index(get_form_index()))
+            if preload_search:
+                get_form_search_index()
+        except SQLAlchemyError as e:
+            # Leave the index unbuilt so it is built on first use
+            app.logger.warning(f"Form index not built: {e}")
+
+
+def get_form_index() -> FormIndex:
+    """Return the current app's form index, building it from the app's verb
+    source the first time it is needed."""
+    index = current_app.extensions.get('form_index')
+    if index is None:
+        index = current_app.extensions.setdefault(
+            'form_index', FormIndex.from_source(get_verb_source()))
+    return index
+
+
+def get_form_search_index() -> FormSearchIndex:
+    """Return the current app's wildcard search index over the forms of its
+    form index, building it the first time it is needed."""
+    index = current_app.extensions.get('form_search_index')
+    if index is None:
+        index = current_app.extensions.setdefault(
+            'form_search_index', FormSearchIndex(get_form_index().forms))
+    return index
@@ -0,0 +1,106 @@
+import re
+
+from flask import Flask
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+
+from .extensions import db
+
+# FTS5 index over the gloss table, kept in sync by triggers
+_GLOSS_INDEX_STATEMENTS = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS verb_gloss_fts USING fts5("
+    "gloss, content='verb_gloss', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS verb_gloss_ai AFTER INSERT ON verb_gloss "
+    "BEGIN INSERT INTO verb_gloss_fts(rowid, gloss) "
+    "VALUES (new.id, new.gloss); END",
+    "CREATE TRIGGER IF NOT EXISTS verb_gloss_ad AFTER DELETE ON verb_gloss "
+    "BEGIN INSERT INTO verb_gloss_fts(verb_gloss_fts, rowid, gloss) "
+    "VALUES ('delete', old.id, old.gloss); END",
+    "CREATE TRIGGER IF NOT EXISTS verb_gloss_au AFTER UPDATE ON verb_gloss "
+    "BEGIN INSERT INTO verb_gloss_fts(verb_gloss_fts, rowid, gloss) "
+    "VALUES ('delete', old.id, old.gloss); "
+    "INSERT INTO verb_gloss_fts(rowid, gloss) VALUES (new.id, new.gloss); "
+    "END",
+)
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def has_gloss_index() -> bool:
+    """Return True if the database has the full-text index over verb
+    glosses."""
+    return inspect(db.engine).has_table('verb_gloss_fts')
+
+
+def create_gloss_index() -> None:
+    """Create the full-text index over verb glosses and the triggers that
+    keep it in sync if they are missing, and rebuild it from the gloss
+    table."""
+    for statement in _GLOSS_INDEX_STATEMENTS:
+        db.session.execute(text(statement))
+    db.session.execute(text(
+        "INSERT INTO verb_gloss_fts(verb_gloss_fts) VALUES ('rebuild')"))
+    db.session.commit()
+
+
+def init_gloss_index(app: Flask) -> None:
+    """Check at startup that the app's SQLite database has the gloss index,
+    which the upgrade-db command creates."""
+    with app.app_context():
+        if db.engine.dialect.name != 'sqlite':
+            return
+        try:
+            if not has_gloss_index():
+                app.logger.warning("Gloss index missing; run flask "
+                                   "upgrade-db to create it")
+        except SQLAlchemyError as e:
+            app.logger.warning(f"Gloss index not checked: {e}")
+
+
+def build_gloss_query(english: str) -> str:
+    """
+    Return an FTS5 query matching glosses with every word of an English
+    phrase, treating the last word as a prefix and ignoring a leading "to".
+
+    Raises:
+        ValueError: if the phrase has no words.
+    """
+    words = _WORD.findall(english.lower())
+    if words[:1] == ["to"] and len(words) > 1:
+        words = words[1:]
+    if not words:
+        raise ValueError("Missing English search terms")
+    return " ".join(f'"{word}"' for word in words) + "*"
+
+
+def search_glosses(english: str, limit: int | None = 10) -> list[str]:
+    """
+    Return up to limit infinitives in the verb catalog whose glosses match
+    an English phrase, or all of them if limit is None, from best to worst
+    match.
+
+    Raises:
+        ValueError: if the phrase has no words or the database has no gloss
+                    index.
+    """
+    try:
+        rows = db.session.execute(text(
+            "SELECT verb_gloss.infinitive FROM verb_gloss_fts "
+            "JOIN verb_gloss ON verb_gloss.id = verb_gloss_fts.rowid "
+            "WHERE verb_gloss_fts MATCH :query "
+            "AND verb_gloss.infinitive IN ("
+            "SELECT infinitive FROM regular_verb "
+            "UNION SELECT infinitive FROM irregular_verb) "
+            "ORDER BY verb_gloss_fts.rank, verb_gloss.infinitive"),
+            {'query': build_gloss_query(english)})
+
+        # A verb with several glosses ranks by its best one
+        infinitives = {}
+        for infinitive, in rows:
+            if len(infinitives) == limit:
+                break
+            infinitives.setdefault(infinitive)
+        return list(infinitives)
+    except OperationalError:
+        db.session.rollback()
+        raise ValueError("Gloss search is not available")
@@ -0,0 +1,46 @@
+from flask import current_app
+
+from backend.app.resources.verb import Verb
+from backend.app.sources import get_verb_source
+from backend.core.languages import get_engine
+from backend.core.sources import VerbSource
+
+
+def get_language_source(language: str) -> VerbSource | None:
+    """
+    Return the source of a language's bundled verb data, loading it the
+    first time the current app asks for it, or None if the language's
+    verbs are stored in the app's database.
+
+    Raises:
+        ValueError: if the language is not registered.
+    """
+    engine = get_engine(language)
+    if engine.load_source is None:
+        return None
+    sources = current_app.extensions.setdefault('language_sources', {})
+    source = sources.get(language)
+    if source is None:
+        source = sources.setdefault(language, engine.load_source())
+    return source
+
+
+def get_language_verbs(language: str, infinitives: list[str]) -> list:
+    """
+    Return Verb objects of the language's verb type for a list of
+    infinitives, without duplicates. A language without bundled verb data
+    is conjugated from the app's verb source, and Spanish verbs are shared
+    through the app's verb registry.
+
+    Raises:
+        ValueError: if the language is not registered, or if infinitives is
+                    not a list of strings or contains invalid verbs.
+    """
+    engine = get_engine(language)
+    source = get_language_source(language)
+    if source is None:
+        if issubclass(Verb, engine.verb_type) and \
+                Verb.language == engine.code:
+            return Verb.from_infinitives(infinitives)
+        source = get_verb_source()
+    return engine.verb_type.from_source(infinitives, source)
@@ -4,6 +4,9 @@ from .extensions import db
 class IrregularVerb(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     infinitive = db.Column(db.String, nullable=False)
+    # Rule pattern the stored conjugations are diffs against, or None if
+    # they are complete rows
+    pattern = db.Column(db.String, nullable=True)
     conjugations = db.relationship('Conjugation', backref='irregular_verb',
                                    lazy=True)
 
@@ -19,6 +22,16 @@ class RegularVerb(db.Model):
         return f'<RegularVerb {self.infinitive}>'
 
 
+class VerbGloss(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    infinitive = db.Column(db.String, nullable=False, index=True)
+    # English meaning of the verb, such as "to bring; to fetch"
+    gloss = db.Column(db.String, nullable=False)
+
+    def __repr__(self):
+        return f'<VerbGloss {self.infinitive}>'
+
+
 class Tense(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String, nullable=False)
@@ -0,0 +1,17 @@
+from flask import Flask, current_app, has_app_context
+
+from backend.core.artifact import ArtifactSource
+
+
+class ParadigmArtifact(ArtifactSource):
+    def init_app(self, app: Flask) -> None:
+        """Register the artifact on the app."""
+        app.extensions['paradigm_artifact'] = self
+
+
+def get_paradigm_artifact() -> ParadigmArtifact | None:
+    """Return the current app's conjugation artifact, or None if there is
+    no app context or no artifact is configured."""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('paradigm_artifact')
@@ -0,0 +1,77 @@
+from flask import Flask, current_app, has_app_context
+from sqlalchemy.exc import SQLAlchemyError
+
+from .extensions import db
+from .models import IrregularVerb, RegularVerb, Tense, Conjugation
+from backend.core.sources import PRONOUN_ATTRIBUTES, MemorySource
+
+# App extensions built from the verb tables, discarded on refresh
+DERIVED_EXTENSIONS = ('verb_registry', 'verb_source', 'unverified_verbs',
+                      'language_sources', 'verb_index', 'form_index',
+                      'form_search_index', 'similarity_index',
+                      'verb_completer', 'quiz_cache')
+
+
+class ParadigmStore(MemorySource):
+    def __init__(self, app: Flask = None) -> None:
+        """
+        Initialize an in-memory store of verbs, tenses, and irregular
+        conjugations, loading it for the given app if one is provided.
+        """
+        super().__init__()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Register the store on the app and load it, unless the app sets
+        PARADIGM_STORE_ENABLED to False.
+        """
+        app.extensions['paradigm_store'] = self
+        if not app.config.get('PARADIGM_STORE_ENABLED', True):
+            return
+        with app.app_context():
+            try:
+                self.load()
+            except SQLAlchemyError as e:
+                # Leave the store unloaded so lookups fall back to the database
+                app.logger.warning(f"Paradigm store not loaded: {e}")
+
+    def load(self) -> None:
+        """Load every verb, tense, and irregular conjugation from the
+        database."""
+        regular_rows = db.session.query(
+            RegularVerb.id, RegularVerb.infinitive).order_by(RegularVerb.id)
+        irregular_rows = db.session.query(
+            IrregularVerb.id, IrregularVerb.infinitive,
+            IrregularVerb.pattern).order_by(IrregularVerb.id)
+        tense_rows = db.session.query(Tense.id, Tense.name).order_by(Tense.id)
+        conjugation_rows = db.session.query(*(
+            getattr(Conjugation, attribute) for attribute in
+            ('verb_id', 'tense_id') + PRONOUN_ATTRIBUTES +
+            ('present_participle', 'past_participle'))).order_by(
+            Conjugation.id)
+        self.load_rows(regular_rows.all(), irregular_rows.all(),
+                       tense_rows.all(), conjugation_rows.all())
+
+    def refresh(self) -> None:
+        """Reload the store after the verb tables have changed, discarding
+        the app's shared and unverified Verb objects and the indexes built
+        from the verb tables. A store the app disabled with
+        PARADIGM_STORE_ENABLED stays unloaded, but the indexes are still
+        discarded."""
+        if current_app.config.get('PARADIGM_STORE_ENABLED', True):
+            self.load()
+        for key in DERIVED_EXTENSIONS:
+            current_app.extensions.pop(key, None)
+
+
+def get_paradigm_store() -> ParadigmStore | None:
+    """Return the current app's loaded paradigm store, or None if there is
+    no app context or the store is disabled or not loaded."""
+    if not has_app_context():
+        return None
+    store = current_app.extensions.get('paradigm_store')
+    if store is None or not store.loaded:
+        return None
+    return store
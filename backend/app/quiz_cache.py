@@ -0,0 +1,89 @@
+import hashlib
+import json
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable
+
+from flask import Response, current_app, request
+
+
+class QuizCache:
+    """A bounded cache of seeded quiz responses, as request keys to (body,
+    ETag) pairs, evicting the least recently used entry when full. It is
+    shared by the app's request threads, so every access holds a lock."""
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> tuple[str, str] | None:
+        """Return the entry of a request key, or None if it is not
+        cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def add(self, key: str, entry: tuple[str, str]) -> tuple[str, str]:
+        """Cache the entry of a request key unless another request cached
+        it first, and return the cached entry."""
+        with self._lock:
+            entry = self._entries.setdefault(key, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._size:
+                self._entries.popitem(last=False)
+            return entry
+
+
+def get_quiz_cache() -> QuizCache:
+    """Return the current app's cache of seeded quiz responses, holding up
+    to QUIZ_CACHE_SIZE entries."""
+    cache = current_app.extensions.get('quiz_cache')
+    if cache is None:
+        cache = current_app.extensions.setdefault('quiz_cache', QuizCache(
+            current_app.config.get('QUIZ_CACHE_SIZE', 1024)))
+    return cache
+
+
+def get_request_key(params: dict) -> str:
+    """Return the key of a normalized quiz request, as a hash of its
+    parameters."""
+    encoded = json.dumps(params, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def cached_quiz_response(params: dict, build: Callable[[], list],
+                         status: int = 200) -> Response:
+    """
+    Return the response to a seeded quiz request, building its quiz items
+    the first time the normalized request is seen and serving it from the
+    current app's quiz cache afterwards. The response carries an ETag, and
+    a GET or HEAD request whose If-None-Match matches it gets an empty 304
+    response.
+
+    Raises:
+        ValueError: if the quiz items cannot be built.
+    """
+    cache = get_quiz_cache()
+    key = get_request_key(params)
+    entry = cache.get(key)
+    if entry is None:
+        body = current_app.json.dumps(build())
+        etag = hashlib.sha256(body.encode('utf-8')).hexdigest()[:32]
+        entry = cache.add(key, (body, etag))
+
+    body, etag = entry
+    # Only a safe request may be answered without its body
+    if request.method in ('GET', 'HEAD') and \
+            request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(
+            body, status=status, mimetype='application/json')
+    response.set_etag(etag)
+    return response
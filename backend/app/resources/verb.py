@@ -1,134 +1,95 @@
-from backend.app.models import IrregularVerb, RegularVerb, Tense, Conjugation
-from backend.app.utils import conjugate
-from backend.app.utils import PRONOUNS, is_valid_tense, is_valid_pronoun
+from flask import current_app
 
+from backend.app.sources import get_verb_source
+from backend.core.verb import Verb as CoreVerb, check_verbs_found
+
+
+class Verb(CoreVerb):
+    __slots__ = ()
 
-class Verb:
     def __init__(self, infinitive: str) -> None:
-        """Initialize a Verb object."""
-        self.infinitive = infinitive
+        """
+        Initialize a Verb object from the current app's verb source. If the
+        app sets OPEN_VOCABULARY_ENABLED, a well-formed infinitive missing
+        from the source becomes an unverified regular verb.
 
-    @property
-    def infinitive(self) -> str:
-        """Get the infinitive form of the verb."""
-        return self._infinitive
+        Raises:
+            ValueError: if the infinitive is not a valid verb.
+        """
+        super().__init__(infinitive, get_verb_source(),
+                         _open_vocabulary_enabled())
 
-    @infinitive.setter
-    def infinitive(self, infinitive: str) -> None:
+    @classmethod
+    def get(cls, infinitive: str) -> 'Verb':
         """
-        Set the infinitive form of the verb.
+        Return the shared Verb object for an infinitive, creating it the
+        first time the current app asks for it.
 
         Raises:
             ValueError: if the infinitive is not a valid verb.
         """
-        regular_verb = RegularVerb.query.filter_by(
-            infinitive=infinitive.lower()).first()
-        irregular_verb = IrregularVerb.query.filter_by(
-            infinitive=infinitive.lower()).first()
-        if not regular_verb and not irregular_verb:
+        if not isinstance(infinitive, str):
             raise ValueError(f"Invalid verb: {infinitive}")
-        self._infinitive = infinitive
-        self._is_regular = bool(regular_verb)
-
-    @property
-    def stem(self) -> str:
-        """Get the stem of a verb."""
-        return self._infinitive[:-2]
-
-    @property
-    def ending(self) -> str:
-        """Get the ending of a verb."""
-        endings = ["ar", "er", "ir"]
-        if self._infinitive[-2:] in endings:
-            return self._infinitive[-2:]
-
-    @property
-    def is_regular(self) -> bool:
-        """Return True if the verb is regular, otherwise return False."""
-        return self._is_regular
-
-    def conjugate(self, tense: str, pronoun: str) -> str:
+        registry = current_app.extensions.setdefault('verb_registry', {})
+        key = infinitive.lower()
+        verb = registry.get(key) or _get_unverified_cache().get(key)
+        if verb is None:
+            verb = cls(key)
+            if not verb.is_verified:
+                return _cache_unverified(verb)
+            verb = registry.setdefault(key, verb)
+        return verb
+
+    @classmethod
+    def from_infinitives(cls, infinitives: list[str]) -> list['Verb']:
         """
-        Conjugate the verb with a given tense and pronoun.
+        Return the shared Verb objects for a list of infinitives, without
+        duplicates, resolving any new verbs with one query per verb table.
 
         Raises:
-            ValueError: if the tense or pronoun is invalid.
+            ValueError: if infinitives is not a list of strings or contains
+                        invalid verbs, listing every invalid verb.
         """
-        # Validate tense and pronoun
-        if not is_valid_tense(tense):
-            raise ValueError("Invalid tense")
-        if not is_valid_pronoun(pronoun):
-            raise ValueError("Invalid pronoun")
-
-        # Return error if tense is imperative and pronoun is "yo"
-        if "imperative" in tense and pronoun == "yo":
-            raise ValueError("No first person conjugation for imperative tense")
-
-        # Get pronoun index
-        pronoun_index = PRONOUNS.index(pronoun)
-
-        # Account for compound tenses
-        compound_tenses = ["present_progressive", "past_progressive",
-                           "present_perfect", "pluperfect", "future_perfect",
-                           "present_perfect_subjunctive",
-                           "pluperfect_subjunctive_ra",
-                           "pluperfect_subjunctive_se"]
-
-        # Get tense from database
-        tense_obj = Tense.query.filter_by(name=tense).first()
-        if not tense_obj and tense not in compound_tenses:
-            raise ValueError("Invalid tense")
-
-        # Get verb from database if irregular
-        verb_db_entry = IrregularVerb.query.filter_by(
-            infinitive=self._infinitive.lower()).first()
-
-        if tense in compound_tenses:
-            # Handle compound tenses
-            func_name = f'conjugate_{tense}'
-            if hasattr(conjugate, func_name) and callable(
-                    conjugation_func := getattr(conjugate, func_name)):
-                if verb_db_entry:
-                    # Try to get participles for irregular verbs from database
-                    participles = Conjugation.query.filter_by(
-                        verb_id=verb_db_entry.id,
-                        tense_id=Tense.query.filter_by(
-                            name='participles').first().id).first()
-                    if participles:
-                        # Use the participle from the database if available
-                        participle = (
-                            participles.present_participle if
-                            "progressive" in tense
-                            else participles.past_participle)
-                        return conjugation_func(self, pronoun, participle)
-
-                # Fallback to regular verb conjugation if participles not found
-                return conjugation_func(self, pronoun)
-            else:
-                raise ValueError(f"Conjugation function not found for {tense}")
-
-        else:
-            # Handle non-compound tenses
-            if verb_db_entry:
-                # Try to find conjugation for irregular verb
-                conjugation = Conjugation.query.filter_by(
-                    verb_id=verb_db_entry.id, tense_id=tense_obj.id).first()
-                if conjugation:
-                    # Map pronoun index to corresponding attribute name
-                    pronoun_attributes = ['first_s', 'second_s', 'third_s',
-                                          'first_p', 'second_p', 'third_p']
-                    if pronoun_index < len(pronoun_attributes):
-                        attribute_name = pronoun_attributes[pronoun_index]
-                        return getattr(conjugation, attribute_name)
-
-            # Fallback to regular verb conjugation if not found in database
-            func_name = f'conjugate_{tense}'
-            if hasattr(conjugate, func_name) and callable(
-                    conjugation_func := getattr(conjugate, func_name)):
-                return conjugation_func(self, pronoun)
-            else:
-                raise ValueError(f"Conjugation function not found for {tense}")
-
-    def __str__(self) -> str:
-        """Get the string representation of the Verb object."""
-        return f"Verb: {self.infinitive}"
+        if not isinstance(infinitives, list) or not all(
+                isinstance(infinitive, str) for infinitive in infinitives):
+            raise ValueError("verbs must be a list of strings")
+
+        keys = list(dict.fromkeys(
+            infinitive.lower() for infinitive in infinitives))
+        registry = current_app.extensions.setdefault('verb_registry', {})
+        unverified = _get_unverified_cache()
+        verbs = {key: registry.get(key) or unverified.get(key)
+                 for key in keys}
+        missing = [key for key, verb in verbs.items() if verb is None]
+        source = get_verb_source()
+        found = cls.resolve(missing, source, _open_vocabulary_enabled())
+        check_verbs_found(missing, found)
+
+        for key in missing:
+            verb = cls._create(key, source, *found[key])
+            verbs[key] = registry.setdefault(key, verb) \
+                if verb.is_verified else _cache_unverified(verb)
+        return list(verbs.values())
+
+
+def _open_vocabulary_enabled() -> bool:
+    """Return True if the current app conjugates unknown verbs with the
+    regular rules."""
+    return current_app.config.get('OPEN_VOCABULARY_ENABLED', False)
+
+
+def _get_unverified_cache() -> dict:
+    """Return the current app's cache of unverified Verb objects."""
+    return current_app.extensions.setdefault('unverified_verbs', {})
+
+
+def _cache_unverified(verb: Verb) -> Verb:
+    """Add an unverified Verb object to the current app's cache, evicting
+    the oldest entry once OPEN_VOCABULARY_CACHE_SIZE is reached, and return
+    the cached object."""
+    cache = _get_unverified_cache()
+    size = current_app.config.get('OPEN_VOCABULARY_CACHE_SIZE', 10000)
+    key = verb.infinitive.lower()
+    if key not in cache and len(cache) >= size:
+        cache.pop(next(iter(cache)), None)
+    return cache.setdefault(key, verb)
@@ -1,26 +1,31 @@
 import json
 import random
-from typing import Tuple
+from typing import Iterable, Optional, Tuple
 
 from flask import Blueprint, jsonify, request
 from flask_sqlalchemy import SQLAlchemy
 
+from .form_index import get_form_index, get_form_search_index
+from .glosses import search_glosses
+from .languages import get_language_verbs
+from .quiz_cache import cached_quiz_response
 from .models import IrregularVerb, RegularVerb
-from backend.app.resources.quiz import Quiz
+from .verb_index import (get_similarity_index, get_verb_completer,
+                         get_verb_index, get_verb_popularity, record_verb_use)
+from backend.core.quiz import Quiz
+from backend.core.quiz_item import QuizItem
 from backend.app.resources.verb import Verb
+from backend.core.utils import TENSE_DESCRIPTORS
 
 
-TENSES = ["present", "preterite", "imperfect", "conditional", "future",
-          "present_subjunctive", "imperfect_subjunctive_ra",
-          "imperfect_subjunctive_se", "present_progressive",
-          "past_progressive", "present_perfect", "pluperfect",
-          "future_perfect", "present_perfect_subjunctive",
-          "pluperfect_subjunctive_ra", "pluperfect_subjunctive_se",
-          "affirmative_imperative", "negative_imperative"]
+TENSES = [tense.name for tense in TENSE_DESCRIPTORS]
 
 PRONOUNS = ["yo", "tú", "él/ella/Ud.", "nosotros", "vosotros",
             "ellos/ellas/Uds."]
 
+# Most quizzes one /generate_quizzes request may ask for
+MAX_QUIZZES = 300
+
 main = Blueprint('main', __name__)
 
 db = SQLAlchemy()
@@ -30,6 +35,62 @@ def error(err_string: str, err_code: int) -> Tuple[str, int]:
     return json.dumps({"Error": err_string}), err_code
 
 
+def get_quiz_verbs(data: dict,
+                   rng: Optional[random.Random] = None) -> list:
+    """Return the verbs of a quiz request, picking up to 10 of the verbs
+    matching its filter with rng, or the random module, if it has no verb
+    list."""
+    verbs = data.get('verbs')
+    if verbs is None:
+        # The verb index only covers the app's Spanish verbs
+        if data.get('language', 'es') != 'es':
+            raise ValueError("Verb filters are only available for Spanish")
+        matches = get_verb_index().search(data['filter'])
+        if not matches:
+            raise ValueError("No verbs match the filter")
+        verbs = (rng or random).sample(matches, k=min(len(matches), 10))
+    return verbs
+
+
+def is_seed(seed) -> bool:
+    """Return True if a request value is a valid quiz seed; otherwise,
+    return False."""
+    return isinstance(seed, int) and not isinstance(seed, bool)
+
+
+def normalize_quiz_request(data: dict) -> dict:
+    """Return the parameters of a quiz request that determine its quiz,
+    with its verb, tense, and pronoun lists sorted and without duplicates,
+    so requests differing only in their order share one quiz."""
+    def normalize(values, lower: bool = False):
+        if not isinstance(values, list) or not all(
+                isinstance(value, str) for value in values):
+            return values
+        return sorted({value.lower() if lower else value
+                       for value in values})
+
+    params = {key: data.get(key) for key in
+              ['filter', 'num_items', 'seed']}
+    params.update(verbs=normalize(data.get('verbs'), lower=True),
+                  tenses=normalize(data['tenses']),
+                  pronouns=normalize(data['pronouns']),
+                  language=data.get('language', 'es'))
+    return params
+
+
+def serialize_quiz_items(items: Iterable[QuizItem]) -> list[dict]:
+    """Serialize quiz items for a JSON response."""
+    return [{
+        'question': {
+            'verb': item.question_verb.infinitive,
+            'tense': item.question_tense,
+            'pronoun': item.question_pronoun,
+            'verified': item.question_verb.is_verified
+        },
+        'answer': item.answer
+    } for item in items]
+
+
 @main.route("/")
 def index():
     return "ConjugaCoach API"
@@ -39,29 +100,130 @@ def index():
 def generate_quiz():
     data = request.json
 
-    # Validate input data
-    if data is None or not all(key in data for key in ["verbs", "tenses",
-                                                       "pronouns"]):
+    # Validate input data, which may give a verb filter in place of verbs
+    if data is None or not all(key in data for key in ["tenses",
+                                                       "pronouns"]) or \
+            not any(key in data for key in ["verbs", "filter"]):
+        return error("Missing verbs, tenses, or pronouns", 400)
+
+    seed = data.get('seed')
+    if seed is not None and not is_seed(seed):
+        return error("seed must be an int", 400)
+
+    def build_quiz_items(quiz_data: dict) -> list:
+        # Turn verb strings into verb objects of the requested language,
+        # whose engine is loaded the first time it is requested
+        rng = None if seed is None else random.Random(seed)
+        language = quiz_data.get('language', 'es')
+        verb_objects = get_language_verbs(language,
+                                          get_quiz_verbs(quiz_data, rng))
+
+        quiz = Quiz(verb_list=verb_objects,
+                    tense_list=quiz_data['tenses'],
+                    pronoun_list=quiz_data['pronouns'],
+                    num_items=quiz_data.get('num_items'),
+                    language=language,
+                    rng=rng)
+        return serialize_quiz_items(quiz)
+
+    try:
+        if seed is None:
+            return jsonify(build_quiz_items(data)), 201
+
+        # Seeded quizzes are reproducible, so their responses are cached
+        params = normalize_quiz_request(data)
+        return cached_quiz_response(
+            dict(params, route='generate_quiz'),
+            lambda: build_quiz_items(params), 201)
+
+    except ValueError as e:
+        return error(str(e), 400)
+
+
+@main.route('/generate_quizzes', methods=['POST'])
+def generate_quizzes():
+    data = request.json
+
+    # Validate input data, which may give a verb filter in place of verbs
+    if data is None or not all(key in data for key in ["tenses",
+                                                       "pronouns"]) or \
+            not any(key in data for key in ["verbs", "filter"]):
+        return error("Missing verbs, tenses, or pronouns", 400)
+
+    count, seeds = data.get('count', 1), data.get('seeds')
+    if not isinstance(count, int) or isinstance(count, bool) or \
+            not 1 <= count <= MAX_QUIZZES:
+        return error(f"count must be an int between 1 and {MAX_QUIZZES}",
+                     400)
+    if seeds is not None and (
+            not isinstance(seeds, list) or len(seeds) != count or
+            not all(is_seed(seed) for seed in seeds)):
+        return error("seeds must be a list of count ints", 400)
+    rngs = [None] * count if seeds is None else \
+        [random.Random(seed) for seed in seeds]
+
+    try:
+        # Resolve the verbs once for every quiz, picking filtered verbs with
+        # the first quiz's rng as /generate_quiz does, so seeded batches
+        # are reproducible
+        language = data.get('language', 'es')
+        verb_objects = get_language_verbs(language,
+                                          get_quiz_verbs(data, rngs[0]))
+
+        quiz = Quiz(verb_list=verb_objects,
+                    tense_list=data['tenses'],
+                    pronoun_list=data['pronouns'],
+                    num_items=data.get('num_items'),
+                    language=language,
+                    rng=rngs[0])
+
+        # Draw each further quiz from the same quiz, which conjugates each
+        # item at most once across every quiz
+        quizzes = [quiz.quiz_bank] + [quiz.resample(rng)
+                                      for rng in rngs[1:]]
+        return jsonify([serialize_quiz_items(items)
+                        for items in quizzes]), 201
+
+    except ValueError as e:
+        return error(str(e), 400)
+
+
+@main.route('/generate_form_quiz', methods=['POST'])
+def generate_form_quiz():
+    data = request.json
+
+    # Validate input data, which may give a verb filter in place of verbs
+    if data is None or not all(key in data for key in ["tenses",
+                                                       "pronouns"]) or \
+            not any(key in data for key in ["verbs", "filter"]):
         return error("Missing verbs, tenses, or pronouns", 400)
 
     try:
         # Turn verb strings into verb objects
-        verb_objects = [Verb(verb) for verb in data['verbs']]
+        verb_objects = Verb.from_infinitives(get_quiz_verbs(data))
 
         quiz = Quiz(verb_list=verb_objects,
                     tense_list=data['tenses'],
                     pronoun_list=data['pronouns'],
                     num_items=data.get('num_items'))
 
-        # Serialize quiz items for JSON response
-        quiz_items = [{
-            'question': {
-                'verb': item.question_verb.infinitive,
-                'tense': item.question_tense,
-                'pronoun': item.question_pronoun
-            },
-            'answer': item.answer
-        } for item in quiz]
+        # Show each form and accept every tense and pronoun of the verb
+        # that produces it
+        form_index = get_form_index()
+        quiz_items = []
+        for item in quiz:
+            infinitive = item.question_verb.infinitive.lower()
+            cells = form_index.lookup(item.answer, infinitive) or \
+                [(infinitive, item.question_tense, item.question_pronoun)]
+            quiz_items.append({
+                'question': {
+                    'form': item.answer,
+                    'verb': item.question_verb.infinitive,
+                    'verified': item.question_verb.is_verified
+                },
+                'answer': [{'tense': tense, 'pronoun': pronoun}
+                           for _, tense, pronoun in cells]
+            })
 
         return jsonify(quiz_items), 201
 
@@ -73,29 +235,48 @@ def generate_quiz():
 def generate_random_quiz():
     # Get number of items from query parameter, default to 20
     num_items = request.args.get('num_items', default=20, type=int)
-
-    try:
-        # Fetch all verbs from the database
-        all_verbs = [verb.infinitive for verb in RegularVerb.query.all()] + \
-                    [verb.infinitive for verb in IrregularVerb.query.all()]
-        selected_verbs = random.sample(all_verbs, k=min(len(all_verbs), 10))
+    seed = request.args.get('seed')
+    if seed is not None:
+        try:
+            seed = int(seed)
+        except ValueError:
+            return jsonify({'error': "seed must be an int"}), 400
+
+    def build_quiz_items() -> list:
+        rng = None if seed is None else random.Random(seed)
+
+        # Fetch all verbs from the database, in a fixed order so that a
+        # seed picks the same verbs
+        all_verbs = sorted(
+            [verb.infinitive for verb in RegularVerb.query.all()] +
+            [verb.infinitive for verb in IrregularVerb.query.all()])
+        selected_verbs = (rng or random).sample(
+            all_verbs, k=min(len(all_verbs), 10))
 
         # Turn verb strings into verb objects
-        verb_objects = [Verb(verb) for verb in selected_verbs]
+        verb_objects = Verb.from_infinitives(selected_verbs)
 
         # Create Quiz object and generate quiz items
         quiz = Quiz(verb_list=verb_objects,
                     tense_list=TENSES,
                     pronoun_list=PRONOUNS,
-                    num_items=num_items)
+                    num_items=num_items,
+                    rng=rng)
 
         # Serialize quiz items for JSON response
-        quiz_items = [{'question': {'verb': item.question_verb.infinitive,
-                                    'tense': item.question_tense,
-                                    'pronoun': item.question_pronoun},
-                       'answer': item.answer} for item in quiz]
+        return [{'question': {'verb': item.question_verb.infinitive,
+                              'tense': item.question_tense,
+                              'pronoun': item.question_pronoun},
+                 'answer': item.answer} for item in quiz]
+
+    try:
+        if seed is None:
+            return jsonify(build_quiz_items())
 
-        return jsonify(quiz_items)
+        # Seeded quizzes are reproducible, so their responses are cached
+        return cached_quiz_response(
+            {'route': 'generate_random_quiz', 'num_items': num_items,
+             'seed': seed}, build_quiz_items)
 
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -105,7 +286,7 @@ def generate_random_quiz():
 def get_conjugation_table(verb: str):
     try:
         # Turn verb string into verb object
-        verb_object = Verb(verb)
+        verb_object = Verb.get(verb)
 
         # Generate conjugation table
         conjugation_table = {}
@@ -118,7 +299,117 @@ def get_conjugation_table(verb: str):
                 except ValueError:
                     conjugation_table[tense][pronoun] = None
 
-        return jsonify(conjugation_table)
+        # Count the request towards the verb's popularity
+        record_verb_use(verb_object)
+
+        # Flag tables of verbs conjugated by the rules alone
+        response = jsonify(conjugation_table)
+        response.headers['X-Verb-Verified'] = \
+            'true' if verb_object.is_verified else 'false'
+        return response
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+
+@main.route('/analyze/<form>', methods=['GET'])
+def analyze_form(form: str):
+    # Look up every verb, tense, and pronoun that produces the form
+    cells = get_form_index().lookup(form)
+    return jsonify([{'verb': infinitive, 'tense': tense, 'pronoun': pronoun}
+                    for infinitive, tense, pronoun in cells])
+
+
+@main.route('/forms/search', methods=['GET'])
+def search_forms():
+    # Get the pattern and page from query parameters, 50 forms per page by
+    # default
+    pattern = request.args.get('pattern')
+    page = request.args.get('page', default=1, type=int)
+    per_page = request.args.get('per_page', default=50, type=int)
+    if not pattern:
+        return jsonify({'error': "Missing pattern"}), 400
+    if page < 1 or not 1 <= per_page <= 200:
+        return jsonify({'error': "page must be at least 1 and per_page "
+                                 "between 1 and 200"}), 400
+
+    try:
+        forms = get_form_search_index().search(pattern)
+
+        # Return the page's forms with the cells that produce them
+        form_index = get_form_index()
+        start = (page - 1) * per_page
+        return jsonify({
+            'total': len(forms),
+            'page': page,
+            'per_page': per_page,
+            'forms': [{
+                'form': form,
+                'cells': [{'verb': infinitive, 'tense': tense,
+                           'pronoun': pronoun}
+                          for infinitive, tense, pronoun in
+                          form_index.lookup(form)]
+            } for form in forms[start:start + per_page]]
+        })
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+
+@main.route('/verbs/search', methods=['GET'])
+def search_verbs():
+    # Get the filter expression and English phrase from query parameters
+    expression = request.args.get('q')
+    english = request.args.get('en')
+    limit = request.args.get('limit', default=10, type=int)
+    if not expression and not english:
+        return jsonify({'error': "Missing filter or English phrase"}), 400
+    if not 1 <= limit <= 50:
+        return jsonify({'error': "limit must be between 1 and 50"}), 400
+
+    try:
+        if not english:
+            return jsonify(get_verb_index().search(expression)[:limit])
+
+        # Rank verbs by their English gloss, keeping those matching the
+        # filter if there is one
+        verbs = search_glosses(english, limit if not expression else None)
+        if expression:
+            matches = set(get_verb_index().search(expression))
+            verbs = [verb for verb in verbs if verb in matches][:limit]
+        return jsonify(verbs)
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+
+@main.route('/verbs/complete', methods=['GET'])
+def complete_verbs():
+    # Get prefix and number of verbs from query parameters, default to 10
+    prefix = request.args.get('prefix', default='')
+    limit = request.args.get('limit', default=10, type=int)
+    if not 1 <= limit <= 50:
+        return jsonify({'error': "limit must be between 1 and 50"}), 400
+
+    try:
+        return jsonify(get_verb_completer().complete(
+            prefix, limit, get_verb_popularity()))
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+
+@main.route('/verbs/<verb>/similar', methods=['GET'])
+def get_similar_verbs(verb: str):
+    # Get number of verbs from query parameter, default to 10
+    limit = request.args.get('limit', default=10, type=int)
+    if not 1 <= limit <= 50:
+        return jsonify({'error': "limit must be between 1 and 50"}), 400
+
+    try:
+        similar = get_similarity_index().similar(verb.lower(), limit)
+        return jsonify([{'verb': infinitive, 'similarity': similarity}
+                        for infinitive, similarity in similar])
 
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
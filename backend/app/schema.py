@@ -0,0 +1,40 @@
+from flask import Flask
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from .extensions import db
+
+
+def has_pattern_column() -> bool:
+    """Return True if the irregular verb table has the pattern column or
+    does not exist yet, in which case it is created with the column."""
+    inspector = inspect(db.engine)
+    if not inspector.has_table('irregular_verb'):
+        return True
+    return 'pattern' in {column['name'] for column in
+                         inspector.get_columns('irregular_verb')}
+
+
+def add_pattern_column() -> bool:
+    """Add the pattern column to the irregular verb table if it is missing,
+    and return True if it was added."""
+    if has_pattern_column():
+        return False
+    db.session.execute(text(
+        "ALTER TABLE irregular_verb ADD COLUMN pattern VARCHAR"))
+    db.session.commit()
+    return True
+
+
+def init_schema(app: Flask) -> None:
+    """Add the columns a database created by an earlier version lacks at
+    startup, so the app can read it. Missing tables and indexes are left
+    to the upgrade-db command."""
+    with app.app_context():
+        try:
+            if add_pattern_column():
+                app.logger.warning("Added column irregular_verb.pattern")
+        except SQLAlchemyError as e:
+            # Another worker may have added the column first
+            db.session.rollback()
+            app.logger.warning(f"Schema not checked: {e}")
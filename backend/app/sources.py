@@ -0,0 +1,123 @@
+from typing import Iterable
+
+from flask import current_app, g
+
+from .extensions import db
+from .models import IrregularVerb, RegularVerb, Tense, Conjugation
+from .paradigm_artifact import get_paradigm_artifact
+from .paradigm_store import get_paradigm_store
+from backend.core.sources import PRONOUN_ATTRIBUTES, VerbSource
+from backend.core.utils.patterns import rebuild_paradigm
+
+
+class DatabaseSource(VerbSource):
+    def __init__(self) -> None:
+        """
+        Initialize a source that queries the app's database directly, for
+        apps without a loaded paradigm store or artifact. Each irregular
+        verb's stored forms are loaded in one query and cached for the
+        current app context only, so changes to the verb tables are seen
+        by the next request.
+        """
+
+    def find_verb(self, infinitive: str) -> tuple[int, bool] | None:
+        """Return the database id of a verb and whether it is regular, or
+        None if the verb is in neither verb table."""
+        regular_verb = RegularVerb.query.filter_by(
+            infinitive=infinitive).first()
+        irregular_verb = IrregularVerb.query.filter_by(
+            infinitive=infinitive).first()
+        if not regular_verb and not irregular_verb:
+            return None
+        return (regular_verb or irregular_verb).id, bool(regular_verb)
+
+    def find_verbs(self,
+                   infinitives: list[str]) -> dict[str, tuple[int, bool]]:
+        """Return the database id and regular flag of each valid verb in a
+        list of lowercase infinitives, with one query per verb table."""
+        irregular_verbs = IrregularVerb.query.filter(
+            IrregularVerb.infinitive.in_(infinitives)).order_by(
+            IrregularVerb.id.desc()).all()
+        regular_verbs = RegularVerb.query.filter(
+            RegularVerb.infinitive.in_(infinitives)).order_by(
+            RegularVerb.id.desc()).all()
+
+        # Descending ids let each verb's first row win, and regular rows are
+        # applied last so they win over irregular ones
+        found = {verb.infinitive: (verb.id, False) for verb in irregular_verbs}
+        found.update((verb.infinitive, (verb.id, True))
+                     for verb in regular_verbs)
+        return found
+
+    def iter_verbs(self) -> Iterable[tuple[str, bool]]:
+        """Return the infinitive and regular flag of every verb in the
+        verb tables, with regular verbs winning over irregular ones."""
+        regular_verbs = {infinitive for infinitive, in db.session.query(
+            RegularVerb.infinitive)}
+        yield from ((infinitive, True) for infinitive in regular_verbs)
+        for infinitive, in db.session.query(
+                IrregularVerb.infinitive).distinct():
+            if infinitive not in regular_verbs:
+                yield infinitive, False
+
+    def get_conjugation(self, infinitive: str, tense: str) -> tuple | None:
+        """Return the six stored forms of an irregular verb in a tense, or
+        None if the verb has no stored forms for it."""
+        return self._load_paradigm(infinitive)[0].get(tense)
+
+    def get_participles(self, infinitive: str) -> tuple | None:
+        """Return the stored (present, past) participles of an irregular
+        verb, or None if the verb has none."""
+        return self._load_paradigm(infinitive)[1]
+
+    def _load_paradigm(self, infinitive: str) -> tuple[dict, tuple | None]:
+        """
+        Return the stored irregular forms of a verb as a dict of six forms
+        per tense and its (present, past) participles, loading every tense
+        in one query the first time and rebuilding forms stored as diffs.
+
+        Raises:
+            ValueError: if the verb has an invalid pattern.
+        """
+        paradigms = g.setdefault('verb_paradigms', {})
+        paradigm = paradigms.get(infinitive)
+        if paradigm is not None:
+            return paradigm
+
+        rows = db.session.query(
+            IrregularVerb.id, IrregularVerb.pattern, Conjugation,
+            Tense.name).outerjoin(
+            Conjugation, Conjugation.verb_id == IrregularVerb.id).outerjoin(
+            Tense, Conjugation.tense_id == Tense.id).filter(
+            IrregularVerb.infinitive == infinitive).order_by(
+            IrregularVerb.id, Conjugation.id).all()
+
+        conjugations, participles = {}, None
+        for verb_id, _, conjugation, tense in rows:
+            # Only use the forms of the first matching irregular verb
+            if verb_id != rows[0][0]:
+                break
+            if conjugation is None or tense is None:
+                continue
+            if tense == 'participles':
+                if participles is None:
+                    participles = (conjugation.present_participle,
+                                   conjugation.past_participle)
+            else:
+                conjugations.setdefault(tense, tuple(
+                    getattr(conjugation, attribute) for attribute in
+                    PRONOUN_ATTRIBUTES))
+
+        paradigm = ({}, None) if not rows else rebuild_paradigm(
+            infinitive, rows[0][1], conjugations, participles)
+        return paradigms.setdefault(infinitive, paradigm)
+
+
+def get_verb_source() -> VerbSource:
+    """Return the source the current app's verbs come from: its artifact,
+    its loaded paradigm store, or the database."""
+    source = get_paradigm_artifact() or get_paradigm_store()
+    if source is None:
+        source = current_app.extensions.setdefault('verb_source',
+                                                   DatabaseSource())
+    return source
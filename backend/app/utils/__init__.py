@@ -1,7 +0,0 @@
-from .utils import (
-    PRONOUNS, is_valid_tense, is_valid_pronoun, get_present_participle,
-    get_past_participle
-)
-
-__all__ = ['PRONOUNS', 'is_valid_tense', 'is_valid_pronoun',
-           'get_present_participle', 'get_past_participle']
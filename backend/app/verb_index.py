@@ -0,0 +1,78 @@
+from collections import Counter
+
+from flask import Flask, current_app
+from sqlalchemy.exc import SQLAlchemyError
+
+from .sources import get_verb_source
+from backend.core.completion import VerbCompleter
+from backend.core.similarity import SimilarityIndex
+from backend.core.verb import Verb
+from backend.core.verb_index import VerbIndex
+
+
+def get_verb_index() -> VerbIndex:
+    """Return the current app's verb index, building it from the app's verb
+    source the first time it is needed."""
+    index = current_app.extensions.get('verb_index')
+    if index is None:
+        index = current_app.extensions.setdefault(
+            'verb_index', VerbIndex.from_source(get_verb_source()))
+    return index
+
+
+def init_similarity_index(app: Flask) -> None:
+    """Build the app's similarity index at startup if the app sets
+    SIMILARITY_INDEX_PRELOAD. Otherwise it is built by the first request
+    that needs it, which then waits for the build."""
+    if not app.config.get('SIMILARITY_INDEX_PRELOAD', False):
+        return
+    with app.app_context():
+        try:
+            get_similarity_index()
+        except SQLAlchemyError as e:
+            # Leave the index unbuilt so it is built on first use
+            app.logger.warning(f"Similarity index not built: {e}")
+
+
+def get_similarity_index() -> SimilarityIndex:
+    """Return the current app's paradigm similarity index, building it from
+    the app's verb source the first time it is needed."""
+    index = current_app.extensions.get('similarity_index')
+    if index is None:
+        index = current_app.extensions.setdefault(
+            'similarity_index', SimilarityIndex.from_source(get_verb_source()))
+    return index
+
+
+def init_verb_completer(app: Flask) -> None:
+    """Build the app's verb completer at startup."""
+    with app.app_context():
+        try:
+            get_verb_completer()
+        except SQLAlchemyError as e:
+            # Leave the completer unbuilt so it is built on first use
+            app.logger.warning(f"Verb completer not built: {e}")
+
+
+def get_verb_completer() -> VerbCompleter:
+    """Return the current app's verb completer, building it from the app's
+    verb source the first time it is needed."""
+    completer = current_app.extensions.get('verb_completer')
+    if completer is None:
+        completer = current_app.extensions.setdefault(
+            'verb_completer', VerbCompleter(get_verb_source().iter_verbs()))
+    return completer
+
+
+def get_verb_popularity() -> Counter:
+    """Return the current app's count of conjugation table requests per
+    verb."""
+    return current_app.extensions.setdefault('verb_popularity', Counter())
+
+
+def record_verb_use(verb: Verb) -> None:
+    """Count a request for a verb's conjugation table. Only verbs found in
+    the app's verb source are counted, so the count is bounded by the
+    catalog."""
+    if verb.is_verified and not verb.is_reflexive:
+        get_verb_popularity()[verb.infinitive.lower()] += 1
@@ -8,6 +8,17 @@ class Config(object):
     SESSION_COOKIE_SECURE = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///database.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    PARADIGM_STORE_ENABLED = True
+    PARADIGM_ARTIFACT_PATH = os.environ.get('PARADIGM_ARTIFACT_PATH')
+    OPEN_VOCABULARY_ENABLED = False
+    OPEN_VOCABULARY_CACHE_SIZE = 10000
+    # Indexes built at startup instead of by the first request that needs
+    # them, which otherwise waits seconds for the build with a catalog of
+    # thousands of verbs. Each worker builds its own copy.
+    FORM_INDEX_PRELOAD = False
+    FORM_SEARCH_PRELOAD = False
+    SIMILARITY_INDEX_PRELOAD = False
+    QUIZ_CACHE_SIZE = 1024
 
 
 class ProductionConfig(Config):
@@ -0,0 +1,10 @@
+from .artifact import ArtifactSource, write_artifact
+from .quiz import Quiz
+from .quiz_item import QuizItem
+from .sources import VerbSource, MemorySource, DictSource, SQLiteSource
+from .verb import Verb
+from .verb_index import VerbIndex
+
+__all__ = ['ArtifactSource', 'write_artifact', 'Quiz', 'QuizItem',
+           'VerbSource', 'MemorySource', 'DictSource', 'SQLiteSource', 'Verb',
+           'VerbIndex']
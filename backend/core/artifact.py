@@ -0,0 +1,229 @@
+import mmap
+import os
+import struct
+import tempfile
+from typing import Iterable
+
+from .sources import VerbSource
+from .utils import PRONOUNS, PRONOUN_INDEX
+
+MAGIC = b"CJGA"
+VERSION = 2
+
+# magic, version, tense count, pronoun count, verb count, and the file
+# offsets of the tense, verb, and cell tables
+_HEADER = struct.Struct("<4sHHHxxIIII")
+# file offset and byte length of a tense name in the string pool
+_TENSE = struct.Struct("<II")
+# file offset and byte length of an infinitive, its database id, and
+# whether it is regular
+_VERB = struct.Struct("<IIIBxxx")
+# file offset and byte length of a form, indexed by (verb, tense, pronoun)
+_CELL = struct.Struct("<II")
+
+# Cell length of a pronoun with no form in a tense
+NO_FORM = 0xFFFFFFFF
+
+# Compound tenses whose forms end in the (present, past) participles
+_PARTICIPLE_TENSES = ("present_progressive", "present_perfect")
+
+
+def write_artifact(path: str, tenses: list[str],
+                   verbs: Iterable[tuple[str, int, bool, list]]) -> int:
+    """
+    Write a conjugation artifact and return the number of verbs written.
+
+    Each verb is an (infinitive, database id, is_regular, forms) tuple,
+    where forms holds one list of len(PRONOUNS) forms or None per tense, in
+    the order of tenses. The file is replaced atomically.
+    """
+    pool, pool_offsets = bytearray(), {}
+
+    def intern(text: str) -> tuple[int, int]:
+        """Add a string to the pool once and return its (offset, length)
+        relative to the start of the pool."""
+        data = text.encode("utf-8")
+        if data not in pool_offsets:
+            pool_offsets[data] = len(pool)
+            pool.extend(data)
+        return pool_offsets[data], len(data)
+
+    tense_strings = [intern(tense) for tense in tenses]
+    verb_rows, cell_rows = [], []
+    for infinitive, verb_id, is_regular, forms in sorted(
+            verbs, key=lambda verb: verb[0].encode("utf-8")):
+        verb_rows.append((intern(infinitive), verb_id, is_regular))
+        for tense_forms in forms:
+            cell_rows.extend(None if form is None else intern(form)
+                             for form in tense_forms)
+
+    tenses_offset = _HEADER.size
+    verbs_offset = tenses_offset + _TENSE.size * len(tenses)
+    cells_offset = verbs_offset + _VERB.size * len(verb_rows)
+    pool_offset = cells_offset + _CELL.size * len(cell_rows)
+
+    data = bytearray(_HEADER.pack(MAGIC, VERSION, len(tenses), len(PRONOUNS),
+                                  len(verb_rows), tenses_offset,
+                                  verbs_offset, cells_offset))
+    for offset, length in tense_strings:
+        data += _TENSE.pack(pool_offset + offset, length)
+    for (offset, length), verb_id, is_regular in verb_rows:
+        data += _VERB.pack(pool_offset + offset, length, verb_id, is_regular)
+    for cell in cell_rows:
+        data += _CELL.pack(0, NO_FORM) if cell is None else \
+            _CELL.pack(pool_offset + cell[0], cell[1])
+    data += pool
+
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile(dir=directory, delete=False) as file:
+        file.write(data)
+    os.replace(file.name, path)
+    return len(verb_rows)
+
+
+class ArtifactSource(VerbSource):
+    def __init__(self, path: str) -> None:
+        """
+        Memory-map a conjugation artifact written by write_artifact.
+
+        Raises:
+            ValueError: if the file is not a conjugation artifact.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Invalid conjugation artifact: {path}")
+        magic, version, tense_count, pronoun_count, self.verb_count, \
+            tenses_offset, self._verbs_offset, self._cells_offset = \
+            _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION or \
+                pronoun_count != len(PRONOUNS):
+            self.close()
+            raise ValueError(f"Invalid conjugation artifact: {path}")
+
+        self.tenses = {}
+        for tense_id in range(tense_count):
+            offset, length = _TENSE.unpack_from(
+                self._mmap, tenses_offset + tense_id * _TENSE.size)
+            self.tenses[self._read(offset, length)] = tense_id
+
+    def close(self) -> None:
+        """Unmap the artifact."""
+        self._mmap.close()
+
+    def __getstate__(self) -> dict:
+        """Pickle the artifact by path, since the mapping itself cannot be
+        pickled."""
+        return {'path': self.path}
+
+    def __setstate__(self, state: dict) -> None:
+        """Map the artifact again after unpickling."""
+        self.__init__(state['path'])
+
+    def _read(self, offset: int, length: int) -> str:
+        """Decode a string from the pool."""
+        return self._mmap[offset:offset + length].decode("utf-8")
+
+    def _read_verb(self, verb_id: int) -> tuple[bytes, int, bool]:
+        """Return the encoded infinitive, database id, and regular flag of
+        a verb."""
+        offset, length, db_id, is_regular = _VERB.unpack_from(
+            self._mmap, self._verbs_offset + verb_id * _VERB.size)
+        return self._mmap[offset:offset + length], db_id, bool(is_regular)
+
+    def get_verb_id(self, infinitive: str) -> int | None:
+        """Return the id of a verb by binary search over the sorted verb
+        table, or None if the verb is not in the artifact."""
+        target = infinitive.encode("utf-8")
+        low, high = 0, self.verb_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._read_verb(middle)[0] < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.verb_count and self._read_verb(low)[0] == target:
+            return low
+        return None
+
+    def iter_verbs(self) -> Iterable[tuple[str, bool]]:
+        """Return the infinitive and regular flag of every verb in the
+        artifact, in sorted order."""
+        for verb_id in range(self.verb_count):
+            infinitive, _, is_regular = self._read_verb(verb_id)
+            yield infinitive.decode("utf-8"), is_regular
+
+    def is_valid_verb(self, infinitive: str) -> bool:
+        """Return True if the infinitive is in the artifact."""
+        return self.get_verb_id(infinitive) is not None
+
+    def find_verb(self, infinitive: str) -> tuple[int, bool] | None:
+        """Return the database id of a verb in the artifact and whether it
+        is regular, or None if the verb is not in the artifact."""
+        verb_id = self.get_verb_id(infinitive)
+        if verb_id is None:
+            return None
+        return self._read_verb(verb_id)[1:]
+
+    def is_regular(self, infinitive: str) -> bool:
+        """Return True if the infinitive is a regular verb in the
+        artifact."""
+        verb_id = self.get_verb_id(infinitive)
+        return verb_id is not None and self._read_verb(verb_id)[2]
+
+    def get_form(self, verb_id: int, tense_id: int,
+                 pronoun_id: int) -> str | None:
+        """Return the form stored for a (verb, tense, pronoun) cell."""
+        index = (verb_id * len(self.tenses) + tense_id) * len(PRONOUNS) + \
+            pronoun_id
+        offset, length = _CELL.unpack_from(
+            self._mmap, self._cells_offset + index * _CELL.size)
+        return None if length == NO_FORM else self._read(offset, length)
+
+    def get_conjugation(self, infinitive: str, tense: str) -> tuple | None:
+        """Return the six stored forms of a verb in a tense, or None if the
+        verb or tense is not in the artifact."""
+        verb_id = self.get_verb_id(infinitive)
+        tense_id = self.tenses.get(tense)
+        if verb_id is None or tense_id is None:
+            return None
+        return tuple(self.get_form(verb_id, tense_id, pronoun_id)
+                     for pronoun_id in range(len(PRONOUNS)))
+
+    def get_participles(self, infinitive: str) -> tuple | None:
+        """Return the (present, past) participles of an irregular verb,
+        read from the last word of its compound tense forms, or None if the
+        verb is regular or the artifact has no compound tenses."""
+        verb_id = self.get_verb_id(infinitive)
+        if verb_id is None or self._read_verb(verb_id)[2]:
+            return None
+        participles = []
+        for tense in _PARTICIPLE_TENSES:
+            tense_id = self.tenses.get(tense)
+            form = tense_id is not None and self.get_form(
+                verb_id, tense_id, PRONOUN_INDEX["él/ella/Ud."])
+            participles.append(form.rsplit(" ", 1)[-1] if form else None)
+        return tuple(participles) if any(participles) else None
+
+    def conjugate(self, infinitive: str, tense: str,
+                  pronoun: str) -> str | None:
+        """
+        Return the stored form of a verb for a tense and pronoun.
+
+        Raises:
+            ValueError: if the verb, tense, or pronoun is not in the
+                        artifact.
+        """
+        verb_id = self.get_verb_id(infinitive)
+        if verb_id is None:
+            raise ValueError(f"Invalid verb: {infinitive}")
+        if tense not in self.tenses:
+            raise ValueError("Invalid tense")
+        if pronoun not in PRONOUN_INDEX:
+            raise ValueError("Invalid pronoun")
+        return self.get_form(verb_id, self.tenses[tense],
+                             PRONOUN_INDEX[pronoun])
+
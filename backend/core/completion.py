@@ -0,0 +1,53 @@
+import heapq
+import unicodedata
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Mapping, Optional
+
+
+def fold_accents(text: str) -> str:
+    """Returns text in lowercase without accents or other diacritics, so
+    that "sonreír" and "sonreir" compare equal."""
+    decomposed = unicodedata.normalize("NFD", text.lower())
+    return "".join(letter for letter in decomposed
+                   if not unicodedata.combining(letter))
+
+
+class VerbCompleter:
+    def __init__(self, verbs: Iterable[tuple[str, bool]]) -> None:
+        """
+        Initialize a prefix index of verbs from (infinitive, is_regular)
+        pairs, as parallel arrays of accent-folded keys in sorted order and
+        their infinitives. A prefix matches one contiguous range of keys.
+        """
+        entries = sorted((fold_accents(infinitive), infinitive, is_regular)
+                         for infinitive, is_regular in verbs)
+        self.keys = [key for key, _, _ in entries]
+        self.infinitives = [infinitive for _, infinitive, _ in entries]
+        self.irregular = {infinitive for _, infinitive, is_regular
+                          in entries if not is_regular}
+
+    def __len__(self) -> int:
+        """Return the number of verbs in the index."""
+        return len(self.infinitives)
+
+    def complete(self, prefix: str, limit: int = 10,
+                 popularity: Optional[Mapping[str, int]] = None) -> list[str]:
+        """
+        Return up to limit infinitives starting with a prefix, ignoring
+        accents, from most to least popular. Verbs without a popularity
+        count rank irregular verbs first, then alphabetically.
+
+        Raises:
+            ValueError: if the prefix is not a string.
+        """
+        if not isinstance(prefix, str):
+            raise ValueError("prefix must be a string")
+        key = fold_accents(prefix.strip())
+        start = bisect_left(self.keys, key)
+        end = bisect_right(self.keys, key + "\uffff", lo=start)
+        popularity = popularity or {}
+        return heapq.nsmallest(
+            limit, self.infinitives[start:end],
+            key=lambda infinitive: (-popularity.get(infinitive, 0),
+                                    infinitive not in self.irregular,
+                                    infinitive))
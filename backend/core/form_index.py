@@ -0,0 +1,111 @@
+import sys
+from typing import Iterator, Optional
+
+from .sources import VerbSource
+from .utils import PRONOUNS, TENSE_DESCRIPTORS
+from .utils.conjugate import conjugate_paradigm
+from .verb import Verb
+
+
+def normalize_form(form: str) -> str:
+    """Returns a verb form in lowercase with single spaces between its
+    words, as it is keyed in a FormIndex."""
+    return " ".join(form.lower().split())
+
+
+def iter_paradigms(source: VerbSource) -> Iterator[tuple[str, dict]]:
+    """Return the infinitive and conjugation table of every verb in a
+    source, as dicts of tenses to dicts of pronouns to forms with None where
+    a pronoun has no form."""
+    tenses = [tense.name for tense in TENSE_DESCRIPTORS]
+    for infinitive, is_regular in source.iter_verbs():
+        verb = Verb._create(infinitive, source, None, is_regular)
+        if is_regular:
+            yield infinitive, conjugate_paradigm(verb, tenses)
+        else:
+            yield infinitive, {tense: {pronoun: _conjugate(verb, tense,
+                                                           pronoun)
+                                       for pronoun in PRONOUNS}
+                               for tense in tenses}
+
+
+def _conjugate(verb: Verb, tense: str, pronoun: str) -> str | None:
+    """Return a form of a verb, or None if the pronoun has no form in the
+    tense."""
+    try:
+        return verb.conjugate(tense, pronoun)
+    except ValueError:
+        return None
+
+
+class FormIndex:
+    def __init__(self) -> None:
+        """
+        Initialize an empty index from normalized verb forms to the
+        (verb, tense, pronoun) cells that produce them. Each cell is stored
+        as one integer id, and a form produced by a single cell maps to its
+        id rather than a tuple of ids.
+        """
+        self.infinitives = []
+        self.tenses = [tense.name for tense in TENSE_DESCRIPTORS]
+        self.forms = {}
+
+    @classmethod
+    def from_source(cls, source: VerbSource) -> 'FormIndex':
+        """Return an index of every form of every verb in a source,
+        including the compound tenses."""
+        index = cls()
+        for infinitive, table in iter_paradigms(source):
+            index.add(infinitive, table)
+        return index
+
+    def add(self, infinitive: str, table: dict) -> None:
+        """Add the forms of a verb from a conjugation table of tenses to
+        dicts of pronouns to forms, skipping missing forms."""
+        position = len(self.infinitives)
+        self.infinitives.append(infinitive)
+        for tense_id, tense in enumerate(self.tenses):
+            for pronoun_id, pronoun in enumerate(PRONOUNS):
+                form = table.get(tense, {}).get(pronoun)
+                if form is None:
+                    continue
+                cell = (position * len(self.tenses) + tense_id) * \
+                    len(PRONOUNS) + pronoun_id
+                key = normalize_form(form)
+                cells = self.forms.get(key)
+                if cells is None:
+                    self.forms[key] = cell
+                elif isinstance(cells, int):
+                    self.forms[key] = (cells, cell)
+                else:
+                    self.forms[key] = cells + (cell,)
+
+    def _decode(self, cell: int) -> tuple[str, str, str]:
+        """Return the (infinitive, tense, pronoun) of a cell id."""
+        cell, pronoun_id = divmod(cell, len(PRONOUNS))
+        position, tense_id = divmod(cell, len(self.tenses))
+        return (self.infinitives[position], self.tenses[tense_id],
+                PRONOUNS[pronoun_id])
+
+    def lookup(self, form: str,
+               infinitive: Optional[str] = None) -> list[tuple]:
+        """Return the (infinitive, tense, pronoun) cells that produce a
+        form, only of the given infinitive if there is one."""
+        cells = self.forms.get(normalize_form(form), ())
+        if isinstance(cells, int):
+            cells = (cells,)
+        return [cell for cell in map(self._decode, cells)
+                if infinitive is None or cell[0] == infinitive]
+
+    def __len__(self) -> int:
+        """Return the number of distinct forms in the index."""
+        return len(self.forms)
+
+    def memory_usage(self) -> int:
+        """Return the approximate number of bytes the index holds."""
+        total = sys.getsizeof(self.forms) + sys.getsizeof(self.infinitives)
+        for key, cells in self.forms.items():
+            total += sys.getsizeof(key) + sys.getsizeof(cells)
+            if not isinstance(cells, int):
+                total += sum(map(sys.getsizeof, cells))
+        return total + sum(map(sys.getsizeof, self.infinitives))
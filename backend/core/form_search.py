@@ -0,0 +1,87 @@
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable
+
+from .form_index import normalize_form
+
+# Bits of a suffix array entry that hold the offset of the suffix in its form
+_OFFSET_BITS = 8
+
+
+class FormSearchIndex:
+    def __init__(self, forms: Iterable[str]) -> None:
+        """
+        Initialize a wildcard search index over distinct verb forms: the
+        forms in sorted order for prefix queries, the reversed forms in
+        sorted order for suffix queries, and a suffix array for infix
+        queries. Suffix array entries pack a form's position and an offset
+        into one integer.
+        """
+        self.forms = sorted(set(forms))
+        reversed_forms = sorted((form[::-1], position) for position, form
+                                in enumerate(self.forms))
+        self.reversed_forms = [form for form, _ in reversed_forms]
+        self.reversed_positions = array(
+            "I", (position for _, position in reversed_forms))
+        self.suffixes = array("I", sorted(
+            ((position << _OFFSET_BITS) | offset
+             for position, form in enumerate(self.forms)
+             for offset in range(min(len(form), 1 << _OFFSET_BITS))),
+            key=self._get_suffix))
+
+    def _get_suffix(self, entry: int) -> str:
+        """Return the suffix a suffix array entry points to."""
+        return self.forms[entry >> _OFFSET_BITS][
+            entry & ((1 << _OFFSET_BITS) - 1):]
+
+    def _prefix_range(self, prefix: str) -> range:
+        """Return the positions of the forms starting with a prefix."""
+        return range(bisect_left(self.forms, prefix),
+                     bisect_right(self.forms, prefix + "\uffff"))
+
+    def _with_suffix(self, suffix: str) -> Iterable[int]:
+        """Return the positions of the forms ending with a suffix."""
+        target = suffix[::-1]
+        start = bisect_left(self.reversed_forms, target)
+        end = bisect_right(self.reversed_forms, target + "\uffff")
+        return self.reversed_positions[start:end]
+
+    def _containing(self, infix: str) -> Iterable[int]:
+        """Return the positions of the forms containing an infix, without
+        duplicates."""
+        def key(entry: int) -> str:
+            return self._get_suffix(entry)[:len(infix)]
+
+        start = bisect_left(self.suffixes, infix, key=key)
+        end = bisect_right(self.suffixes, infix, lo=start, key=key)
+        return {entry >> _OFFSET_BITS for entry in self.suffixes[start:end]}
+
+    def search(self, pattern: str) -> list[str]:
+        """
+        Return the forms matching a pattern in sorted order, where "*"
+        matches any letters: "tuv*" finds a prefix, "*ieron" a suffix,
+        "*ab*" an infix, and a pattern without "*" an exact form.
+
+        Raises:
+            ValueError: if the pattern is not a string or has no letters.
+        """
+        if not isinstance(pattern, str):
+            raise ValueError("pattern must be a string")
+        pattern = normalize_form(pattern)
+        parts = pattern.split("*")
+        if not any(parts):
+            raise ValueError("pattern must contain letters")
+
+        if parts[0]:
+            candidates = self._prefix_range(parts[0])
+        elif parts[-1]:
+            candidates = self._with_suffix(parts[-1])
+        else:
+            candidates = self._containing(max(parts, key=len))
+
+        # Check every part of the pattern against the candidates
+        regex = re.compile(".*".join(map(re.escape, parts)), re.DOTALL)
+        return sorted(form for form in map(self.forms.__getitem__,
+                                           candidates)
+                      if regex.fullmatch(form))
@@ -0,0 +1,102 @@
+from importlib import import_module
+from typing import Callable, NamedTuple, Optional
+
+from ..sources import VerbSource
+
+# Modules defining the ENGINE of each language, relative to this package.
+# A module is only imported the first time its language is requested, so
+# registered languages cost nothing until they are used.
+_ENGINE_MODULES = {
+    "es": ".spanish",
+}
+
+_ENGINES = {}
+
+
+def _has_every_form(tense: str, pronoun: str) -> bool:
+    """Returns True, for languages where every tense has a form for every
+    pronoun."""
+    return True
+
+
+def find_verbs(infinitives: list[str], source: VerbSource,
+               open_vocabulary: bool = False) -> dict[str, tuple]:
+    """Return the (id, is_regular) data of each lowercase infinitive found
+    in a source, for languages without open vocabulary or derived
+    verbs."""
+    return source.find_verbs(infinitives) if infinitives else {}
+
+
+class LanguageEngine(NamedTuple):
+    """Everything needed to validate and conjugate verbs of a language."""
+    code: str
+    name: str
+    # Pronouns in the order of each tense's six forms
+    pronouns: tuple
+    tenses: tuple
+    # Verb class of the language, a subclass of Verb
+    verb_type: type
+    # Returns the source of the language's bundled verb data, or None if
+    # its verbs are stored in the app's database
+    load_source: Optional[Callable[[], VerbSource]] = None
+    # Returns True if a tense has a form for a pronoun, and False for the
+    # language's empty cells
+    has_form: Callable[[str, str], bool] = _has_every_form
+    # Resolves lowercase infinitives against a source as
+    # resolve_verbs(infinitives, source, open_vocabulary), returning the
+    # data Verb objects are created from
+    resolve_verbs: Callable[..., dict] = find_verbs
+
+    def is_valid_tense(self, tense: str) -> bool:
+        """Returns True if the tense is a tense of the language; otherwise,
+        returns False."""
+        return isinstance(tense, str) and tense in self.tenses
+
+    def is_valid_pronoun(self, pronoun: str) -> bool:
+        """Returns True if the pronoun is a pronoun of the language;
+        otherwise, returns False."""
+        return isinstance(pronoun, str) and pronoun in self.pronouns
+
+
+def register_language(code: str, module: str) -> None:
+    """Register the module defining the ENGINE of a language, without
+    importing it. Relative module names are resolved against this
+    package."""
+    _ENGINE_MODULES[code] = module
+    _ENGINES.pop(code, None)
+
+
+def unregister_language(code: str) -> None:
+    """Remove a registered language and its imported engine, if any."""
+    _ENGINE_MODULES.pop(code, None)
+    _ENGINES.pop(code, None)
+
+
+def get_languages() -> list[str]:
+    """Returns the codes of the registered languages."""
+    return sorted(_ENGINE_MODULES)
+
+
+def is_loaded(code: str) -> bool:
+    """Returns True if the engine of a language has been imported;
+    otherwise, returns False."""
+    return code in _ENGINES
+
+
+def get_engine(code: str) -> LanguageEngine:
+    """
+    Return the engine of a language, importing its module the first time
+    the language is requested.
+
+    Raises:
+        ValueError: if the language is not registered.
+    """
+    if not isinstance(code, str):
+        raise ValueError(f"Invalid language: {code}")
+    engine = _ENGINES.get(code)
+    if engine is None:
+        module = _ENGINE_MODULES.get(code)
+        if module is None:
+            raise ValueError(f"Invalid language: {code}")
+        engine = _ENGINES[code] = import_module(module, __name__).ENGINE
+    return engine
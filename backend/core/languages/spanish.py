@@ -0,0 +1,13 @@
+from . import LanguageEngine
+from ..utils import PRONOUNS, TENSE_DESCRIPTORS, has_form
+from ..verb import Verb, resolve_verbs
+
+ENGINE = LanguageEngine(
+    code="es",
+    name="Spanish",
+    pronouns=tuple(PRONOUNS),
+    tenses=tuple(descriptor.name for descriptor in TENSE_DESCRIPTORS),
+    verb_type=Verb,
+    has_form=has_form,
+    resolve_verbs=resolve_verbs,
+)
@@ -0,0 +1,156 @@
+import csv
+import json
+import re
+from itertools import groupby
+from typing import Iterator, NamedTuple, Optional
+
+from .sources import PRONOUN_ATTRIBUTES
+from .utils.conjugate import SIMPLE_TENSES
+from .utils.patterns import (classify_verb, diff_paradigm,
+                             predict_conjugation, predict_participles)
+
+# Lowercase Spanish letters ending in -ar, -er, or -ir, including short
+# irregular infinitives such as "ir" and "ser"
+_INFINITIVE_PATTERN = re.compile(r"[a-zñáéíóúü]*[aei]r")
+
+# Columns of a CSV lexicon, with one row per verb and tense and the
+# participles on a row whose tense is "participles"
+CSV_COLUMNS = ('infinitive', 'tense') + PRONOUN_ATTRIBUTES + (
+    'present_participle', 'past_participle', 'gloss')
+
+
+class LexiconEntry(NamedTuple):
+    """A verb read from a lexicon file."""
+    infinitive: str
+    # Tenses to their six forms, for the tenses the lexicon lists
+    conjugations: dict
+    # (present, past) participles, or None if the lexicon lists none
+    participles: Optional[tuple]
+    # English meaning of the verb, or None
+    gloss: Optional[str]
+
+
+class ClassifiedEntry(NamedTuple):
+    """How a lexicon verb is stored: as a regular verb, or as an irregular
+    verb with a rule pattern and the forms the pattern does not predict."""
+    entry: LexiconEntry
+    is_regular: bool
+    # Rule pattern of an irregular verb, or None if it is stored as
+    # complete rows
+    pattern: Optional[str]
+    # Tenses to their six stored forms, and "participles" to the stored
+    # participles, leaving out tenses without stored forms
+    stored: dict
+
+
+def _make_entry(infinitive: str, conjugations: dict,
+                participles: Optional[tuple], gloss: Optional[str],
+                location: str) -> LexiconEntry:
+    """
+    Return a validated lexicon entry.
+
+    Raises:
+        ValueError: naming the location of an invalid entry.
+    """
+    if not isinstance(infinitive, str) or \
+            not _INFINITIVE_PATTERN.fullmatch(infinitive):
+        raise ValueError(f"Invalid infinitive {infinitive!r} {location}")
+    for tense, forms in conjugations.items():
+        if tense not in SIMPLE_TENSES or len(forms) != 6:
+            raise ValueError(f"Invalid {tense} forms of {infinitive} "
+                             f"{location}")
+    if participles is not None and len(participles) != 2:
+        raise ValueError(f"Invalid participles of {infinitive} {location}")
+    return LexiconEntry(infinitive, conjugations, participles, gloss or None)
+
+
+def _read_jsonl(file) -> Iterator[LexiconEntry]:
+    """Return the entries of a JSON Lines lexicon, one object per line with
+    an "infinitive" and optional "conjugations", "participles", and
+    "gloss"."""
+    for line_number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        location = f"on line {line_number}"
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid JSON {location}")
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid entry {location}")
+        conjugations = {tense: tuple(forms) for tense, forms in
+                        (data.get('conjugations') or {}).items()}
+        participles = data.get('participles')
+        yield _make_entry(
+            data.get('infinitive'), conjugations,
+            None if participles is None else tuple(participles),
+            data.get('gloss'), location)
+
+
+def _read_csv(file) -> Iterator[LexiconEntry]:
+    """Return the entries of a CSV lexicon with CSV_COLUMNS, whose rows for
+    each verb are consecutive."""
+    reader = csv.DictReader(file)
+    missing = set(CSV_COLUMNS[:2]) - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"Missing CSV columns: {', '.join(sorted(missing))}")
+
+    for infinitive, rows in groupby(reader, key=lambda row: row['infinitive']):
+        conjugations, participles, gloss = {}, None, None
+        for row in rows:
+            tense = row['tense']
+            if tense == 'participles':
+                participles = (row.get('present_participle') or None,
+                               row.get('past_participle') or None)
+            elif tense:
+                conjugations[tense] = tuple(
+                    row.get(attribute) or None
+                    for attribute in PRONOUN_ATTRIBUTES)
+            gloss = gloss or row.get('gloss')
+        yield _make_entry(infinitive, conjugations, participles, gloss,
+                          f"before line {reader.line_num + 1}")
+
+
+def read_lexicon(path: str) -> Iterator[LexiconEntry]:
+    """
+    Return the entries of a .jsonl or .csv lexicon file one at a time,
+    reading the file lazily.
+
+    Raises:
+        ValueError: if the file type is unsupported or an entry is invalid.
+    """
+    if path.endswith('.jsonl'):
+        reader = _read_jsonl
+    elif path.endswith('.csv'):
+        reader = _read_csv
+    else:
+        raise ValueError(f"Unsupported lexicon file: {path}")
+    with open(path, encoding='utf-8', newline='') as file:
+        yield from reader(file)
+
+
+def classify_entry(entry: LexiconEntry) -> ClassifiedEntry:
+    """Return how a lexicon verb is stored, comparing its forms with the
+    regular rules first and then with each rule pattern. Tenses and
+    participles the lexicon leaves out are left to the verb's pattern."""
+    infinitive = entry.infinitive
+    if all(forms == predict_conjugation(infinitive, tense)
+           for tense, forms in entry.conjugations.items()) and \
+            entry.participles in (None, predict_participles(infinitive)):
+        return ClassifiedEntry(entry, True, None, {})
+
+    stored = dict(entry.conjugations)
+    if entry.participles is not None:
+        stored['participles'] = entry.participles
+
+    # Forms no pattern can express as diffs are stored as complete rows
+    pattern = classify_verb(infinitive, entry.conjugations,
+                            entry.participles)
+    if pattern is None:
+        return ClassifiedEntry(entry, False, None, stored)
+
+    diffs = diff_paradigm(infinitive, pattern, entry.conjugations,
+                          entry.participles or
+                          predict_participles(infinitive, pattern))
+    return ClassifiedEntry(entry, False, pattern, {
+        tense: forms for tense, forms in diffs.items() if any(forms)})
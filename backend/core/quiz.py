@@ -1,19 +1,41 @@
 import random
+from typing import Optional
 
+from .languages import LanguageEngine, get_engine
 from .quiz_item import QuizItem
 from .verb import Verb
-from backend.app.utils import is_valid_tense, is_valid_pronoun
+
+# Sentinel for answers that have not been conjugated yet
+_MISSING = object()
 
 
 class Quiz:
     def __init__(self, verb_list: list[Verb], tense_list: list[str],
-                 pronoun_list: list[str], num_items: int = None) -> None:
-        """Initialize a Quiz object with lists of verbs, tenses, and pronouns."""
+                 pronoun_list: list[str], num_items: int = None,
+                 language: str = "es",
+                 rng: Optional[random.Random] = None) -> None:
+        """
+        Initialize a Quiz object with lists of verbs, tenses, and pronouns
+        of a language, sampling its items with rng or, without one, the
+        random module.
+
+        Raises:
+            ValueError: if the language or any list is invalid.
+        """
+        self._engine = get_engine(language)
         self.verb_list = verb_list
         self.tense_list = tense_list
         self.pronoun_list = pronoun_list
         self.num_items = num_items
-        self.quiz_bank = self.create_quiz_bank()
+        # Answers conjugated so far, by index in the verb, tense, and
+        # pronoun product, shared by every bank sampled from this quiz
+        self._answers = {}
+        self.quiz_bank = self.create_quiz_bank(rng)
+
+    @property
+    def engine(self) -> LanguageEngine:
+        """Get the engine of the quiz's language."""
+        return self._engine
 
     @property
     def verb_list(self) -> list:
@@ -29,8 +51,8 @@ class Quiz:
             ValueError: if the verb_list is invalid.
         """
         if not isinstance(verb_list, list) or not all(
-                isinstance(verb, Verb) for
-                verb in verb_list
+                isinstance(verb, self._engine.verb_type) and
+                verb.language == self._engine.code for verb in verb_list
         ):
             raise ValueError("verb_list must be a list of valid Verb objects")
         self._verb_list = verb_list
@@ -49,7 +71,7 @@ class Quiz:
             ValueError: if the tense_list is invalid.
         """
         if not isinstance(tense_list, list) or not all(
-                isinstance(tense, str) and is_valid_tense(tense) for
+                self._engine.is_valid_tense(tense) for
                 tense in tense_list
         ):
             raise ValueError("tense_list must be a list of valid tenses")
@@ -69,7 +91,7 @@ class Quiz:
             ValueError: if the pronoun_list is invalid.
         """
         if not isinstance(pronoun_list, list) or not all(
-                isinstance(pronoun, str) and is_valid_pronoun(pronoun) for
+                self._engine.is_valid_pronoun(pronoun) for
                 pronoun in pronoun_list
         ):
             raise ValueError("pronoun_list must be a list of valid pronouns")
@@ -102,24 +124,46 @@ class Quiz:
             raise ValueError("quiz_bank must be a list of QuizItem objects")
         self._quiz_bank = quiz_bank
 
-    def create_quiz_bank(self) -> list:
-        """Create a quiz_bank based on the verb, tense, and pronoun lists."""
-        quiz_bank = []
-        for verb in self.verb_list:
-            for tense in self.tense_list:
-                for pronoun in self.pronoun_list:
-                    if pronoun == "yo" and "imperative" in tense:
-                        continue
-                    question = (verb, tense, pronoun)
-                    answer = verb.conjugate(tense, pronoun)
-                    quiz_item = QuizItem(question, answer)
-                    quiz_bank.append(quiz_item)
+    def create_quiz_bank(self,
+                         rng: Optional[random.Random] = None) -> list:
+        """
+        Create a quiz_bank based on the verb, tense, and pronoun lists.
+        Items are sampled by index from the verb, tense, and pronoun
+        product without building it, so only the sampled items are
+        conjugated.
+        """
+        # Tense and pronoun pairs of one verb, without the language's
+        # empty cells
+        self._pairs = [(tense, pronoun) for tense in self.tense_list
+                       for pronoun in self.pronoun_list
+                       if self._engine.has_form(tense, pronoun)]
 
         # Update num_items if not provided or if it exceeds size of quiz_bank
-        total_items = len(quiz_bank)
+        total_items = len(self.verb_list) * len(self._pairs)
         if self.num_items is None or self.num_items > total_items:
             self.num_items = min(total_items, 50)
-        return random.sample(quiz_bank, self.num_items)
+        return self.resample(rng)
+
+    def resample(self, rng: Optional[random.Random] = None) -> list:
+        """Return a new, independently sampled list of num_items QuizItem
+        objects from the quiz's verbs, tenses, and pronouns, sampled with
+        rng or, without one, the random module. Answers already conjugated
+        for this quiz are reused."""
+        pairs = self._pairs
+        quiz_bank = []
+        for index in (rng or random).sample(
+                range(len(self.verb_list) * len(pairs)), self.num_items):
+            verb_index, pair_index = divmod(index, len(pairs))
+            verb = self.verb_list[verb_index]
+            tense, pronoun = pairs[pair_index]
+            answer = self._answers.get(index, _MISSING)
+            if answer is _MISSING:
+                answer = self._answers[index] = verb.conjugate(tense,
+                                                               pronoun)
+            # The lists are validated and the answer is the conjugation
+            quiz_bank.append(QuizItem.from_trusted((verb, tense, pronoun),
+                                                   answer))
+        return quiz_bank
 
     def __str__(self) -> str:
         """Get the string representation of the Quiz object."""
@@ -1,5 +1,5 @@
+from .languages import get_engine
 from .verb import Verb
-from backend.app.utils import is_valid_tense, is_valid_pronoun
 
 
 class QuizItem:
@@ -11,6 +11,18 @@ class QuizItem:
         self.update_question(question)
         self.answer = answer
 
+    @classmethod
+    def from_trusted(cls, question: tuple[Verb, str, str],
+                     answer: str) -> 'QuizItem':
+        """Return a QuizItem for a question whose tense and pronoun are
+        already validated and whose answer is the verb's conjugation,
+        without validating or conjugating again."""
+        item = cls.__new__(cls)
+        item._question_verb, item._question_tense, \
+            item._question_pronoun = question
+        item._answer = answer
+        return item
+
     def update_question(self, question: tuple[Verb, str, str]) -> None:
         """
         Update the question components: verb, tense, and pronoun.
@@ -27,10 +39,12 @@ class QuizItem:
         if not isinstance(question_verb, Verb):
             raise ValueError("Question verb must be type Verb")
 
-        if not is_valid_tense(question_tense):
+        # Tenses and pronouns are those of the verb's language
+        engine = get_engine(question_verb.language)
+        if not engine.is_valid_tense(question_tense):
             raise ValueError("Question tense is not valid")
 
-        if not is_valid_pronoun(question_pronoun):
+        if not engine.is_valid_pronoun(question_pronoun):
             raise ValueError("Question pronoun is not valid")
 
         self._question_verb = question_verb
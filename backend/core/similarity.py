@@ -0,0 +1,130 @@
+import os
+import random
+import zlib
+from typing import Iterable
+
+from .form_index import iter_paradigms
+from .sources import VerbSource
+from .utils import get_tense
+
+# Mersenne prime the MinHash permutations are taken modulo
+_PRIME = (1 << 61) - 1
+
+
+def get_paradigm_features(infinitive: str, table: dict) -> frozenset:
+    """
+    Returns the features of a conjugation table relative to the verb's
+    stem, one per form, as its tense and pronoun, the number of letters the
+    form drops from the end of the stem, and the letters that follow. Forms
+    of the compound tenses only contribute their participle.
+    """
+    stem = infinitive[:-2]
+    features = set()
+    for tense, forms in table.items():
+        descriptor = get_tense(tense)
+        for pronoun, form in forms.items():
+            if form is None:
+                continue
+            word = form.split()[-1]
+            common = len(os.path.commonprefix([stem, word]))
+            cell = f"participle:{descriptor.participle}" \
+                if descriptor.compound else f"{tense}:{pronoun}"
+            features.add(f"{cell}:{len(stem) - common}:{word[common:]}")
+    return frozenset(features)
+
+
+class SimilarityIndex:
+    def __init__(self, paradigms: Iterable[tuple[str, frozenset]],
+                 num_perm: int = 64, bands: int = 16,
+                 seed: int = 1) -> None:
+        """
+        Initialize a MinHash index of verbs from (infinitive, features)
+        pairs. Verbs with the same features share one signature, and each
+        signature is split into bands hashed into LSH buckets, so a query
+        only compares the signatures sharing a bucket with its own.
+
+        Raises:
+            ValueError: if num_perm is not a multiple of bands.
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        rng = random.Random(seed)
+        self._permutations = [(rng.randrange(1, _PRIME),
+                               rng.randrange(_PRIME))
+                              for _ in range(num_perm)]
+        self._rows = num_perm // bands
+        self.signatures = []
+        self.members = []
+        self.verbs = {}
+        self.buckets = {}
+
+        signature_ids = {}
+        for infinitive, features in sorted(paradigms):
+            signature_id = signature_ids.get(features)
+            if signature_id is None:
+                signature_id = signature_ids[features] = len(self.signatures)
+                self._add_signature(self._get_signature(features))
+            self.members[signature_id].append(infinitive)
+            self.verbs[infinitive] = signature_id
+
+    @classmethod
+    def from_source(cls, source: VerbSource, **kwargs) -> 'SimilarityIndex':
+        """Return an index of every verb in a source."""
+        return cls(((infinitive, get_paradigm_features(infinitive, table))
+                    for infinitive, table in iter_paradigms(source)),
+                   **kwargs)
+
+    def _get_signature(self, features: frozenset) -> tuple:
+        """Return the MinHash signature of a set of features."""
+        hashes = [zlib.crc32(feature.encode("utf-8")) for feature in features]
+        if not hashes:
+            return (_PRIME,) * len(self._permutations)
+        return tuple(min((a * value + b) % _PRIME for value in hashes)
+                     for a, b in self._permutations)
+
+    def _get_bands(self, signature: tuple) -> list[tuple]:
+        """Return the LSH bucket keys of a signature."""
+        return [(band, signature[start:start + self._rows])
+                for band, start in enumerate(range(0, len(signature),
+                                                   self._rows))]
+
+    def _add_signature(self, signature: tuple) -> None:
+        """Add a signature and put it in its buckets."""
+        signature_id = len(self.signatures)
+        self.signatures.append(signature)
+        self.members.append([])
+        for key in self._get_bands(signature):
+            self.buckets.setdefault(key, []).append(signature_id)
+
+    def similar(self, infinitive: str,
+                limit: int = 10) -> list[tuple[str, float]]:
+        """
+        Return up to limit verbs whose paradigms are most like a verb's, as
+        (infinitive, estimated similarity) pairs from most to least
+        similar.
+
+        Raises:
+            ValueError: if the verb is not in the index.
+        """
+        signature_id = self.verbs.get(infinitive)
+        if signature_id is None:
+            raise ValueError(f"Invalid verb: {infinitive}")
+        signature = self.signatures[signature_id]
+        candidates = {candidate for key in self._get_bands(signature)
+                      for candidate in self.buckets[key]}
+
+        def score(candidate: int) -> float:
+            return sum(a == b for a, b in zip(
+                signature, self.signatures[candidate])) / len(signature)
+
+        results = []
+        for candidate in sorted(candidates,
+                                key=lambda candidate: (-score(candidate),
+                                                       candidate)):
+            similarity = score(candidate)
+            for member in self.members[candidate]:
+                if len(results) == limit:
+                    return results
+                if member != infinitive:
+                    results.append((member, similarity))
+        return results
@@ -0,0 +1,230 @@
+import sqlite3
+from typing import Iterable, Optional
+
+from .utils.patterns import rebuild_paradigm
+
+PRONOUN_ATTRIBUTES = ('first_s', 'second_s', 'third_s', 'first_p',
+                      'second_p', 'third_p')
+
+
+class VerbSource:
+    """
+    Where Verb objects find out which verbs exist and which of their forms
+    are stored rather than produced by the regular rules.
+    """
+
+    def find_verb(self, infinitive: str) -> tuple[int, bool] | None:
+        """Return the id of a known verb and whether it is regular, or None
+        if the verb is unknown."""
+        raise NotImplementedError
+
+    def find_verbs(self,
+                   infinitives: list[str]) -> dict[str, tuple[int, bool]]:
+        """Return the id and regular flag of each known verb in a list of
+        lowercase infinitives."""
+        return {infinitive: verb for infinitive in infinitives
+                if (verb := self.find_verb(infinitive)) is not None}
+
+    def iter_verbs(self) -> Iterable[tuple[str, bool]]:
+        """Return the infinitive and regular flag of every known verb."""
+        raise NotImplementedError
+
+    def is_valid_verb(self, infinitive: str) -> bool:
+        """Return True if the infinitive is a known verb."""
+        return self.find_verb(infinitive) is not None
+
+    def is_regular(self, infinitive: str) -> bool:
+        """Return True if the infinitive is a known regular verb."""
+        verb = self.find_verb(infinitive)
+        return verb is not None and verb[1]
+
+    def get_conjugation(self, infinitive: str, tense: str) -> tuple | None:
+        """Return the six stored forms of a verb in a tense, or None if the
+        tense follows the regular rules."""
+        return None
+
+    def get_participles(self, infinitive: str) -> tuple | None:
+        """Return the stored (present, past) participles of a verb, or None
+        if they follow the regular rules."""
+        return None
+
+
+class MemorySource(VerbSource):
+    def __init__(self) -> None:
+        """
+        Initialize an empty in-memory source of verbs, tenses, and
+        irregular conjugations. Once loaded it is only read, so it can be
+        shared between threads and pickled into other processes.
+        """
+        self.loaded = False
+        self.regular_verbs = {}
+        self.irregular_verbs = {}
+        self.tenses = frozenset()
+        self.conjugations = {}
+        self.participles = {}
+
+    def load_rows(self, regular_rows: Iterable[tuple],
+                  irregular_rows: Iterable[tuple],
+                  tense_rows: Iterable[tuple],
+                  conjugation_rows: Iterable[tuple]) -> None:
+        """
+        Load the source from the rows of the verb tables, each in id order,
+        rebuilding the paradigms of irregular verbs stored as diffs.
+
+        Regular verb and tense rows are (id, name) tuples, and irregular
+        verb rows are (id, infinitive, pattern) tuples. Conjugation rows
+        are (verb id, tense id) tuples followed by the six pronoun forms and
+        the present and past participles.
+
+        Raises:
+            ValueError: if an irregular verb has an invalid pattern.
+        """
+        regular_verbs = {}
+        for verb_id, infinitive in regular_rows:
+            regular_verbs.setdefault(infinitive, verb_id)
+
+        irregular_verbs, patterns, verbs_by_id = {}, {}, {}
+        for verb_id, infinitive, pattern in irregular_rows:
+            if infinitive not in irregular_verbs:
+                irregular_verbs[infinitive] = verb_id
+                patterns[infinitive] = pattern
+            verbs_by_id[verb_id] = infinitive
+
+        tenses_by_id = dict(tense_rows)
+
+        stored, participles = {}, {}
+        for verb_id, tense_id, *forms in conjugation_rows:
+            infinitive = verbs_by_id.get(verb_id)
+            tense = tenses_by_id.get(tense_id)
+            if infinitive is None or tense is None or \
+                    irregular_verbs[infinitive] != verb_id:
+                continue
+            if tense == 'participles':
+                participles.setdefault(infinitive, tuple(forms[6:8]))
+            else:
+                stored.setdefault(infinitive, {}).setdefault(
+                    tense, tuple(forms[:6]))
+
+        conjugations = {}
+        for infinitive, pattern in patterns.items():
+            verb_conjugations, verb_participles = rebuild_paradigm(
+                infinitive, pattern, stored.get(infinitive, {}),
+                participles.get(infinitive))
+            conjugations.update(((infinitive, tense), forms) for tense, forms
+                                in verb_conjugations.items())
+            if verb_participles is not None:
+                participles[infinitive] = verb_participles
+
+        self.regular_verbs = regular_verbs
+        self.irregular_verbs = irregular_verbs
+        self.tenses = frozenset(tenses_by_id.values())
+        self.conjugations = conjugations
+        self.participles = participles
+        self.loaded = True
+
+    def iter_verbs(self) -> Iterable[tuple[str, bool]]:
+        """Return the infinitive and regular flag of every known verb, with
+        regular verbs winning over irregular ones."""
+        yield from ((infinitive, True) for infinitive in self.regular_verbs)
+        yield from ((infinitive, False) for infinitive in self.irregular_verbs
+                    if infinitive not in self.regular_verbs)
+
+    def is_valid_verb(self, infinitive: str) -> bool:
+        """Return True if the infinitive is a known regular or irregular
+        verb."""
+        return infinitive in self.regular_verbs or \
+            infinitive in self.irregular_verbs
+
+    def find_verb(self, infinitive: str) -> tuple[int, bool] | None:
+        """Return the id of a known verb and whether it is regular, or None
+        if the verb is unknown."""
+        if infinitive in self.regular_verbs:
+            return self.regular_verbs[infinitive], True
+        if infinitive in self.irregular_verbs:
+            return self.irregular_verbs[infinitive], False
+        return None
+
+    def is_regular(self, infinitive: str) -> bool:
+        """Return True if the infinitive is a known regular verb."""
+        return infinitive in self.regular_verbs
+
+    def get_conjugation(self, infinitive: str, tense: str) -> tuple | None:
+        """Return the six stored forms of an irregular verb in a tense, or
+        None if the verb has no stored forms for it."""
+        if infinitive not in self.irregular_verbs:
+            return None
+        return self.conjugations.get((infinitive, tense))
+
+    def get_participles(self, infinitive: str) -> tuple | None:
+        """Return the stored (present, past) participles of an irregular
+        verb, or None if the verb has none."""
+        if infinitive not in self.irregular_verbs:
+            return None
+        return self.participles.get(infinitive)
+
+
+class DictSource(MemorySource):
+    def __init__(self, irregular_verbs: dict,
+                 regular_verbs: Iterable[str] = (),
+                 patterns: Optional[dict] = None) -> None:
+        """
+        Initialize a source from plain Python data: a dict of irregular
+        infinitives to dicts of tenses to their six forms, with
+        "participles" mapping to the (present, past) participles, and an
+        iterable of regular infinitives. Verbs are numbered from 1 in the
+        order given. patterns maps irregular infinitives whose forms are
+        stored as diffs to their rule patterns.
+
+        Raises:
+            ValueError: if an irregular verb has an invalid pattern.
+        """
+        patterns = patterns or {}
+        super().__init__()
+        tenses = list(dict.fromkeys(
+            tense for conjugations in irregular_verbs.values()
+            for tense in conjugations))
+        tense_ids = {tense: tense_id for tense_id, tense in
+                     enumerate(tenses, 1)}
+
+        conjugation_rows = []
+        for verb_id, conjugations in enumerate(irregular_verbs.values(), 1):
+            for tense, forms in conjugations.items():
+                if tense == 'participles':
+                    forms = (None,) * 6 + tuple(forms)
+                else:
+                    forms = tuple(forms) + (None, None)
+                conjugation_rows.append((verb_id, tense_ids[tense], *forms))
+
+        self.load_rows(enumerate(regular_verbs, 1),
+                       [(verb_id, infinitive, patterns.get(infinitive))
+                        for verb_id, infinitive in
+                        enumerate(irregular_verbs, 1)],
+                       enumerate(tenses, 1), conjugation_rows)
+
+
+class SQLiteSource(MemorySource):
+    def __init__(self, path: str) -> None:
+        """
+        Initialize a source from a SQLite database file with the app's verb
+        tables, reading it once and closing it.
+
+        Raises:
+            ValueError: if an irregular verb has an invalid pattern.
+        """
+        super().__init__()
+        self.path = path
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            self.load_rows(
+                connection.execute(
+                    "SELECT id, infinitive FROM regular_verb ORDER BY id"),
+                connection.execute(
+                    "SELECT id, infinitive, pattern FROM irregular_verb "
+                    "ORDER BY id"),
+                connection.execute("SELECT id, name FROM tense ORDER BY id"),
+                connection.execute(
+                    f"SELECT verb_id, tense_id, "
+                    f"{', '.join(PRONOUN_ATTRIBUTES)}, present_participle, "
+                    f"past_participle FROM conjugation ORDER BY id"))
+        finally:
+            connection.close()
@@ -0,0 +1,14 @@
+from .utils import (
+    PRONOUNS, PRONOUN_INDEX, is_valid_pronoun, is_well_formed_infinitive,
+    has_form, get_present_participle, get_past_participle
+)
+from .tenses import (
+    TENSE_DESCRIPTORS, TENSES_BY_NAME, TENSE_NAMES, COMPOUND_TENSES,
+    TenseDescriptor, get_tense, is_valid_tense
+)
+
+__all__ = ['PRONOUNS', 'PRONOUN_INDEX', 'is_valid_tense', 'is_valid_pronoun',
+           'is_well_formed_infinitive', 'has_form',
+           'get_present_participle', 'get_past_participle',
+           'TENSE_DESCRIPTORS', 'TENSES_BY_NAME', 'TENSE_NAMES',
+           'COMPOUND_TENSES', 'TenseDescriptor', 'get_tense']
@@ -0,0 +1,301 @@
+from typing import Optional, TYPE_CHECKING
+
+from .utils import (PRONOUNS, PRONOUN_INDEX, get_present_participle,
+                    get_past_participle)
+
+if TYPE_CHECKING:
+    from ..verb import Verb
+
+# Regular suffixes of the simple tenses in PRONOUNS order, attached to the
+# stem (None for the imperative "yo")
+_STEM_SUFFIXES = {
+    "ar": {
+        "present": ("o", "as", "a", None, "áis", "an"),
+        "preterite": ("é", "aste", "ó", "amos", "asteis", "aron"),
+        "imperfect": ("aba", "abas", "aba", "ábamos", "abais", "aban"),
+        "present_subjunctive": ("e", "es", "e", "emos", "éis", "en"),
+        "imperfect_subjunctive_ra": ("ara", "aras", "ara", "áramos",
+                                     "arais", "aran"),
+        "imperfect_subjunctive_se": ("ase", "ases", "ase", "ásemos",
+                                     "aseis", "asen"),
+        "affirmative_imperative": (None, "a", "e", "emos", None, "en"),
+        "negative_imperative": (None, "es", "e", "emos", "éis", "en"),
+    },
+    "er": {
+        "present": ("o", "es", "e", None, "éis", "en"),
+        "preterite": ("í", "iste", "ió", "imos", "isteis", "ieron"),
+        "imperfect": ("ía", "ías", "ía", "íamos", "íais", "ían"),
+        "present_subjunctive": ("a", "as", "a", "amos", "áis", "an"),
+        "imperfect_subjunctive_ra": ("iera", "ieras", "iera", "iéramos",
+                                     "ierais", "ieran"),
+        "imperfect_subjunctive_se": ("iese", "ieses", "iese", "iésemos",
+                                     "ieseis", "iesen"),
+        "affirmative_imperative": (None, "e", "a", "amos", None, "an"),
+        "negative_imperative": (None, "as", "a", "amos", "áis", "an"),
+    },
+}
+_STEM_SUFFIXES["ir"] = dict(_STEM_SUFFIXES["er"],
+                            present=("o", "es", "e", None, "ís", "en"))
+
+# Cells attached to the infinitive without its final "r"
+_THEME_SUFFIXES = {
+    ("present", 3): "mos",
+    ("affirmative_imperative", 4): "d",
+}
+
+# Suffixes of the tenses attached to the whole infinitive, for every ending
+_INFINITIVE_SUFFIXES = {
+    "conditional": ("ía", "ías", "ía", "íamos", "íais", "ían"),
+    "future": ("é", "ás", "á", "emos", "éis", "án"),
+}
+
+_PREFIXES = {"negative_imperative": "no "}
+
+
+def _build_suffix_table() -> dict:
+    """
+    Return the regular simple tense cells keyed by (ending, tense), each a
+    tuple indexed by pronoun index of (prefix, letters trimmed from the end
+    of the infinitive, suffix) or None.
+    """
+    table = {}
+    for ending, tenses in _STEM_SUFFIXES.items():
+        for tense, suffixes in (tenses | _INFINITIVE_SUFFIXES).items():
+            trim = 0 if tense in _INFINITIVE_SUFFIXES else 2
+            prefix = _PREFIXES.get(tense, "")
+            table[(ending, tense)] = tuple(
+                (prefix, 1, _THEME_SUFFIXES[(tense, index)])
+                if (tense, index) in _THEME_SUFFIXES
+                else None if suffix is None
+                else (prefix, trim, suffix)
+                for index, suffix in enumerate(suffixes))
+    return table
+
+
+SUFFIX_TABLE = _build_suffix_table()
+
+SIMPLE_TENSES = ("present", "preterite", "imperfect", "conditional",
+                 "future", "present_subjunctive", "imperfect_subjunctive_ra",
+                 "imperfect_subjunctive_se", "affirmative_imperative",
+                 "negative_imperative")
+
+# Auxiliary verb forms of the compound tenses in PRONOUNS order
+AUXILIARY_FORMS = {
+    "present_progressive": ("estoy", "estás", "está", "estamos", "estáis",
+                            "están"),
+    "past_progressive": ("estaba", "estabas", "estaba", "estábamos",
+                         "estabais", "estaban"),
+    "present_perfect": ("he", "has", "ha", "hemos", "habéis", "han"),
+    "pluperfect": ("había", "habías", "había", "habíamos", "habíais",
+                   "habían"),
+    "future_perfect": ("habré", "habrás", "habrá", "habremos", "habréis",
+                       "habrán"),
+    "present_perfect_subjunctive": ("haya", "hayas", "haya", "hayamos",
+                                    "hayáis", "hayan"),
+    "pluperfect_subjunctive_ra": ("hubiera", "hubieras", "hubiera",
+                                  "hubiéramos", "hubierais", "hubieran"),
+    "pluperfect_subjunctive_se": ("hubiese", "hubieses", "hubiese",
+                                  "hubiésemos", "hubieseis", "hubiesen"),
+}
+
+ALL_TENSES = SIMPLE_TENSES[:8] + tuple(AUXILIARY_FORMS) + SIMPLE_TENSES[8:]
+
+
+def _get_suffix_row(infinitive: str, tense: str) -> tuple:
+    """Return the suffix table row of a verb in a simple tense, treating
+    anything other than -ar and -er like -ir."""
+    row = SUFFIX_TABLE.get((infinitive[-2:], tense))
+    return row if row is not None else SUFFIX_TABLE[("ir", tense)]
+
+
+def _conjugate_simple(verb: 'Verb', tense: str, pronoun: str) -> str | None:
+    """Return the regular form of a verb in a simple tense, or None if the
+    pronoun has no form in that tense."""
+    infinitive = verb.infinitive
+    index = PRONOUN_INDEX.get(pronoun)
+    cell = None if index is None else \
+        _get_suffix_row(infinitive, tense)[index]
+    if cell is None:
+        return None
+    prefix, trim, suffix = cell
+    return prefix + infinitive[:len(infinitive) - trim] + suffix
+
+
+def conjugate_present(verb: 'Verb', pronoun: str) -> str:
+    """Return the conjugated present tense form of a regular verb."""
+    return _conjugate_simple(verb, "present", pronoun)
+
+
+def conjugate_preterite(verb: 'Verb', pronoun: str) -> str:
+    """Return the conjugated preterite tense form of a regular verb."""
+    return _conjugate_simple(verb, "preterite", pronoun)
+
+
+def conjugate_imperfect(verb: 'Verb', pronoun: str) -> str:
+    """Return the conjugated imperfect tense form of a regular verb."""
+    return _conjugate_simple(verb, "imperfect", pronoun)
+
+
+def conjugate_conditional(verb: 'Verb', pronoun: str) -> str:
+    """Return the conjugated conditional tense form of a regular verb."""
+    return _conjugate_simple(verb, "conditional", pronoun)
+
+
+def conjugate_future(verb: 'Verb', pronoun: str) -> str:
+    """Return the conjugated future tense form of a regular verb."""
+    return _conjugate_simple(verb, "future", pronoun)
+
+
+def conjugate_present_subjunctive(verb: 'Verb', pronoun: str) -> str:
+    """Return the conjugated present subjunctive tense form of a regular
+    verb."""
+    return _conjugate_simple(verb, "present_subjunctive", pronoun)
+
+
+def conjugate_imperfect_subjunctive_ra(verb: 'Verb', pronoun: str) -> str:
+    """Return the conjugated imperfect subjunctive (-ra) tense form of a
+    regular verb."""
+    return _conjugate_simple(verb, "imperfect_subjunctive_ra", pronoun)
+
+
+def conjugate_imperfect_subjunctive_se(verb: 'Verb', pronoun: str) -> str:
+    """Return the conjugated imperfect subjunctive (-se) tense form of a
+    regular verb."""
+    return _conjugate_simple(verb, "imperfect_subjunctive_se", pronoun)
+
+
+def conjugate_affirmative_imperative(verb: 'Verb', pronoun: str) -> str:
+    """Return the conjugated affirmative imperative tense form of a regular
+    verb."""
+    return _conjugate_simple(verb, "affirmative_imperative", pronoun)
+
+
+def conjugate_negative_imperative(verb: 'Verb', pronoun: str) -> str:
+    """Return the conjugated negative imperative tense form of a regular
+    verb."""
+    return _conjugate_simple(verb, "negative_imperative", pronoun)
+
+
+def _conjugate_compound(tense: str, pronoun: str, participle: str) -> str:
+    """Return a compound tense form from the shared auxiliary forms of the
+    tense and a participle."""
+    return f"{AUXILIARY_FORMS[tense][PRONOUN_INDEX[pronoun]]} {participle}"
+
+
+def conjugate_present_progressive(verb: 'Verb', pronoun: str,
+                                  participle: Optional[str] = None) -> str:
+    """Return the conjugated present progressive tense form of a verb."""
+    participle = participle or get_present_participle(verb)
+    return _conjugate_compound("present_progressive", pronoun, participle)
+
+
+def conjugate_past_progressive(verb: 'Verb', pronoun: str,
+                               participle: Optional[str] = None) -> str:
+    """Return the conjugated past progressive tense form of a verb."""
+    participle = participle or get_present_participle(verb)
+    return _conjugate_compound("past_progressive", pronoun, participle)
+
+
+def conjugate_present_perfect(verb: 'Verb', pronoun: str,
+                              participle: Optional[str] = None) -> str:
+    """Return the conjugated present perfect tense form of a verb."""
+    participle = participle or get_past_participle(verb)
+    return _conjugate_compound("present_perfect", pronoun, participle)
+
+
+def conjugate_pluperfect(verb: 'Verb', pronoun: str,
+                         participle: Optional[str] = None) -> str:
+    """Return the conjugated pluperfect tense form of a verb."""
+    participle = participle or get_past_participle(verb)
+    return _conjugate_compound("pluperfect", pronoun, participle)
+
+
+def conjugate_future_perfect(verb: 'Verb', pronoun: str,
+                             participle: Optional[str] = None) -> str:
+    """Return the conjugated future perfect tense form of a verb."""
+    participle = participle or get_past_participle(verb)
+    return _conjugate_compound("future_perfect", pronoun, participle)
+
+
+def conjugate_present_perfect_subjunctive(verb: 'Verb', pronoun: str,
+                                          participle: Optional[str]
+                                          = None) -> str:
+    """Return the conjugated present perfect subjunctive tense form of a
+    verb."""
+    participle = participle or get_past_participle(verb)
+    return _conjugate_compound("present_perfect_subjunctive", pronoun,
+                               participle)
+
+
+def conjugate_pluperfect_subjunctive_ra(verb: 'Verb', pronoun: str,
+                                        participle: Optional[str]
+                                        = None) -> str:
+    """Return the conjugated pluperfect subjunctive (-ra) tense form of a
+    verb."""
+    participle = participle or get_past_participle(verb)
+    return _conjugate_compound("pluperfect_subjunctive_ra", pronoun,
+                               participle)
+
+
+def conjugate_pluperfect_subjunctive_se(verb: 'Verb', pronoun: str,
+                                        participle: Optional[str]
+                                        = None) -> str:
+    """Return the conjugated pluperfect subjunctive (-se) tense form of a
+    verb."""
+    participle = participle or get_past_participle(verb)
+    return _conjugate_compound("pluperfect_subjunctive_se", pronoun,
+                               participle)
+
+
+def conjugate_paradigm(verb: 'Verb', tenses: Optional[list[str]] = None,
+                       pronouns: Optional[list[str]] = None) -> dict:
+    """
+    Return the regular conjugation table of a verb as a dict of tenses to
+    dicts of pronouns to forms, with None where a pronoun has no form.
+
+    Raises:
+        ValueError: if a tense is invalid.
+    """
+    tenses = ALL_TENSES if tenses is None else tenses
+    pronouns = PRONOUNS if pronouns is None else pronouns
+    indexes = [PRONOUN_INDEX.get(pronoun) for pronoun in pronouns]
+    infinitive = verb.infinitive
+    bases = (infinitive, infinitive[:-1], infinitive[:-2])
+    participles = {}
+
+    table = {}
+    for tense in tenses:
+        if tense in AUXILIARY_FORMS:
+            progressive = "progressive" in tense
+            if progressive not in participles:
+                participles[progressive] = " " + (
+                    get_present_participle(verb) if progressive
+                    else get_past_participle(verb))
+            aux_forms = AUXILIARY_FORMS[tense]
+            participle = participles[progressive]
+            table[tense] = {
+                pronoun: None if index is None
+                else aux_forms[index] + participle
+                for pronoun, index in zip(pronouns, indexes)}
+        elif tense in SIMPLE_TENSES:
+            row = _get_suffix_row(infinitive, tense)
+            forms = table[tense] = {}
+            for pronoun, index in zip(pronouns, indexes):
+                cell = None if index is None else row[index]
+                forms[pronoun] = None if cell is None else \
+                    cell[0] + bases[cell[1]] + cell[2]
+        else:
+            raise ValueError(f"Invalid tense: {tense}")
+    return table
+
+
+def conjugate_many(verbs: list['Verb'], tenses: Optional[list[str]] = None,
+                   pronouns: Optional[list[str]] = None) -> list[dict]:
+    """
+    Return the regular conjugation tables of several verbs, in the order of
+    the verbs, each shaped like the result of conjugate_paradigm.
+
+    Raises:
+        ValueError: if a tense is invalid.
+    """
+    return [conjugate_paradigm(verb, tenses, pronouns) for verb in verbs]
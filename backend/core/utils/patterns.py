@@ -0,0 +1,237 @@
+from itertools import product
+from typing import Optional
+
+from .conjugate import SIMPLE_TENSES, _get_suffix_row
+
+# Pattern name of a verb whose stored cells are diffs against the plain
+# regular rules
+REGULAR_PATTERN = "regular"
+
+# Stem vowel changes as (vowel, change where the stem is stressed, change
+# in the unstressed cells of -ir verbs or None)
+STEM_CHANGES = {
+    "e>ie": ("e", "ie", "i"),
+    "o>ue": ("o", "ue", "u"),
+    "e>i": ("e", "i", "i"),
+    "u>ue": ("u", "ue", None),
+}
+
+# Spelling changes to the end of the stem as (letters, replacement, first
+# letters of the suffixes that trigger it, infinitive endings it applies to)
+SPELLING_CHANGES = {
+    "car": ("c", "qu", "eé", ("car",)),
+    "gar": ("g", "gu", "eé", ("gar",)),
+    "zar": ("z", "c", "eé", ("zar",)),
+    "g>j": ("g", "j", "aoáó", ("ger", "gir")),
+    "gu>g": ("gu", "g", "aoáó", ("guir",)),
+    "c>z": ("c", "z", "aoáó", ("cer", "cir")),
+    "c>zc": ("c", "zc", "aoáó", ("cer", "cir")),
+}
+
+# Pronoun indexes of the cells whose stem is stressed, by tense
+_STRESSED_CELLS = {
+    "present": {0, 1, 2, 5},
+    "present_subjunctive": {0, 1, 2, 5},
+    "affirmative_imperative": {1, 2, 5},
+    "negative_imperative": {1, 2, 5},
+}
+
+# Pronoun indexes of the unstressed cells that still change in -ir verbs,
+# by tense
+_UNSTRESSED_CELLS = {
+    "preterite": {2, 5},
+    "present_subjunctive": {3, 4},
+    "imperfect_subjunctive_ra": set(range(6)),
+    "imperfect_subjunctive_se": set(range(6)),
+    "affirmative_imperative": {3},
+    "negative_imperative": {3, 4},
+}
+
+
+def parse_pattern(pattern: str) -> tuple[str, ...]:
+    """
+    Returns the rules of a pattern, written as rule names joined by "+",
+    such as "e>ie+zar", or "regular" for none.
+
+    Raises:
+        ValueError: if the pattern contains an unknown rule.
+    """
+    if pattern == REGULAR_PATTERN:
+        return ()
+    rules = tuple(pattern.split("+"))
+    if not all(rule in STEM_CHANGES or rule in SPELLING_CHANGES
+               for rule in rules):
+        raise ValueError(f"Invalid pattern: {pattern}")
+    return rules
+
+
+def _change_stem(infinitive: str, stem: str, rules: tuple,
+                 stressed: bool) -> str:
+    """Returns the stem with its last matching vowel changed, if a stem
+    change rule applies to the cell."""
+    for rule in rules:
+        if rule not in STEM_CHANGES:
+            continue
+        vowel, strong, weak = STEM_CHANGES[rule]
+        change = strong if stressed else \
+            weak if infinitive.endswith("ir") else None
+        index = stem.rfind(vowel)
+        if change and index != -1:
+            return stem[:index] + change + stem[index + len(vowel):]
+    return stem
+
+
+def _change_spelling(stem: str, rules: tuple, suffix: str) -> str:
+    """Returns the stem with its ending respelled, if a spelling change rule
+    applies before the suffix."""
+    for rule in rules:
+        if rule not in SPELLING_CHANGES:
+            continue
+        letters, replacement, triggers, _ = SPELLING_CHANGES[rule]
+        if suffix[:1] in triggers and stem.endswith(letters):
+            return stem[:-len(letters)] + replacement
+    return stem
+
+
+def predict_conjugation(infinitive: str, tense: str,
+                        pattern: str = REGULAR_PATTERN) -> tuple:
+    """
+    Returns the six forms of a verb in a simple tense as predicted by the
+    regular rules and a pattern, with None where a pronoun has no form.
+
+    Raises:
+        ValueError: if the pattern contains an unknown rule.
+    """
+    rules = parse_pattern(pattern)
+    forms = []
+    for index, cell in enumerate(_get_suffix_row(infinitive, tense)):
+        if cell is None:
+            forms.append(None)
+            continue
+        prefix, trim, suffix = cell
+        base = infinitive[:len(infinitive) - trim]
+        if trim == 2 and rules:
+            stressed = index in _STRESSED_CELLS.get(tense, ())
+            if stressed or index in _UNSTRESSED_CELLS.get(tense, ()):
+                base = _change_stem(infinitive, base, rules, stressed)
+            base = _change_spelling(base, rules, suffix)
+        forms.append(prefix + base + suffix)
+    return tuple(forms)
+
+
+def predict_participles(infinitive: str,
+                        pattern: str = REGULAR_PATTERN) -> tuple[str, str]:
+    """
+    Returns the (present, past) participles of a verb as predicted by the
+    regular rules and a pattern.
+
+    Raises:
+        ValueError: if the pattern contains an unknown rule.
+    """
+    stem, is_ar = infinitive[:-2], infinitive.endswith("ar")
+    present_stem = _change_stem(infinitive, stem, parse_pattern(pattern),
+                                False)
+    return (present_stem + ("ando" if is_ar else "iendo"),
+            stem + ("ado" if is_ar else "ido"))
+
+
+def merge_forms(stored: Optional[tuple], predicted: tuple) -> tuple:
+    """Returns the stored forms with each missing form filled in from the
+    predicted forms."""
+    if stored is None:
+        return tuple(predicted)
+    return tuple(predicted[index] if form is None else form
+                 for index, form in enumerate(stored))
+
+
+def diff_forms(forms: tuple, predicted: tuple) -> tuple:
+    """Returns the forms with None in place of each form that matches the
+    predicted form."""
+    return tuple(None if form == prediction else form
+                 for form, prediction in zip(forms, predicted))
+
+
+def rebuild_paradigm(infinitive: str, pattern: Optional[str],
+                     conjugations: dict,
+                     participles: Optional[tuple]) -> tuple[dict, tuple]:
+    """
+    Returns the full stored paradigm of an irregular verb from its stored
+    diffs, as a dict of tenses to six forms and its participles. Verbs
+    without a pattern store complete rows, which are returned unchanged.
+
+    Raises:
+        ValueError: if the pattern contains an unknown rule.
+    """
+    if pattern is None:
+        return conjugations, participles
+    rebuilt = dict(conjugations)
+    for tense in SIMPLE_TENSES:
+        rebuilt[tense] = merge_forms(
+            conjugations.get(tense),
+            predict_conjugation(infinitive, tense, pattern))
+    return rebuilt, merge_forms(participles,
+                                predict_participles(infinitive, pattern))
+
+
+def diff_paradigm(infinitive: str, pattern: str, conjugations: dict,
+                  participles: tuple) -> dict:
+    """
+    Returns the forms of a verb that a pattern does not predict, as a dict
+    of tenses to six forms and "participles" to the (present, past)
+    participles, with None for each predicted form.
+
+    Raises:
+        ValueError: if the pattern contains an unknown rule.
+    """
+    diffs = {tense: diff_forms(forms, predict_conjugation(
+                 infinitive, tense, pattern))
+             for tense, forms in conjugations.items()}
+    diffs['participles'] = diff_forms(
+        participles, predict_participles(infinitive, pattern))
+    return diffs
+
+
+def get_candidate_patterns(infinitive: str) -> list[str]:
+    """Returns the patterns that could apply to an infinitive, with the
+    fewest rules first."""
+    spellings = [rule for rule, change in SPELLING_CHANGES.items()
+                 if infinitive.endswith(change[3])]
+    candidates = []
+    for stem_rule, spelling in product([None, *STEM_CHANGES],
+                                       [None, *spellings]):
+        rules = [rule for rule in (stem_rule, spelling) if rule]
+        candidates.append("+".join(rules) or REGULAR_PATTERN)
+    return sorted(candidates, key=lambda candidate: candidate.count("+") +
+                  (candidate != REGULAR_PATTERN))
+
+
+def classify_verb(infinitive: str, conjugations: dict,
+                  participles: Optional[tuple] = None) -> str | None:
+    """
+    Returns the pattern that leaves the fewest stored forms of an irregular
+    verb once predicted forms are removed, or None if every pattern would
+    fill in a form the verb does not have.
+    """
+    best, best_count = None, None
+    for pattern in get_candidate_patterns(infinitive):
+        predicted = {tense: predict_conjugation(infinitive, tense, pattern)
+                     for tense in conjugations}
+        if participles is not None:
+            predicted['participles'] = predict_participles(infinitive,
+                                                           pattern)
+        stored = dict(conjugations)
+        if participles is not None:
+            stored['participles'] = participles
+
+        # A missing form cannot be stored as a diff, so it must be predicted
+        # to be missing too
+        if any(form is None and predicted[tense][index] is not None
+               for tense, forms in stored.items()
+               for index, form in enumerate(forms)):
+            continue
+        count = sum(form is not None
+                    for tense, forms in stored.items()
+                    for form in diff_forms(forms, predicted[tense]))
+        if best_count is None or count < best_count:
+            best, best_count = pattern, count
+    return best
@@ -0,0 +1,89 @@
+# Reflexive pronouns in PRONOUNS order
+REFLEXIVE_PRONOUNS = ("me", "te", "se", "nos", "os", "se")
+
+_STRONG_VOWELS = "aeoáéíóú"
+_VOWELS = _STRONG_VOWELS + "iuü"
+_ACCENTS = {"a": "á", "e": "é", "i": "í", "o": "ó", "u": "ú"}
+_UNACCENTED = str.maketrans("áéíóú", "aeiou")
+
+
+def is_reflexive_infinitive(infinitive: str) -> bool:
+    """Returns True if the given infinitive is a verb infinitive followed by
+    the reflexive pronoun "se"; otherwise, returns False."""
+    return infinitive.endswith("se") and \
+        infinitive[-4:-2] in ("ar", "er", "ir", "ír")
+
+
+def _get_nuclei(word: str) -> list[tuple[int, int]]:
+    """Returns the (start, end) indexes of the vowel nuclei of a word, where
+    two strong vowels are split and any other vowels run together."""
+    nuclei = []
+    for index, letter in enumerate(word):
+        if letter not in _VOWELS:
+            continue
+        # The u of "que", "qui", "gue", and "gui" is silent
+        if letter == "u" and index > 0 and word[index - 1] in "qg" and \
+                word[index + 1:index + 2] in ("e", "i", "é", "í"):
+            continue
+        previous = word[index - 1] if index > 0 else ""
+        if nuclei and nuclei[-1][1] == index and not (
+                letter in _STRONG_VOWELS and previous in _STRONG_VOWELS):
+            nuclei[-1] = (nuclei[-1][0], index + 1)
+        else:
+            nuclei.append((index, index + 1))
+    return nuclei
+
+
+def _get_stressed_vowel(word: str) -> int:
+    """Returns the index of the stressed vowel of a word, following the
+    written accent or the default stress rules."""
+    for index, letter in enumerate(word):
+        if letter in "áéíóú":
+            return index
+    nuclei = _get_nuclei(word)
+    position = -2 if len(nuclei) > 1 and word[-1] in _VOWELS + "ns" else -1
+    start, end = nuclei[position]
+    strong = [index for index in range(start, end)
+              if word[index] in _STRONG_VOWELS]
+    return strong[0] if strong else end - 1
+
+
+def attach_enclitic(form: str, clitic: str, trim: int = 0) -> str:
+    """
+    Returns a verb form with its last trim letters dropped and a clitic
+    pronoun attached to its end, writing an accent where needed to keep the
+    stress on the same vowel.
+    """
+    stressed = _get_stressed_vowel(form)
+    form = form[:len(form) - trim]
+    # An accent on a weak vowel splits a diphthong, so it is kept
+    if any(letter in "íú" for letter in form) and len(_get_nuclei(form)) > 1:
+        return form + clitic
+
+    word = form.translate(_UNACCENTED) + clitic
+    if _get_stressed_vowel(word) == stressed:
+        return word
+    return word[:stressed] + _ACCENTS[word[stressed]] + word[stressed + 1:]
+
+
+def make_reflexive(form: str | None, tense: str, pronoun_index: int,
+                   infinitive: str) -> str | None:
+    """
+    Returns the reflexive form of a conjugated verb form for a pronoun
+    index, given the infinitive of the base verb, or None if there is no
+    form.
+    """
+    if form is None:
+        return None
+    clitic = REFLEXIVE_PRONOUNS[pronoun_index]
+
+    if tense == "affirmative_imperative":
+        # Drop the final s of nosotros and the final d of vosotros, except
+        # in "idos"
+        trim = (pronoun_index == 3 and form.endswith("s")) or (
+            pronoun_index == 4 and form.endswith("d") and infinitive != "ir")
+        return attach_enclitic(form, clitic, int(trim))
+
+    if tense == "negative_imperative" and form.startswith("no "):
+        return f"no {clitic} {form[3:]}"
+    return f"{clitic} {form}"
@@ -0,0 +1,53 @@
+from types import MappingProxyType
+from typing import Callable, NamedTuple, Optional
+
+from . import conjugate
+from .conjugate import ALL_TENSES, AUXILIARY_FORMS
+
+
+class TenseDescriptor(NamedTuple):
+    """Everything needed to validate and conjugate a tense."""
+    id: int
+    name: str
+    compound: bool
+    # Auxiliary verb forms in PRONOUNS order, or None for simple tenses
+    auxiliary_forms: Optional[tuple]
+    # "present" or "past" for compound tenses, or None for simple tenses
+    participle: Optional[str]
+    function: Callable
+
+
+def _build_descriptors() -> tuple[TenseDescriptor, ...]:
+    """Return a descriptor for every tense, with ids in ALL_TENSES order."""
+    descriptors = []
+    for tense_id, name in enumerate(ALL_TENSES):
+        compound = name in AUXILIARY_FORMS
+        participle = None
+        if compound:
+            participle = "present" if "progressive" in name else "past"
+        descriptors.append(TenseDescriptor(
+            tense_id, name, compound, AUXILIARY_FORMS.get(name), participle,
+            getattr(conjugate, f"conjugate_{name}")))
+    return tuple(descriptors)
+
+
+TENSE_DESCRIPTORS = _build_descriptors()
+
+TENSES_BY_NAME = MappingProxyType(
+    {descriptor.name: descriptor for descriptor in TENSE_DESCRIPTORS})
+
+TENSE_NAMES = frozenset(TENSES_BY_NAME)
+
+COMPOUND_TENSES = frozenset(
+    descriptor.name for descriptor in TENSE_DESCRIPTORS
+    if descriptor.compound)
+
+
+def get_tense(tense: str) -> TenseDescriptor | None:
+    """Returns the descriptor of the given tense, or None if it is invalid."""
+    return TENSES_BY_NAME.get(tense) if isinstance(tense, str) else None
+
+
+def is_valid_tense(tense: str) -> bool:
+    """Returns True if the given tense is valid; otherwise, returns False."""
+    return isinstance(tense, str) and tense in TENSE_NAMES
@@ -0,0 +1,43 @@
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..verb import Verb
+
+PRONOUNS = ["yo", "tú", "él/ella/Ud.", "nosotros", "vosotros",
+            "ellos/ellas/Uds."]
+
+PRONOUN_INDEX = {pronoun: index for index, pronoun in enumerate(PRONOUNS)}
+
+# Lowercase Spanish letters ending in -ar, -er, or -ir, at least four long
+_INFINITIVE_PATTERN = re.compile(r"[a-zñáéíóúü]{2,}[aei]r")
+
+
+def is_well_formed_infinitive(infinitive: str) -> bool:
+    """Returns True if the given string looks like a regular -ar, -er, or
+    -ir infinitive; otherwise, returns False."""
+    return isinstance(infinitive, str) and \
+        _INFINITIVE_PATTERN.fullmatch(infinitive) is not None
+
+
+def is_valid_pronoun(pronoun: str) -> bool:
+    """Returns True if the given pronoun is valid; otherwise, returns False."""
+    return pronoun in PRONOUNS
+
+
+def has_form(tense: str, pronoun: str) -> bool:
+    """Returns True if the given tense has a form for the given pronoun;
+    otherwise, returns False. The imperative has no "yo" form."""
+    return not (pronoun == "yo" and "imperative" in tense)
+
+
+def get_present_participle(verb: 'Verb') -> str:
+    """Returns the regular present participle for the given verb."""
+    infinitive, stem = verb.infinitive, verb.stem
+    return stem + ("ando" if verb.ending == "ar" else "iendo")
+
+
+def get_past_participle(verb: 'Verb') -> str:
+    """Returns the regular past participle for the given verb."""
+    infinitive, stem = verb.infinitive, verb.stem
+    return stem + ("ado" if verb.ending == "ar" else "ido")
@@ -0,0 +1,154 @@
+from typing import Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .conjugate import ALL_TENSES, AUXILIARY_FORMS, SUFFIX_TABLE
+from .utils import PRONOUNS
+
+ENDINGS = ("ar", "er", "ir")
+
+# Regular participle suffixes by ending, attached to the stem
+_PARTICIPLE_SUFFIXES = {
+    "ar": ("ando", "ado"),
+    "er": ("iendo", "ido"),
+    "ir": ("iendo", "ido"),
+}
+
+
+def _require_numpy() -> None:
+    """
+    Raises:
+        ImportError: if NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for vectorized conjugation")
+
+
+def _build_cells(tenses: Sequence[str]) -> tuple:
+    """
+    Return (prefix, trim, suffix, mask) arrays of shape (endings, tenses,
+    pronouns) describing every regular cell, where trim is the number of
+    letters trimmed from the infinitive and mask marks cells with a form.
+
+    Raises:
+        ValueError: if a tense is invalid.
+    """
+    shape = (len(ENDINGS), len(tenses), len(PRONOUNS))
+    prefixes = np.full(shape, "", dtype=object)
+    trims = np.zeros(shape, dtype=np.intp)
+    suffixes = np.full(shape, "", dtype=object)
+    mask = np.zeros(shape, dtype=bool)
+
+    for e, ending in enumerate(ENDINGS):
+        for t, tense in enumerate(tenses):
+            if tense in AUXILIARY_FORMS:
+                participle = _PARTICIPLE_SUFFIXES[ending][
+                    0 if "progressive" in tense else 1]
+                for p, aux_form in enumerate(AUXILIARY_FORMS[tense]):
+                    prefixes[e, t, p] = aux_form + " "
+                    trims[e, t, p] = 2
+                    suffixes[e, t, p] = participle
+                    mask[e, t, p] = True
+            elif (ending, tense) in SUFFIX_TABLE:
+                for p, cell in enumerate(SUFFIX_TABLE[(ending, tense)]):
+                    if cell is not None:
+                        prefixes[e, t, p], trims[e, t, p], \
+                            suffixes[e, t, p] = cell
+                        mask[e, t, p] = True
+            else:
+                raise ValueError(f"Invalid tense: {tense}")
+    return (prefixes.astype(str), trims, suffixes.astype(str), mask)
+
+
+def conjugate_matrix(stems: Sequence[str], endings: Sequence[str],
+                     tenses: Optional[Sequence[str]] = None) -> 'np.ndarray':
+    """
+    Return the regular forms of many verbs as a string array of shape
+    (verbs, tenses, pronouns), with an empty string where a pronoun has no
+    form. Endings other than "ar" and "er" are conjugated like "ir".
+
+    Raises:
+        ImportError: if NumPy is not installed.
+        ValueError: if a tense is invalid or the stems and endings differ
+                    in length.
+    """
+    _require_numpy()
+    tenses = ALL_TENSES if tenses is None else tuple(tenses)
+    stems, endings = np.asarray(stems, dtype=str), np.asarray(endings,
+                                                              dtype=str)
+    if stems.shape != endings.shape or stems.ndim != 1:
+        raise ValueError("stems and endings must be sequences of equal "
+                         "length")
+    prefixes, trims, suffixes, mask = _build_cells(tenses)
+
+    # Index each verb's ending, with unknown endings conjugated like "ir"
+    ending_index = np.full(len(endings), ENDINGS.index("ir"), dtype=np.intp)
+    for e, ending in enumerate(ENDINGS):
+        ending_index[endings == ending] = e
+
+    # Bases indexed by trim: infinitive, theme, and stem
+    infinitives = np.char.add(stems, endings)
+    themes = np.char.add(stems, endings.astype("<U1"))
+    bases = np.stack([infinitives, themes, stems], axis=1)
+
+    verb_trims = trims[ending_index].reshape(len(stems), -1)
+    verb_bases = np.take_along_axis(bases, verb_trims, axis=1).reshape(
+        verb_trims.shape[0], len(tenses), len(PRONOUNS))
+    matrix = np.char.add(np.char.add(prefixes[ending_index], verb_bases),
+                         suffixes[ending_index])
+    matrix[~mask[ending_index]] = ""
+    return matrix
+
+
+def apply_overrides(matrix: 'np.ndarray', infinitives: Sequence[str],
+                    conjugations: dict, participles: Optional[dict] = None,
+                    tenses: Optional[Sequence[str]] = None) -> 'np.ndarray':
+    """
+    Scatter stored irregular forms into a matrix from conjugate_matrix and
+    return it, widened if an irregular form is longer than the matrix
+    allows. Stored forms of a compound tense win over the forms built from
+    the verb's stored participles.
+
+    conjugations maps (infinitive, tense) to the six stored forms, and
+    participles maps an infinitive to its stored (present, past)
+    participles, as held by the paradigm store.
+
+    Raises:
+        ImportError: if NumPy is not installed.
+    """
+    _require_numpy()
+    tenses = ALL_TENSES if tenses is None else tuple(tenses)
+    verb_rows = {infinitive: v for v, infinitive in enumerate(infinitives)}
+    tense_columns = {tense: t for t, tense in enumerate(tenses)}
+
+    # Compound forms built from stored participles come first, and a
+    # tense with stored forms keeps them, as in Verb.conjugate
+    verb_indexes, tense_indexes, rows = [], [], []
+    for infinitive, (present, past) in (participles or {}).items():
+        if infinitive not in verb_rows:
+            continue
+        for tense, aux_forms in AUXILIARY_FORMS.items():
+            participle = present if "progressive" in tense else past
+            if tense in tense_columns and participle and \
+                    (infinitive, tense) not in conjugations:
+                verb_indexes.append(verb_rows[infinitive])
+                tense_indexes.append(tense_columns[tense])
+                rows.append([f"{aux_form} {participle}"
+                             for aux_form in aux_forms])
+
+    for (infinitive, tense), forms in conjugations.items():
+        if infinitive in verb_rows and tense in tense_columns:
+            verb_indexes.append(verb_rows[infinitive])
+            tense_indexes.append(tense_columns[tense])
+            rows.append([form or "" for form in forms])
+
+    if not rows:
+        return matrix
+    rows = np.array(rows, dtype=str)
+    if rows.dtype.itemsize > matrix.dtype.itemsize:
+        matrix = matrix.astype(rows.dtype)
+    matrix[verb_indexes, tense_indexes] = rows
+    return matrix
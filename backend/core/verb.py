@@ -0,0 +1,271 @@
+from .languages import get_engine
+from .sources import VerbSource
+from .utils import (PRONOUN_INDEX, get_tense, has_form, is_valid_pronoun,
+                    is_well_formed_infinitive, get_present_participle,
+                    get_past_participle)
+from .utils.reflexive import is_reflexive_infinitive, make_reflexive
+
+
+ENDINGS = ("ar", "er", "ir")
+
+# Resolved data of a verb conjugated by the regular rules without being
+# found in a source, as (id, is_regular, is_verified)
+UNVERIFIED = (None, True, False)
+
+# Sentinel for reflexive forms that have not been derived yet
+_MISSING = object()
+
+
+class Verb:
+    __slots__ = ('_infinitive', '_stem', '_ending', '_is_regular', '_id',
+                 '_source', '_participles', '_is_verified', '_base', '_forms')
+
+    # Code of the language engine that validates the verb's tenses and
+    # pronouns and resolves its infinitives
+    language = "es"
+
+    def __init__(self, infinitive: str, source: VerbSource,
+                 open_vocabulary: bool = False) -> None:
+        """
+        Initialize a Verb object whose stored forms come from a source. With
+        open_vocabulary, a well-formed infinitive missing from the source
+        becomes an unverified regular verb. A reflexive infinitive missing
+        from the source is conjugated from its base verb.
+
+        Raises:
+            ValueError: if the infinitive is not a verb in the source.
+        """
+        key = infinitive.lower()
+        found = self.resolve([key], source, open_vocabulary)
+        if key not in found:
+            raise ValueError(f"Invalid verb: {infinitive}")
+        self._initialize(infinitive, source, *found[key])
+
+    def _initialize(self, infinitive: str, source: VerbSource,
+                    verb_id: int | None, is_regular: bool,
+                    is_verified: bool = True,
+                    is_reflexive: bool = False) -> None:
+        """Set the attributes of a Verb object from its resolved data. A
+        reflexive verb keeps a Verb object for its base verb, whose stem,
+        ending, and participles it shares."""
+        self._base = None
+        self._forms = None
+        if is_reflexive:
+            self._base = self._create(infinitive[:-2], source, verb_id,
+                                      is_regular, is_verified)
+            self._forms = {}
+        base = infinitive[:-2] if is_reflexive else infinitive
+        self._infinitive = infinitive
+        self._stem = base[:-2]
+        self._ending = base[-2:] if base[-2:] in ENDINGS else None
+        self._is_regular = is_regular
+        self._id = verb_id
+        self._source = source
+        self._participles = None
+        self._is_verified = is_verified
+
+    @classmethod
+    def _create(cls, infinitive: str, source: VerbSource,
+                verb_id: int | None, is_regular: bool,
+                is_verified: bool = True,
+                is_reflexive: bool = False) -> 'Verb':
+        """Return a Verb object for an already resolved verb."""
+        verb = cls.__new__(cls)
+        verb._initialize(infinitive, source, verb_id, is_regular,
+                         is_verified, is_reflexive)
+        return verb
+
+    @classmethod
+    def from_source(cls, infinitives: list[str], source: VerbSource,
+                    open_vocabulary: bool = False) -> list['Verb']:
+        """
+        Return Verb objects for a list of infinitives, without duplicates,
+        resolving them with one call to the source. With open_vocabulary,
+        well-formed infinitives missing from the source become unverified
+        regular verbs.
+
+        Raises:
+            ValueError: if infinitives is not a list of strings or contains
+                        invalid verbs, listing every invalid verb.
+        """
+        if not isinstance(infinitives, list) or not all(
+                isinstance(infinitive, str) for infinitive in infinitives):
+            raise ValueError("verbs must be a list of strings")
+
+        keys = list(dict.fromkeys(
+            infinitive.lower() for infinitive in infinitives))
+        found = cls.resolve(keys, source, open_vocabulary)
+        check_verbs_found(keys, found)
+        return [cls._create(key, source, *found[key]) for key in keys]
+
+    @classmethod
+    def resolve(cls, infinitives: list[str], source: VerbSource,
+                open_vocabulary: bool = False) -> dict[str, tuple]:
+        """Return the resolved data of each verb found in a list of
+        lowercase infinitives, with the resolution rules of the verb's
+        language."""
+        return get_engine(cls.language).resolve_verbs(
+            infinitives, source, open_vocabulary)
+
+    @property
+    def infinitive(self) -> str:
+        """Get the infinitive form of the verb."""
+        return self._infinitive
+
+    @property
+    def stem(self) -> str:
+        """Get the stem of a verb."""
+        return self._stem
+
+    @property
+    def ending(self) -> str:
+        """Get the ending of a verb."""
+        return self._ending
+
+    @property
+    def is_regular(self) -> bool:
+        """Return True if the verb is regular, otherwise return False."""
+        return self._is_regular
+
+    @property
+    def id(self) -> int | None:
+        """Get the id of the verb in its source, from the regular verbs if
+        it is regular and the irregular verbs otherwise, or None if it is
+        unverified."""
+        return self._id
+
+    @property
+    def is_verified(self) -> bool:
+        """Return True if the verb was found in its source, or False if it
+        is only conjugated by the regular rules."""
+        return self._is_verified
+
+    @property
+    def is_reflexive(self) -> bool:
+        """Return True if the verb is conjugated from its base verb with
+        reflexive pronouns, otherwise return False."""
+        return self._base is not None
+
+    @property
+    def source(self) -> VerbSource:
+        """Get the source the verb's stored forms come from."""
+        return self._source
+
+    @property
+    def participles(self) -> tuple[str, str]:
+        """Get the (present, past) participles of the verb, resolved once
+        from its stored irregular forms or the regular rules."""
+        if self._base is not None:
+            return self._base.participles
+        if self._participles is None:
+            stored = self._is_verified and self._source.get_participles(
+                self._infinitive.lower())
+            present, past = stored or (None, None)
+            self._participles = (present or get_present_participle(self),
+                                 past or get_past_participle(self))
+        return self._participles
+
+    def conjugate(self, tense: str, pronoun: str) -> str:
+        """
+        Conjugate the verb with a given tense and pronoun.
+
+        Raises:
+            ValueError: if the tense or pronoun is invalid.
+        """
+        # Validate tense and pronoun
+        descriptor = get_tense(tense)
+        if descriptor is None:
+            raise ValueError("Invalid tense")
+        if not is_valid_pronoun(pronoun):
+            raise ValueError("Invalid pronoun")
+
+        # Return error if tense is imperative and pronoun is "yo"
+        if not has_form(tense, pronoun):
+            raise ValueError("No first person conjugation for imperative tense")
+
+        if self._base is not None:
+            return self._conjugate_reflexive(tense, pronoun)
+
+        # Use the stored forms if the source has them
+        forms = self._is_verified and self._source.get_conjugation(
+            self._infinitive.lower(), tense)
+        if forms:
+            return forms[PRONOUN_INDEX[pronoun]]
+
+        if descriptor.compound:
+            # Handle compound tenses with the verb's cached participles
+            present, past = self.participles
+            return descriptor.function(
+                self, pronoun,
+                present if descriptor.participle == "present" else past)
+
+        # Fallback to regular verb conjugation
+        return descriptor.function(self, pronoun)
+
+    def _conjugate_reflexive(self, tense: str, pronoun: str) -> str:
+        """Return the base verb's form with the reflexive pronoun added,
+        deriving each form once and reusing it afterwards."""
+        key = (tense, pronoun)
+        form = self._forms.get(key, _MISSING)
+        if form is _MISSING:
+            form = self._forms.setdefault(key, make_reflexive(
+                self._base.conjugate(tense, pronoun), tense,
+                PRONOUN_INDEX[pronoun], self._base.infinitive.lower()))
+        return form
+
+    def __reduce__(self) -> tuple:
+        """Pickle the verb as its infinitive and source."""
+        return Verb._create, (self._infinitive, self._source, self._id,
+                              self._is_regular, self._is_verified,
+                              self.is_reflexive)
+
+    def __str__(self) -> str:
+        """Get the string representation of the Verb object."""
+        return f"Verb: {self.infinitive}"
+
+
+def resolve_verbs(infinitives: list[str], source: VerbSource,
+                  open_vocabulary: bool = False) -> dict[str, tuple]:
+    """
+    Return the resolved data of each verb found in a list of lowercase
+    infinitives with one call to the source, as (id, is_regular) or
+    (id, is_regular, is_verified, is_reflexive). A reflexive infinitive
+    missing from the source resolves to its base verb, and with
+    open_vocabulary, well-formed infinitives missing from the source become
+    unverified regular verbs.
+    """
+    if not infinitives:
+        return {}
+    bases = {infinitive: infinitive[:-2] for infinitive in infinitives
+             if is_reflexive_infinitive(infinitive)}
+    found = source.find_verbs(list(dict.fromkeys(
+        [*infinitives, *bases.values()])))
+
+    resolved = {}
+    for infinitive in infinitives:
+        base = bases.get(infinitive)
+        if infinitive in found:
+            resolved[infinitive] = found[infinitive]
+        elif base in found:
+            resolved[infinitive] = (*found[base], True, True)
+        elif open_vocabulary and is_well_formed_infinitive(infinitive):
+            resolved[infinitive] = UNVERIFIED
+        elif open_vocabulary and base and is_well_formed_infinitive(base):
+            resolved[infinitive] = (*UNVERIFIED, True)
+    return resolved
+
+
+def check_verbs_found(infinitives: list[str], found: dict) -> None:
+    """
+    Check that every infinitive was found in a source.
+
+    Raises:
+        ValueError: naming the invalid verb, or every invalid verb if there
+                    are several.
+    """
+    invalid = [infinitive for infinitive in infinitives
+               if infinitive not in found]
+    if len(invalid) == 1:
+        raise ValueError(f"Invalid verb: {invalid[0]}")
+    if invalid:
+        raise ValueError(f"Invalid verbs: {', '.join(invalid)}")
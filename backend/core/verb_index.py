@@ -0,0 +1,192 @@
+import re
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from .completion import fold_accents
+from .sources import VerbSource
+from .utils import TENSE_DESCRIPTORS
+from .utils.conjugate import SIMPLE_TENSES
+from .utils.patterns import (STEM_CHANGES, SPELLING_CHANGES, classify_verb,
+                             parse_pattern, predict_conjugation,
+                             predict_participles)
+
+# Every property a filter expression may name
+PROPERTIES = frozenset([
+    "regular", "irregular",
+    *(f"ending:{ending}" for ending in ("ar", "er", "ir")),
+    *(f"irregular:{tense.name}" for tense in TENSE_DESCRIPTORS),
+    *(f"stem:{rule}" for rule in STEM_CHANGES),
+    *(f"spelling:{rule}" for rule in SPELLING_CHANGES),
+])
+
+_TOKEN = re.compile(r"\(|\)|[^\s()]+")
+
+
+def get_verb_properties(infinitive: str, is_regular: bool,
+                        conjugations: Optional[dict] = None,
+                        participles: Optional[tuple] = None) -> set[str]:
+    """
+    Returns the properties of a verb from its stored forms: its ending,
+    whether it is regular, each tense with a form the regular rules would
+    not produce, and the rules of the pattern its forms follow.
+    """
+    # Accented endings such as the "ír" of "sonreír" are -ir verbs
+    properties = {f"ending:{fold_accents(infinitive[-2:])}"} & PROPERTIES
+    if is_regular:
+        return properties | {"regular"}
+    properties.add("irregular")
+
+    conjugations = {tense: forms for tense, forms in
+                    (conjugations or {}).items() if forms}
+    for tense, forms in conjugations.items():
+        if tense in SIMPLE_TENSES and any(
+                form is not None and form != predicted for form, predicted
+                in zip(forms, predict_conjugation(infinitive, tense))):
+            properties.add(f"irregular:{tense}")
+
+    # Compound tenses are irregular where their participle is
+    if participles:
+        irregular = {
+            kind: form is not None and form != predicted for kind, form,
+            predicted in zip(("present", "past"), participles,
+                             predict_participles(infinitive))}
+        properties.update(f"irregular:{tense.name}"
+                          for tense in TENSE_DESCRIPTORS
+                          if tense.compound and irregular[tense.participle])
+
+    pattern = classify_verb(infinitive, conjugations, participles)
+    for rule in parse_pattern(pattern) if pattern else ():
+        kind = "stem" if rule in STEM_CHANGES else "spelling"
+        properties.add(f"{kind}:{rule}")
+    return properties
+
+
+@lru_cache(maxsize=256)
+def parse_filter(expression: str) -> tuple:
+    """
+    Returns the syntax tree of a filter expression, such as
+    "ending:ir and irregular:preterite", made of property names joined by
+    "and", "or", and "not" with parentheses. Each node is a property name
+    or a tuple of an operator and its operands.
+
+    Raises:
+        ValueError: if the expression is empty, malformed, or names an
+                    unknown property.
+    """
+    tokens = [token.lower() for token in _TOKEN.findall(expression)]
+    position = 0
+
+    def peek() -> str | None:
+        return tokens[position] if position < len(tokens) else None
+
+    def take() -> str:
+        nonlocal position
+        token = peek()
+        if token is None:
+            raise ValueError("Incomplete filter")
+        position += 1
+        return token
+
+    def parse_or() -> tuple | str:
+        node = parse_and()
+        while peek() == "or":
+            take()
+            node = ("or", node, parse_and())
+        return node
+
+    def parse_and() -> tuple | str:
+        node = parse_not()
+        while peek() == "and":
+            take()
+            node = ("and", node, parse_not())
+        return node
+
+    def parse_not() -> tuple | str:
+        token = take()
+        if token == "not":
+            return "not", parse_not()
+        if token == "(":
+            node = parse_or()
+            if take() != ")":
+                raise ValueError("Missing closing parenthesis in filter")
+            return node
+        if token not in PROPERTIES:
+            raise ValueError(f"Unknown filter property: {token}")
+        return token
+
+    tree = parse_or()
+    if peek() is not None:
+        raise ValueError(f"Unexpected token in filter: {peek()}")
+    return tree
+
+
+class VerbIndex:
+    def __init__(self, verbs: Iterable[tuple[str, set[str]]]) -> None:
+        """
+        Initialize an index of verbs from (infinitive, properties) pairs,
+        keeping one bitset per property over the verbs' positions in sorted
+        order. Bitsets are Python integers, so filters combine whole
+        properties with single bitwise operations.
+        """
+        verbs = sorted(verbs)
+        self.infinitives = [infinitive for infinitive, _ in verbs]
+        self.all = (1 << len(verbs)) - 1
+        self.bitsets = dict.fromkeys(PROPERTIES, 0)
+        for position, (_, properties) in enumerate(verbs):
+            for name in properties:
+                self.bitsets[name] |= 1 << position
+
+    @classmethod
+    def from_source(cls, source: VerbSource) -> 'VerbIndex':
+        """Return an index of every verb in a source, reading the stored
+        forms of its irregular verbs."""
+        verbs = []
+        for infinitive, is_regular in source.iter_verbs():
+            conjugations = participles = None
+            if not is_regular:
+                conjugations = {
+                    tense: source.get_conjugation(infinitive, tense)
+                    for tense in SIMPLE_TENSES}
+                participles = source.get_participles(infinitive)
+            verbs.append((infinitive, get_verb_properties(
+                infinitive, is_regular, conjugations, participles)))
+        return cls(verbs)
+
+    def __len__(self) -> int:
+        """Return the number of verbs in the index."""
+        return len(self.infinitives)
+
+    def evaluate(self, expression: str) -> int:
+        """
+        Return the bitset of the verbs matching a filter expression.
+
+        Raises:
+            ValueError: if the expression is invalid.
+        """
+        def evaluate_node(node: tuple | str) -> int:
+            if isinstance(node, str):
+                return self.bitsets[node]
+            if node[0] == "not":
+                return self.all & ~evaluate_node(node[1])
+            left, right = evaluate_node(node[1]), evaluate_node(node[2])
+            return left & right if node[0] == "and" else left | right
+
+        if not isinstance(expression, str):
+            raise ValueError("filter must be a string")
+        return evaluate_node(parse_filter(expression))
+
+    def search(self, expression: str) -> list[str]:
+        """
+        Return the infinitives matching a filter expression, in sorted
+        order.
+
+        Raises:
+            ValueError: if the expression is invalid.
+        """
+        # Visit only the set bits, lowest first
+        bits, infinitives = self.evaluate(expression), []
+        while bits:
+            lowest = bits & -bits
+            infinitives.append(self.infinitives[lowest.bit_length() - 1])
+            bits ^= lowest
+        return infinitives
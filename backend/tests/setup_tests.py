@@ -22,9 +22,12 @@ def setup_testing_db(cls):
 
         # Add irregular testing verbs to testing database
         irregular_testing_verbs = ["hacer", "ser", "decir", "ir"]
+        verb_ids = {}
         for verb_infinitive in irregular_testing_verbs:
             testing_verb = IrregularVerb(infinitive=verb_infinitive)
             db.session.add(testing_verb)
+            db.session.flush()
+            verb_ids[verb_infinitive] = testing_verb.id
 
         # Add regular testing verbs to testing database
         regular_testing_verbs = ["hablar", "beber", "vivir"]
@@ -39,31 +42,33 @@ def setup_testing_db(cls):
                           "imperfect_subjunctive_se",
                           "affirmative_imperative", "negative_imperative",
                           "participles"]
+        tense_ids = {}
         for tense in testing_tenses:
             testing_tense = Tense(name=tense)
             db.session.add(testing_tense)
+            db.session.flush()
+            tense_ids[tense] = testing_tense.id
 
         # Add irregular conjugations to testing database
+        # Ids are looked up in dicts rather than queried per conjugation
         for verb_infinitive, tenses in irregular_verbs.items():
-            verb = IrregularVerb.query.filter_by(
-                infinitive=verb_infinitive).first()
-            if not verb:
+            verb_id = verb_ids.get(verb_infinitive)
+            if verb_id is None:
                 continue
 
             for tense_name, conjugations in tenses.items():
-                tense = Tense.query.filter_by(name=tense_name).first()
                 if tense_name == 'participles':
                     participle_conjugation = Conjugation(
-                        verb_id=verb.id,
-                        tense_id=tense.id,
+                        verb_id=verb_id,
+                        tense_id=tense_ids[tense_name],
                         present_participle=conjugations[0],
                         past_participle=conjugations[1]
                     )
                     db.session.add(participle_conjugation)
                 else:
                     conjugation = Conjugation(
-                        verb_id=verb.id,
-                        tense_id=tense.id,
+                        verb_id=verb_id,
+                        tense_id=tense_ids[tense_name],
                         first_s=conjugations[0],
                         second_s=conjugations[1],
                         third_s=conjugations[2],
@@ -0,0 +1,127 @@
+import os
+import pickle
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from backend.app.commands import build_artifact
+from backend.app.extensions import db
+from backend.app.resources.verb import Verb as AppVerb
+from backend.core import (ArtifactSource, DictSource, Quiz, SQLiteSource,
+                          Verb)
+from backend.core.utils import PRONOUNS
+from backend.core.utils.conjugate import ALL_TENSES
+from backend.tests.setup_tests import setup_testing_db
+
+VERBS = ["hacer", "ser", "decir", "ir", "hablar", "beber", "vivir"]
+
+
+def conjugation_table(verb) -> dict:
+    """Return every conjugation of a verb, with None for invalid cells."""
+    table = {}
+    for tense in ALL_TENSES:
+        for pronoun in PRONOUNS:
+            try:
+                table[(tense, pronoun)] = verb.conjugate(tense, pronoun)
+            except ValueError:
+                table[(tense, pronoun)] = None
+    return table
+
+
+class TestCore(unittest.TestCase):
+    app: Flask
+    db: SQLAlchemy
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up testing database and read the expected conjugations from
+        the Flask app."""
+        setup_testing_db(cls)
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.artifact_path = os.path.join(cls.directory.name, "paradigms.bin")
+        with cls.app.app_context():
+            cls.database_path = db.engine.url.database
+            cls.expected = {verb: conjugation_table(AppVerb(verb))
+                            for verb in VERBS}
+            build_artifact(cls.artifact_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down testing database and artifact."""
+        with cls.app.app_context():
+            db.drop_all()
+        cls.directory.cleanup()
+
+    def test_dict_source(self):
+        """Verify that a Verb object conjugates from an in-memory dict
+        without an app context."""
+        source = DictSource(
+            {"hacer": {"present": ["hago", "haces", "hace", "hacemos",
+                                   "hacéis", "hacen"],
+                       "participles": ["haciendo", "hecho"]}},
+            ["hablar"])
+        verb = Verb("hacer", source)
+        self.assertFalse(verb.is_regular)
+        self.assertEqual(verb.conjugate("present", "yo"), "hago")
+        self.assertEqual(verb.conjugate("pluperfect", "tú"), "habías hecho")
+        self.assertEqual(verb.conjugate("preterite", "yo"), "hací")
+        self.assertTrue(Verb("hablar", source).is_regular)
+        with self.assertRaises(ValueError):
+            Verb("ser", source)
+
+    def test_sqlite_source(self):
+        """Verify that a SQLite file source gives the same forms as the Flask
+        app."""
+        source = SQLiteSource(self.database_path)
+        for infinitive in VERBS:
+            self.assertEqual(conjugation_table(Verb(infinitive, source)),
+                             self.expected[infinitive])
+
+    def test_artifact_source(self):
+        """Verify that an artifact source gives the same forms as the Flask
+        app."""
+        source = ArtifactSource(self.artifact_path)
+        try:
+            for infinitive in VERBS:
+                self.assertEqual(conjugation_table(Verb(infinitive, source)),
+                                 self.expected[infinitive])
+        finally:
+            source.close()
+
+    def test_from_source(self):
+        """Verify that from_source drops duplicates and lists every invalid
+        verb."""
+        source = SQLiteSource(self.database_path)
+        verbs = Verb.from_source(["ser", "SER", "hablar"], source)
+        self.assertEqual([verb.infinitive for verb in verbs],
+                         ["ser", "hablar"])
+        with self.assertRaises(ValueError) as context:
+            Verb.from_source(["abcd", "efgh"], source)
+        self.assertEqual(str(context.exception), "Invalid verbs: abcd, efgh")
+
+    def test_pickle(self):
+        """Verify that verbs, quizzes, and sources survive pickling."""
+        for source in [SQLiteSource(self.database_path),
+                       ArtifactSource(self.artifact_path)]:
+            verb = pickle.loads(pickle.dumps(Verb("decir", source)))
+            self.assertEqual(conjugation_table(verb), self.expected["decir"])
+
+        source = SQLiteSource(self.database_path)
+        quiz = Quiz(Verb.from_source(VERBS, source), list(ALL_TENSES),
+                    list(PRONOUNS), 10)
+        copy = pickle.loads(pickle.dumps(quiz))
+        self.assertEqual([(item.question_verb.infinitive, item.answer)
+                          for item in copy.quiz_bank],
+                         [(item.question_verb.infinitive, item.answer)
+                          for item in quiz.quiz_bank])
+
+    def test_threads(self):
+        """Verify that verbs sharing a source can be conjugated from several
+        threads."""
+        source = SQLiteSource(self.database_path)
+        verbs = Verb.from_source(VERBS, source)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            tables = list(executor.map(conjugation_table, verbs * 4))
+        self.assertEqual(tables, [self.expected[verb] for verb in VERBS] * 4)
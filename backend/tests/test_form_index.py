@@ -0,0 +1,126 @@
+import unittest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from backend.app.extensions import db
+from backend.app.commands import form_index_stats_command
+from backend.app.form_index import (get_form_index, get_form_search_index,
+                                    init_form_index)
+from backend.core import DictSource
+from backend.core.form_index import FormIndex
+from backend.core.form_search import FormSearchIndex
+from backend.tests.setup_tests import setup_testing_db
+
+
+class TestFormIndex(unittest.TestCase):
+    app: Flask
+    db: SQLAlchemy
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up testing database."""
+        setup_testing_db(cls)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down testing database."""
+        with cls.app.app_context():
+            db.drop_all()
+
+    def test_lookup(self):
+        """Verify that a form maps to every cell that produces it,
+        including compound forms."""
+        source = DictSource({"ser": {"preterite": [
+            "fui", "fuiste", "fue", "fuimos", "fuisteis", "fueron"]}},
+            ["hablar"])
+        index = FormIndex.from_source(source)
+        self.assertEqual(index.lookup("fui"), [("ser", "preterite", "yo")])
+        self.assertEqual(index.lookup("  He   HABLADO "),
+                         [("hablar", "present_perfect", "yo")])
+        self.assertEqual(index.lookup("hable"),
+                         [("hablar", "present_subjunctive", "yo"),
+                          ("hablar", "present_subjunctive", "él/ella/Ud."),
+                          ("hablar", "affirmative_imperative",
+                           "él/ella/Ud.")])
+        self.assertEqual(index.lookup("hable", "ser"), [])
+        self.assertEqual(index.lookup("xyz"), [])
+        self.assertGreater(index.memory_usage(), 0)
+
+    def test_search(self):
+        """Verify that patterns find forms by prefix, suffix, infix, or
+        exact match, in sorted order."""
+        index = FormSearchIndex(["tuve", "tuvieron", "hicieron", "tengo",
+                                 "he tenido", "contuve"])
+        self.assertEqual(index.search("tuv*"), ["tuve", "tuvieron"])
+        self.assertEqual(index.search("*IERON"), ["hicieron", "tuvieron"])
+        self.assertEqual(index.search("*uv*"),
+                         ["contuve", "tuve", "tuvieron"])
+        self.assertEqual(index.search("t*ron"), ["tuvieron"])
+        self.assertEqual(index.search("*e t*"), ["he tenido"])
+        self.assertEqual(index.search("*i*er*"), ["hicieron", "tuvieron"])
+        self.assertEqual(index.search("tengo"), ["tengo"])
+        self.assertEqual(index.search("*xyz*"), [])
+        for pattern in ["", "**", None]:
+            with self.assertRaises(ValueError):
+                index.search(pattern)
+
+    def test_app_index(self):
+        """Verify that the app builds its form index once, with every verb
+        that produces a form."""
+        with self.app.app_context():
+            self.app.extensions.pop('form_index', None)
+            try:
+                index = get_form_index()
+                self.assertIs(get_form_index(), index)
+                self.assertEqual(sorted(index.lookup("fui")),
+                                 [("ir", "preterite", "yo"),
+                                  ("ser", "preterite", "yo")])
+                self.assertEqual(get_form_search_index().search("fu*eron"),
+                                 ["fueron"])
+            finally:
+                self.app.extensions.pop('form_index', None)
+                self.app.extensions.pop('form_search_index', None)
+
+    def test_lazy_index(self):
+        """Verify that the form index is not built at startup by default,
+        and that the stats command builds it and reports its size."""
+        init_form_index(self.app)
+        try:
+            self.assertNotIn('form_index', self.app.extensions)
+            result = self.app.test_cli_runner().invoke(
+                form_index_stats_command)
+            self.assertRegex(result.output, r"^Form index: \d+ forms, ")
+            self.assertIn('form_index', self.app.extensions)
+        finally:
+            self.app.extensions.pop('form_index', None)
+
+    def test_preload_report(self):
+        """Verify that preloading the form index reports its size at a level
+        Flask's default logger shows."""
+        self.app.config['FORM_INDEX_PRELOAD'] = True
+        try:
+            with self.assertLogs(self.app.logger, "WARNING") as logs:
+                init_form_index(self.app)
+            self.assertRegex(logs.output[0], r"Form index: \d+ forms, ")
+        finally:
+            self.app.config.pop('FORM_INDEX_PRELOAD')
+            self.app.extensions.pop('form_index', None)
+
+    def test_search_preload(self):
+        """Verify that the wildcard search index is built at startup when
+        the app sets FORM_SEARCH_PRELOAD, along with the form index."""
+        self.app.config['FORM_SEARCH_PRELOAD'] = True
+        try:
+            with self.assertLogs(self.app.logger, "WARNING"):
+                init_form_index(self.app)
+            self.assertIsInstance(self.app.extensions['form_search_index'],
+                                  FormSearchIndex)
+            self.assertIn('form_index', self.app.extensions)
+        finally:
+            self.app.config.pop('FORM_SEARCH_PRELOAD')
+            self.app.extensions.pop('form_index', None)
+            self.app.extensions.pop('form_search_index', None)
+
+
+if __name__ == "__main__":
+    unittest.main()
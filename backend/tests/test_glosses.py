@@ -0,0 +1,94 @@
+import unittest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from backend.app.extensions import db
+from backend.app.glosses import (build_gloss_query, create_gloss_index,
+                                 has_gloss_index, init_gloss_index,
+                                 search_glosses)
+from backend.app.commands import upgrade_db
+from backend.app.models import IrregularVerb, RegularVerb, VerbGloss
+from backend.tests.setup_tests import setup_testing_db
+
+
+class TestGlosses(unittest.TestCase):
+    app: Flask
+    db: SQLAlchemy
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up testing database with English glosses."""
+        setup_testing_db(cls)
+        with cls.app.app_context():
+            db.session.add_all([
+                IrregularVerb(infinitive="traer"),
+                RegularVerb(infinitive="llevar"),
+                VerbGloss(infinitive="hacer", gloss="to do; to make"),
+                VerbGloss(infinitive="traer", gloss="to bring"),
+                VerbGloss(infinitive="llevar",
+                          gloss="to carry; to bring along"),
+                # Gloss of a verb missing from the catalog
+                VerbGloss(infinitive="aportar", gloss="to bring"),
+            ])
+            db.session.commit()
+            create_gloss_index()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down testing database."""
+        with cls.app.app_context():
+            db.session.execute(db.text("DROP TABLE verb_gloss_fts"))
+            db.drop_all()
+
+    def test_gloss_query(self):
+        """Verify that English phrases become FTS5 queries without a leading
+        "to", and that a phrase without words raises a ValueError."""
+        self.assertEqual(build_gloss_query("To Bring"), '"bring"*')
+        self.assertEqual(build_gloss_query("make (it)"), '"make" "it"*')
+        with self.assertRaises(ValueError):
+            build_gloss_query(" ?! ")
+
+    def test_search(self):
+        """Verify that gloss search ranks the closest gloss first, matches a
+        partial last word, and leaves out verbs missing from the catalog."""
+        with self.app.app_context():
+            self.assertEqual(search_glosses("to bring"), ["traer", "llevar"])
+            self.assertEqual(search_glosses("to bring", 1), ["traer"])
+            self.assertEqual(search_glosses("mak"), ["hacer"])
+            self.assertEqual(search_glosses("fly"), [])
+
+    def test_index_sync(self):
+        """Verify that glosses added after the index is created are
+        searchable."""
+        with self.app.app_context():
+            gloss = VerbGloss(infinitive="decir", gloss="to say; to tell")
+            db.session.add(gloss)
+            db.session.commit()
+            try:
+                self.assertEqual(search_glosses("tell"), ["decir"])
+            finally:
+                db.session.delete(gloss)
+                db.session.commit()
+            self.assertEqual(search_glosses("tell"), [])
+
+    def test_startup_check(self):
+        """Verify that startup only checks for the gloss index, and that
+        upgrading the database creates it."""
+        with self.app.app_context():
+            db.session.execute(db.text("DROP TABLE verb_gloss_fts"))
+            db.session.commit()
+            try:
+                with self.assertLogs(self.app.logger, "WARNING"):
+                    init_gloss_index(self.app)
+                self.assertFalse(has_gloss_index())
+                with self.assertRaises(ValueError):
+                    search_glosses("bring")
+            finally:
+                self.assertEqual(upgrade_db(),
+                                 ["Created gloss index verb_gloss_fts"])
+            self.assertEqual(search_glosses("to bring"), ["traer", "llevar"])
+            self.assertEqual(upgrade_db(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
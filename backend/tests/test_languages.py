@@ -0,0 +1,155 @@
+import sys
+import types
+import unittest
+from unittest import mock
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from backend.app.extensions import db
+from backend.app.languages import get_language_verbs
+from backend.app.resources.verb import Verb
+from backend.core import DictSource, Quiz, Verb as CoreVerb
+from backend.core.languages import (LanguageEngine, get_engine,
+                                    get_languages, is_loaded,
+                                    register_language, unregister_language)
+from backend.core.utils import PRONOUNS
+from backend.core.verb import resolve_verbs
+from backend.tests.setup_tests import setup_testing_db
+
+ITALIAN_PRONOUNS = ("io", "tu", "lui/lei", "noi", "voi", "loro")
+
+
+class ItalianVerb(CoreVerb):
+    __slots__ = ()
+
+    language = "it"
+
+    def conjugate(self, tense: str, pronoun: str) -> str:
+        """Return the stored form of the verb."""
+        return self.source.get_conjugation(self.infinitive, tense)[
+            ITALIAN_PRONOUNS.index(pronoun)]
+
+
+def load_italian_source() -> DictSource:
+    """Return the verb data of the test language."""
+    return DictSource({"essere": {"presente": [
+        "sono", "sei", "è", "siamo", "siete", "sono"]}})
+
+
+def has_italian_form(tense: str, pronoun: str) -> bool:
+    """Return False for the test language's empty cells."""
+    return pronoun != "io"
+
+
+# Engine of a test language whose module is this one
+ENGINE = LanguageEngine("it", "Italian", ITALIAN_PRONOUNS, ("presente",),
+                        ItalianVerb, load_italian_source, has_italian_form)
+
+
+class DatabaseVerb(CoreVerb):
+    __slots__ = ()
+
+    language = "xx"
+
+
+# Engine of a test language without bundled verb data, whose verbs come
+# from the app's verb source
+DATABASE_ENGINE = LanguageEngine("xx", "Test", tuple(PRONOUNS), ("present",),
+                                 DatabaseVerb)
+
+
+class TestLanguages(unittest.TestCase):
+    app: Flask
+    db: SQLAlchemy
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up testing database and register the test language."""
+        setup_testing_db(cls)
+        register_language("it", __name__)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down testing database and unregister the test language."""
+        unregister_language("it")
+        with cls.app.app_context():
+            db.drop_all()
+
+    def test_spanish_engine(self):
+        """Verify that the Spanish engine validates Spanish tenses and
+        pronouns, knows the empty imperative "yo" cells, and that an unknown
+        language raises a ValueError."""
+        engine = get_engine("es")
+        self.assertIs(get_engine("es"), engine)
+        self.assertTrue(engine.is_valid_tense("present_perfect"))
+        self.assertFalse(engine.is_valid_tense("presente"))
+        self.assertTrue(engine.is_valid_pronoun("vosotros"))
+        self.assertFalse(engine.has_form("affirmative_imperative", "yo"))
+        self.assertTrue(engine.has_form("present", "yo"))
+        self.assertIs(engine.resolve_verbs, resolve_verbs)
+        for code in ["yy", None, ["es"]]:
+            with self.assertRaises(ValueError):
+                get_engine(code)
+
+    def test_lazy_loading(self):
+        """Verify that a registered language's module is only used once the
+        language is requested."""
+        register_language("it", __name__)
+        self.assertFalse(is_loaded("it"))
+        self.assertIs(get_engine("it"), sys.modules[__name__].ENGINE)
+        self.assertTrue(is_loaded("it"))
+
+    def test_language_quiz(self):
+        """Verify that a quiz validates tenses, pronouns, and verbs and
+        leaves out empty cells with its language's engine, and that verbs
+        are resolved by their language's rules."""
+        with self.app.app_context():
+            try:
+                verbs = get_language_verbs("it", ["Essere"])
+                self.assertIs(get_language_verbs("it", ["essere"])[0].source,
+                              verbs[0].source)
+                quiz = Quiz(verbs, ["presente"], ["io", "noi"],
+                            language="it")
+                self.assertEqual([item.answer for item in quiz], ["siamo"])
+                with self.assertRaises(ValueError):
+                    Quiz(verbs, ["present"], ["noi"], language="it")
+                with self.assertRaises(ValueError):
+                    Quiz([Verb("hablar")], ["presente"], ["noi"],
+                         language="it")
+                with self.assertRaises(ValueError):
+                    Quiz(verbs, ["present"], ["nosotros"])
+                # Spanish open vocabulary does not apply to the language
+                with self.assertRaises(ValueError):
+                    ItalianVerb.from_source(["cantar"], verbs[0].source,
+                                            open_vocabulary=True)
+                self.assertEqual(get_language_verbs("es", ["hablar"]),
+                                 [Verb.get("hablar")])
+            finally:
+                self.app.extensions.pop('language_sources', None)
+
+
+    def test_database_language(self):
+        """Verify that a language without bundled verb data gets verbs of
+        its own verb type from the app's verb source, so its quizzes are
+        valid, and that an unregistered language is removed."""
+        module = types.ModuleType("database_language")
+        module.ENGINE = DATABASE_ENGINE
+        with mock.patch.dict(sys.modules, {module.__name__: module}):
+            register_language("xx", module.__name__)
+            try:
+                with self.app.app_context():
+                    verbs = get_language_verbs("xx", ["Hablar"])
+                    self.assertIs(type(verbs[0]), DatabaseVerb)
+                    quiz = Quiz(verbs, ["present"], ["nosotros"],
+                                language="xx")
+                    self.assertEqual([item.answer for item in quiz],
+                                     ["hablamos"])
+            finally:
+                unregister_language("xx")
+        self.assertNotIn("xx", get_languages())
+        with self.assertRaises(ValueError):
+            get_engine("xx")
+
+
+if __name__ == "__main__":
+    unittest.main()
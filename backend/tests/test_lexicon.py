@@ -0,0 +1,141 @@
+import json
+import os
+import tempfile
+import unittest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from backend.app.commands import import_lexicon
+from backend.app.extensions import db
+from backend.app.models import (Conjugation, IrregularVerb, RegularVerb,
+                                VerbGloss)
+from backend.core.lexicon import (CSV_COLUMNS, classify_entry,
+                                  read_lexicon)
+from backend.core.utils.patterns import predict_conjugation
+from backend.tests.setup_tests import setup_testing_db
+
+PENSAR = ["pienso", "piensas", "piensa", "pensamos", "pensáis", "piensan"]
+
+
+def write_file(suffix: str, text: str) -> str:
+    """Write text to a temporary file and return its path."""
+    file, path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(file, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+class TestLexicon(unittest.TestCase):
+    app: Flask
+    db: SQLAlchemy
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up testing database."""
+        setup_testing_db(cls)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down testing database."""
+        with cls.app.app_context():
+            db.drop_all()
+
+    def test_classify(self):
+        """Verify that verbs matching the regular rules are regular and that
+        irregular verbs store only the forms their pattern leaves out."""
+        entries = {entry.infinitive: classify_entry(entry) for entry in
+                   read_lexicon(self.write_jsonl([
+                       {"infinitive": "cantar", "conjugations": {
+                           "present": predict_conjugation("cantar",
+                                                          "present")}},
+                       {"infinitive": "pensar",
+                        "conjugations": {"present": PENSAR}},
+                       {"infinitive": "ser", "conjugations": {"present": [
+                           "soy", "eres", "es", "somos", "sois", "son"]}},
+                   ]))}
+        self.assertTrue(entries["cantar"].is_regular)
+        self.assertEqual(entries["pensar"].pattern, "e>ie")
+        self.assertEqual(entries["pensar"].stored, {})
+        self.assertFalse(entries["ser"].is_regular)
+        self.assertIn("present", entries["ser"].stored)
+
+    def test_invalid(self):
+        """Verify that invalid entries raise a ValueError naming their
+        line."""
+        path = self.write_jsonl([{"infinitive": "cantar"},
+                                 {"infinitive": "xyz"}])
+        with self.assertRaisesRegex(ValueError, "line 2"):
+            list(read_lexicon(path))
+        path = self.write_jsonl([{"infinitive": "cantar",
+                                  "conjugations": {"present": ["canto"]}}])
+        with self.assertRaises(ValueError):
+            list(read_lexicon(path))
+        with self.assertRaises(ValueError):
+            list(read_lexicon("verbs.txt"))
+
+    def test_import_jsonl(self):
+        """Verify that a JSON Lines import inserts verbs in batches, skips
+        existing verbs, and stores glosses."""
+        path = self.write_jsonl([
+            {"infinitive": "hablar", "gloss": "to speak"},
+            {"infinitive": "nadar", "gloss": "to swim"},
+            {"infinitive": "contar", "conjugations": {"present": [
+                "cuento", "cuentas", "cuenta", "contamos", "contáis",
+                "cuentan"]}},
+            {"infinitive": "estar", "conjugations": {"present": [
+                "estoy", "estás", "está", "estamos", "estáis", "están"]},
+             "participles": ["estando", "estado"]},
+            {"infinitive": "nadar"},
+        ])
+        with self.app.app_context():
+            counts = import_lexicon(path, batch_size=2)
+            self.assertEqual(counts, {"regular": 1, "irregular": 2,
+                                      "skipped": 2})
+            self.assertIsNotNone(
+                RegularVerb.query.filter_by(infinitive="nadar").first())
+            contar = IrregularVerb.query.filter_by(infinitive="contar").one()
+            self.assertEqual(contar.pattern, "o>ue")
+            self.assertEqual(contar.conjugations, [])
+            estar = IrregularVerb.query.filter_by(infinitive="estar").one()
+            rows = Conjugation.query.filter_by(verb_id=estar.id).all()
+            self.assertEqual([row.tense.name for row in rows], ["present"])
+            self.assertEqual(rows[0].first_s, "estoy")
+            self.assertIsNone(rows[0].first_p)
+            self.assertEqual(
+                [gloss.gloss for gloss in VerbGloss.query.filter(
+                    VerbGloss.infinitive.in_(["hablar", "nadar"]))],
+                ["to swim"])
+
+    def test_import_csv(self):
+        """Verify that a CSV import groups each verb's rows."""
+        header = ",".join(CSV_COLUMNS)
+        path = write_file(".csv", "\n".join([
+            header,
+            "pensar,present," + ",".join(PENSAR) + ",,,to think",
+            "pensar,participles,,,,,,,pensando,pensado,",
+            "bailar,,,,,,,,,,to dance",
+        ]) + "\n")
+        self.addCleanup(os.remove, path)
+        entries = list(read_lexicon(path))
+        self.assertEqual([entry.infinitive for entry in entries],
+                         ["pensar", "bailar"])
+        self.assertEqual(entries[0].participles, ("pensando", "pensado"))
+        self.assertEqual(entries[0].gloss, "to think")
+        with self.app.app_context():
+            self.assertEqual(import_lexicon(path),
+                             {"regular": 1, "irregular": 1, "skipped": 0})
+            self.assertEqual(IrregularVerb.query.filter_by(
+                infinitive="pensar").one().pattern, "e>ie")
+
+    def write_jsonl(self, entries: list) -> str:
+        """Write entries to a temporary JSON Lines file removed after the
+        test and return its path."""
+        path = write_file(".jsonl", "".join(
+            json.dumps(entry, ensure_ascii=False) + "\n"
+            for entry in entries))
+        self.addCleanup(os.remove, path)
+        return path
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import os
+import tempfile
+import unittest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+
+from backend.app.commands import build_artifact
+from backend.app.extensions import db
+from backend.app.paradigm_artifact import ParadigmArtifact
+from backend.core.artifact import write_artifact
+from backend.app.resources.verb import Verb
+from backend.core.utils import PRONOUNS
+from backend.core.utils.conjugate import ALL_TENSES
+from backend.tests.setup_tests import setup_testing_db
+
+VERBS = ["hacer", "ser", "decir", "ir", "hablar", "beber", "vivir"]
+
+
+class TestParadigmArtifact(unittest.TestCase):
+    app: Flask
+    db: SQLAlchemy
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up testing database and build an artifact from it."""
+        setup_testing_db(cls)
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, "paradigms.bin")
+        with cls.app.app_context():
+            cls.verb_count = build_artifact(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down testing database and artifact."""
+        with cls.app.app_context():
+            db.drop_all()
+        cls.directory.cleanup()
+
+    def setUp(self):
+        """Open the artifact."""
+        self.artifact = ParadigmArtifact(self.path)
+
+    def tearDown(self):
+        """Unregister and close the artifact."""
+        self.app.extensions.pop('paradigm_artifact', None)
+        self.artifact.close()
+
+    def test_verb_count(self):
+        """Verify that the artifact holds every verb in the database."""
+        self.assertEqual(self.verb_count, len(VERBS))
+        self.assertEqual(self.artifact.verb_count, len(VERBS))
+
+    def test_artifact_matches_database(self):
+        """Verify that the artifact holds the same forms as the conjugate
+        method."""
+        with self.app.app_context():
+            for infinitive in VERBS:
+                verb = Verb(infinitive)
+                for tense in ALL_TENSES:
+                    for pronoun in PRONOUNS:
+                        try:
+                            expected = verb.conjugate(tense, pronoun)
+                        except ValueError:
+                            expected = None
+                        self.assertEqual(
+                            self.artifact.conjugate(infinitive, tense,
+                                                    pronoun), expected)
+
+    def test_artifact_regular_flag(self):
+        """Verify that the artifact records whether a verb is regular."""
+        self.assertTrue(self.artifact.is_regular("hablar"))
+        self.assertFalse(self.artifact.is_regular("hacer"))
+        self.assertFalse(self.artifact.is_valid_verb("abcd"))
+
+    def test_artifact_invalid_lookup(self):
+        """Verify that looking up an unknown verb or tense raises a
+        ValueError."""
+        with self.assertRaises(ValueError):
+            self.artifact.conjugate("abcd", "present", "yo")
+        with self.assertRaises(ValueError):
+            self.artifact.conjugate("hablar", "abcd", "yo")
+
+    def test_verb_uses_artifact(self):
+        """Verify that Verb objects answer from a registered artifact without
+        querying the database."""
+        self.artifact.init_app(self.app)
+        statements = []
+
+        def count(*args):
+            statements.append(args[2])
+
+        with self.app.app_context():
+            engine = db.engine
+            event.listen(engine, 'before_cursor_execute', count)
+            try:
+                verb = Verb("hacer")
+                self.assertFalse(verb.is_regular)
+                self.assertEqual(verb.conjugate("present", "yo"), "hago")
+                self.assertEqual(verb.conjugate("present_perfect", "tú"),
+                                 "has hecho")
+                self.assertEqual(verb.participles, ("haciendo", "hecho"))
+                with self.assertRaises(ValueError):
+                    verb.conjugate("affirmative_imperative", "yo")
+                with self.assertRaises(ValueError):
+                    Verb("abcd")
+            finally:
+                event.remove(engine, 'before_cursor_execute', count)
+        self.assertEqual(statements, [])
+
+    def test_artifact_participles(self):
+        """Verify that the artifact gives the irregular participles of an
+        irregular verb, and none for a regular verb."""
+        self.assertEqual(self.artifact.get_participles("hacer"),
+                         ("haciendo", "hecho"))
+        self.assertEqual(self.artifact.get_participles("decir"),
+                         ("diciendo", "dicho"))
+        self.assertIsNone(self.artifact.get_participles("hablar"))
+        self.assertIsNone(self.artifact.get_participles("abcd"))
+
+        path = os.path.join(self.directory.name, "participles.bin")
+        write_artifact(path, ["present_progressive", "present_perfect"],
+                       [("volver", 1, False, [
+                           [f"{aux} volviendo" for aux in
+                            ["estoy", "estás", "está", "estamos", "estáis",
+                             "están"]],
+                           [f"{aux} vuelto" for aux in
+                            ["he", "has", "ha", "hemos", "habéis", "han"]]])])
+        artifact = ParadigmArtifact(path)
+        try:
+            self.assertEqual(artifact.get_participles("volver"),
+                             ("volviendo", "vuelto"))
+        finally:
+            artifact.close()
+
+    def test_invalid_artifact(self):
+        """Verify that opening a file that is not an artifact raises a
+        ValueError."""
+        path = os.path.join(self.directory.name, "invalid.bin")
+        with open(path, "wb") as file:
+            file.write(b"not an artifact" * 4)
+        with self.assertRaises(ValueError):
+            ParadigmArtifact(path)
+
+    def test_write_artifact_unicode(self):
+        """Verify that forms with accents and missing forms round-trip
+        through an artifact."""
+        path = os.path.join(self.directory.name, "small.bin")
+        write_artifact(path, ["present"],
+                       [("reír", 1, False,
+                         [[None, "ríes", "ríe", "reímos", "reís", "ríen"]])])
+        artifact = ParadigmArtifact(path)
+        try:
+            self.assertIsNone(artifact.conjugate("reír", "present", "yo"))
+            self.assertEqual(artifact.conjugate("reír", "present",
+                                                "nosotros"), "reímos")
+        finally:
+            artifact.close()
@@ -0,0 +1,218 @@
+import unittest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+
+from backend.app.commands import upgrade_db
+from backend.app.extensions import db
+from backend.app.models import (Conjugation, IrregularVerb, RegularVerb,
+                                Tense)
+from backend.app.paradigm_store import (DERIVED_EXTENSIONS, ParadigmStore,
+                                        get_paradigm_store)
+from backend.app.resources.verb import Verb
+from backend.app.schema import has_pattern_column, init_schema
+from backend.app.verb_index import get_verb_completer
+from backend.core.utils import PRONOUNS
+from backend.tests.setup_tests import setup_testing_db
+
+TENSES = ["present", "preterite", "imperfect", "conditional", "future",
+          "present_subjunctive", "imperfect_subjunctive_ra",
+          "imperfect_subjunctive_se", "present_progressive",
+          "past_progressive", "present_perfect", "pluperfect",
+          "future_perfect", "present_perfect_subjunctive",
+          "pluperfect_subjunctive_ra", "pluperfect_subjunctive_se",
+          "affirmative_imperative", "negative_imperative"]
+
+VERBS = ["hacer", "ser", "decir", "ir", "hablar", "beber", "vivir"]
+
+
+def conjugation_table(verb: Verb) -> dict:
+    """Return every conjugation of a verb, with None for invalid cells."""
+    table = {}
+    for tense in TENSES:
+        for pronoun in PRONOUNS:
+            try:
+                table[(tense, pronoun)] = verb.conjugate(tense, pronoun)
+            except ValueError:
+                table[(tense, pronoun)] = None
+    return table
+
+
+class TestParadigmStore(unittest.TestCase):
+    app: Flask
+    db: SQLAlchemy
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up testing database."""
+        setup_testing_db(cls)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down testing database."""
+        with cls.app.app_context():
+            db.drop_all()
+
+    def setUp(self):
+        """Count the statements issued to the testing database."""
+        self.statements = []
+        with self.app.app_context():
+            self.engine = db.engine
+        event.listen(self.engine, 'before_cursor_execute', self.count)
+
+    def tearDown(self):
+        """Stop counting statements and unregister the paradigm store."""
+        event.remove(self.engine, 'before_cursor_execute', self.count)
+        self.app.extensions.pop('paradigm_store', None)
+
+    def count(self, conn, cursor, statement, parameters, context,
+              executemany):
+        self.statements.append(statement)
+
+    def test_store_loaded(self):
+        """Verify that registering the store on an app loads it."""
+        store = ParadigmStore(self.app)
+        self.assertTrue(store.loaded)
+        self.assertEqual(set(store.regular_verbs),
+                         {"hablar", "beber", "vivir"})
+        self.assertEqual(set(store.irregular_verbs),
+                         {"hacer", "ser", "decir", "ir"})
+        self.assertEqual(store.get_conjugation("hacer", "present"),
+                         ("hago", "haces", "hace", "hacemos", "hacéis",
+                          "hacen"))
+        self.assertEqual(store.get_participles("hacer"),
+                         ("haciendo", "hecho"))
+
+    def test_store_disabled(self):
+        """Verify that the store is not loaded when PARADIGM_STORE_ENABLED
+        is False."""
+        self.app.config['PARADIGM_STORE_ENABLED'] = False
+        try:
+            store = ParadigmStore(self.app)
+        finally:
+            self.app.config.pop('PARADIGM_STORE_ENABLED')
+        self.assertFalse(store.loaded)
+        with self.app.app_context():
+            self.assertIsNone(get_paradigm_store())
+
+    def test_store_matches_database(self):
+        """Verify that conjugating with the store returns the same forms as
+        conjugating with the database."""
+        with self.app.app_context():
+            expected = {verb: conjugation_table(Verb(verb)) for verb in VERBS}
+            ParadigmStore(self.app)
+            for verb in VERBS:
+                self.assertEqual(conjugation_table(Verb(verb)),
+                                 expected[verb])
+
+    def test_store_issues_no_queries(self):
+        """Verify that creating and conjugating verbs with a loaded store
+        issues no database queries."""
+        ParadigmStore(self.app)
+        self.statements.clear()
+        with self.app.app_context():
+            for verb in VERBS:
+                conjugation_table(Verb(verb))
+        self.assertEqual(self.statements, [])
+
+    def test_store_invalid_verb(self):
+        """Verify that creating a Verb object with an unknown verb raises a
+        ValueError when the store is loaded."""
+        ParadigmStore(self.app)
+        with self.app.app_context():
+            with self.assertRaises(ValueError):
+                Verb("abcd")
+
+    def test_schema_upgrade(self):
+        """Verify that a database without the pattern column gets it at
+        startup, so the store loads, and that upgrading it again changes
+        nothing."""
+        with self.app.app_context():
+            db.session.execute(db.text(
+                "ALTER TABLE irregular_verb DROP COLUMN pattern"))
+            db.session.commit()
+            self.assertFalse(has_pattern_column())
+        init_schema(self.app)
+        store = ParadigmStore(self.app)
+        self.assertTrue(store.loaded)
+        with self.app.app_context():
+            self.assertTrue(has_pattern_column())
+            try:
+                self.assertNotIn("Added column irregular_verb.pattern",
+                                 upgrade_db())
+                self.assertEqual(upgrade_db(), [])
+            finally:
+                db.session.execute(db.text(
+                    "DROP TABLE IF EXISTS verb_gloss_fts"))
+                db.session.commit()
+            self.assertEqual(Verb("hacer").conjugate("present", "yo"),
+                             "hago")
+
+    def test_store_disabled_refresh(self):
+        """Verify that refreshing a disabled store leaves it unloaded, and
+        that conjugating from the database sees changed rows in the next
+        app context."""
+        self.app.config['PARADIGM_STORE_ENABLED'] = False
+        try:
+            store = ParadigmStore(self.app)
+            with self.app.app_context():
+                store.refresh()
+                self.assertFalse(store.loaded)
+                self.assertIsNone(get_paradigm_store())
+                self.assertEqual(Verb("hacer").conjugate("present", "yo"),
+                                 "hago")
+                conjugation = Conjugation.query.join(IrregularVerb).join(
+                    Tense).filter(IrregularVerb.infinitive == "hacer",
+                                  Tense.name == "present").one()
+                conjugation.first_s = "hagO"
+                db.session.commit()
+            try:
+                with self.app.app_context():
+                    self.assertEqual(
+                        Verb("hacer").conjugate("present", "yo"), "hagO")
+            finally:
+                with self.app.app_context():
+                    db.session.merge(conjugation).first_s = "hago"
+                    db.session.commit()
+        finally:
+            self.app.config.pop('PARADIGM_STORE_ENABLED')
+            self.app.extensions.pop('verb_source', None)
+
+    def test_store_disabled_refresh_indexes(self):
+        """Verify that refreshing a disabled store discards the indexes
+        built from the verb tables, so new verbs are found."""
+        self.app.config['PARADIGM_STORE_ENABLED'] = False
+        try:
+            store = ParadigmStore(self.app)
+            with self.app.app_context():
+                self.assertEqual(get_verb_completer().complete("cam"), [])
+                db.session.add(RegularVerb(infinitive="caminar"))
+                db.session.commit()
+                try:
+                    store.refresh()
+                    self.assertFalse(store.loaded)
+                    self.assertEqual(get_verb_completer().complete("cam"),
+                                     ["caminar"])
+                finally:
+                    RegularVerb.query.filter_by(infinitive="caminar").delete()
+                    db.session.commit()
+        finally:
+            self.app.config.pop('PARADIGM_STORE_ENABLED')
+            for key in DERIVED_EXTENSIONS:
+                self.app.extensions.pop(key, None)
+
+    def test_store_refresh(self):
+        """Verify that refreshing the store picks up new verbs."""
+        store = ParadigmStore(self.app)
+        with self.app.app_context():
+            db.session.add(RegularVerb(infinitive="cantar"))
+            db.session.commit()
+            try:
+                with self.assertRaises(ValueError):
+                    Verb("cantar")
+                store.refresh()
+                self.assertEqual(Verb("cantar").conjugate("present", "yo"),
+                                 "canto")
+            finally:
+                RegularVerb.query.filter_by(infinitive="cantar").delete()
+                db.session.commit()
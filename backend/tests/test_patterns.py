@@ -0,0 +1,121 @@
+import unittest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from backend.app.commands import compact_irregulars
+from backend.app.extensions import db
+from backend.app.models import IrregularVerb, Conjugation
+from backend.app.paradigm_store import ParadigmStore
+from backend.app.resources.verb import Verb
+from backend.core import DictSource, Verb as CoreVerb
+from backend.core.utils import PRONOUNS
+from backend.core.utils.conjugate import ALL_TENSES
+from backend.core.utils.patterns import (classify_verb, parse_pattern,
+                                         predict_conjugation,
+                                         predict_participles)
+from backend.tests.setup_tests import setup_testing_db
+
+VERBS = ["hacer", "ser", "decir", "ir", "hablar", "beber", "vivir"]
+
+
+def conjugation_table(verb) -> dict:
+    """Return every conjugation of a verb, with None for invalid cells."""
+    table = {}
+    for tense in ALL_TENSES:
+        for pronoun in PRONOUNS:
+            try:
+                table[(tense, pronoun)] = verb.conjugate(tense, pronoun)
+            except ValueError:
+                table[(tense, pronoun)] = None
+    return table
+
+
+class TestPatterns(unittest.TestCase):
+    app: Flask
+    db: SQLAlchemy
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up testing database."""
+        setup_testing_db(cls)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down testing database."""
+        with cls.app.app_context():
+            db.drop_all()
+
+    def test_stem_change(self):
+        """Verify that a stem change applies to the stressed cells, and to
+        the unstressed cells of -ir verbs."""
+        self.assertEqual(predict_conjugation("pensar", "present", "e>ie"),
+                         ("pienso", "piensas", "piensa", "pensamos",
+                          "pensáis", "piensan"))
+        self.assertEqual(predict_conjugation("dormir", "preterite", "o>ue"),
+                         ("dormí", "dormiste", "durmió", "dormimos",
+                          "dormisteis", "durmieron"))
+        self.assertEqual(predict_participles("pedir", "e>i"),
+                         ("pidiendo", "pedido"))
+
+    def test_spelling_change(self):
+        """Verify that a spelling change combines with a stem change."""
+        self.assertEqual(
+            predict_conjugation("empezar", "present_subjunctive",
+                                "e>ie+zar"),
+            ("empiece", "empieces", "empiece", "empecemos", "empecéis",
+             "empiecen"))
+        self.assertEqual(predict_conjugation("conocer", "present", "c>zc")[0],
+                         "conozco")
+
+    def test_invalid_pattern(self):
+        """Verify that parsing an unknown rule raises a ValueError."""
+        with self.assertRaises(ValueError):
+            parse_pattern("e>ie+abcd")
+
+    def test_classify_verb(self):
+        """Verify that classify_verb picks the pattern that predicts the
+        most forms."""
+        conjugations = {
+            tense: predict_conjugation("volver", tense, "o>ue")
+            for tense in ["present", "preterite", "present_subjunctive"]}
+        self.assertEqual(classify_verb("volver", conjugations,
+                                       ("volviendo", "vuelto")), "o>ue")
+        self.assertEqual(classify_verb("hablar", {
+            "present": predict_conjugation("hablar", "present")}),
+            "regular")
+
+    def test_dict_source_diffs(self):
+        """Verify that a source rebuilds a verb stored as a pattern and a few
+        exceptions."""
+        source = DictSource({"volver": {"participles": [None, "vuelto"]}},
+                            patterns={"volver": "o>ue"})
+        verb = CoreVerb("volver", source)
+        self.assertEqual(verb.conjugate("present", "yo"), "vuelvo")
+        self.assertEqual(verb.conjugate("present_perfect", "yo"),
+                         "he vuelto")
+
+    def test_compact_irregulars(self):
+        """Verify that compacting the irregular verbs stores fewer forms
+        without changing any conjugation."""
+        with self.app.app_context():
+            expected = {verb: conjugation_table(Verb(verb)) for verb in VERBS}
+            compacted, before, after = compact_irregulars()
+            self.assertEqual(compacted, 4)
+            self.assertLess(after, before)
+            self.assertEqual(IrregularVerb.query.filter_by(
+                infinitive="decir").first().pattern, "e>i")
+            self.assertIsNone(Conjugation.query.filter_by(
+                second_s="dices").first())
+
+            self.app.extensions.pop('verb_source', None)
+            self.app.extensions.pop('verb_registry', None)
+            for verb in VERBS:
+                self.assertEqual(conjugation_table(Verb(verb)),
+                                 expected[verb])
+            ParadigmStore(self.app)
+            try:
+                for verb in VERBS:
+                    self.assertEqual(conjugation_table(Verb(verb)),
+                                     expected[verb])
+            finally:
+                self.app.extensions.pop('paradigm_store')
@@ -1,11 +1,15 @@
+import random
 import unittest
+from unittest import mock
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 
 from backend.app.extensions import db
+from backend.app.quiz_cache import (QuizCache, cached_quiz_response,
+                                    get_quiz_cache)
 from backend.app.resources.verb import Verb
-from backend.app.resources.quiz import Quiz
-from backend.app.resources.quiz_item import QuizItem
+from backend.core.quiz import Quiz
+from backend.core.quiz_item import QuizItem
 from backend.tests.setup_tests import setup_testing_db
 
 
@@ -435,6 +439,136 @@ class TestQuizItemCreation(unittest.TestCase):
             self.assertTrue(all(comb in actual_combinations for comb in
                                 expected_combinations))
 
+    def test_quiz_bank4(self):
+        """Verify that the quiz_bank samples the same items as sampling the
+        full product, skipping imperative "yo", and conjugates each sampled
+        item once."""
+        with self.app.app_context():
+            verb_list = [Verb("hacer"), Verb("decir"), Verb("ir")]
+            tense_list = ["present", "affirmative_imperative", "preterite"]
+            pronoun_list = ["yo", "tú", "nosotros"]
+            combinations = [(verb.infinitive, tense, pronoun)
+                            for verb in verb_list for tense in tense_list
+                            for pronoun in pronoun_list
+                            if not (pronoun == "yo" and
+                                    "imperative" in tense)]
+            random.seed(7)
+            expected = random.sample(combinations, 5)
+
+            calls = []
+            conjugate = Verb.conjugate
+
+            def counting_conjugate(verb, tense, pronoun):
+                calls.append((tense, pronoun))
+                return conjugate(verb, tense, pronoun)
+
+            random.seed(7)
+            with mock.patch.object(Verb, "conjugate", counting_conjugate):
+                quiz = Quiz(verb_list, tense_list, pronoun_list, 5)
+            self.assertEqual([(item.question_verb.infinitive,
+                               item.question_tense, item.question_pronoun)
+                              for item in quiz.quiz_bank], expected)
+            self.assertEqual(len(calls), 5)
+
+    def test_quiz_resample(self):
+        """Verify that a quiz resamples the same items for the same seed
+        and conjugates each item at most once across its banks."""
+        with self.app.app_context():
+            verb_list = [Verb("hacer"), Verb("decir")]
+            tense_list = ["present", "preterite"]
+            pronoun_list = ["yo", "tú"]
+            calls = []
+            conjugate = Verb.conjugate
+
+            def counting_conjugate(verb, tense, pronoun):
+                calls.append((verb.infinitive, tense, pronoun))
+                return conjugate(verb, tense, pronoun)
+
+            with mock.patch.object(Verb, "conjugate", counting_conjugate):
+                quiz = Quiz(verb_list, tense_list, pronoun_list, 3,
+                            rng=random.Random(1))
+                banks = [quiz.resample(random.Random(seed))
+                         for seed in range(20)]
+            self.assertEqual(len(calls), len(set(calls)))
+            self.assertLessEqual(len(calls), 8)
+            self.assertEqual([str(item) for item in banks[1]],
+                             [str(item) for item in
+                              quiz.resample(random.Random(1))])
+            self.assertEqual([str(item) for item in quiz.quiz_bank],
+                             [str(item) for item in banks[1]])
+
+    def test_quiz_seed(self):
+        """Verify that quizzes sampled with generators of the same seed are
+        the same."""
+        with self.app.app_context():
+            verb_list = [Verb("hacer"), Verb("decir"), Verb("ir")]
+            tense_list = ["present", "preterite", "imperfect"]
+            pronoun_list = ["yo", "tú", "nosotros"]
+            quizzes = [Quiz(verb_list, tense_list, pronoun_list, 10,
+                            rng=random.Random(seed)) for seed in [4, 4, 5]]
+            banks = [[str(item) for item in quiz] for quiz in quizzes]
+            self.assertEqual(banks[0], banks[1])
+            self.assertNotEqual(banks[0], banks[2])
+
+    def test_quiz_cache(self):
+        """Verify that seeded quiz responses are built once per normalized
+        request, carry an ETag, and answer a matching If-None-Match with a
+        304 only on a GET request."""
+        builds = []
+
+        def build() -> list:
+            builds.append(1)
+            return [{"answer": "hago"}]
+
+        self.app.config['QUIZ_CACHE_SIZE'] = 1
+        try:
+            with self.app.test_request_context():
+                first = cached_quiz_response({"seed": 1}, build, 201)
+                second = cached_quiz_response({"seed": 1}, build, 201)
+                self.assertEqual(len(builds), 1)
+                self.assertEqual(first.status_code, 201)
+                self.assertEqual(first.get_json(), [{"answer": "hago"}])
+                self.assertEqual(first.get_etag(), second.get_etag())
+                cached_quiz_response({"seed": 2}, build)
+                self.assertEqual(len(get_quiz_cache()), 1)
+            headers = {"If-None-Match": f'"{first.get_etag()[0]}"'}
+            with self.app.test_request_context(headers=headers):
+                self.assertEqual(cached_quiz_response(
+                    {"seed": 1}, build).status_code, 304)
+                self.assertEqual(len(builds), 3)
+            with self.app.test_request_context(method="POST",
+                                               headers=headers):
+                response = cached_quiz_response({"seed": 1}, build, 201)
+                self.assertEqual(response.status_code, 201)
+                self.assertEqual(response.get_json(), [{"answer": "hago"}])
+        finally:
+            self.app.config.pop('QUIZ_CACHE_SIZE')
+            self.app.extensions.pop('quiz_cache', None)
+
+    def test_quiz_cache_lru(self):
+        """Verify that the quiz cache evicts its least recently used entry
+        when full."""
+        cache = QuizCache(2)
+        cache.add("a", ("[]", "1"))
+        cache.add("b", ("[]", "2"))
+        self.assertEqual(cache.get("a"), ("[]", "1"))
+        self.assertEqual(cache.add("a", ("[1]", "3")), ("[]", "1"))
+        cache.add("c", ("[]", "4"))
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), ("[]", "4"))
+
+    def test_quiz_item_from_trusted(self):
+        """Verify that a trusted QuizItem matches a validated one without
+        conjugating the verb again."""
+        with self.app.app_context():
+            verb = Verb("hacer")
+            with mock.patch.object(Verb, "conjugate") as conjugate:
+                item = QuizItem.from_trusted((verb, "present", "yo"), "hago")
+            conjugate.assert_not_called()
+            self.assertEqual(str(item),
+                             str(QuizItem((verb, "present", "yo"), "hago")))
+
     def test_quiz_str_method(self):
         """Verify that the __str__ method returns the expected string
         representation for a Quiz object."""
@@ -0,0 +1,140 @@
+import unittest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from backend.app.extensions import db
+from backend.app.paradigm_store import DERIVED_EXTENSIONS
+from backend.app.routes import main
+from backend.tests.setup_tests import setup_testing_db
+
+
+class TestRoutes(unittest.TestCase):
+    app: Flask
+    db: SQLAlchemy
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up testing database and register the API routes."""
+        setup_testing_db(cls)
+        cls.app.register_blueprint(main, url_prefix='/api')
+        cls.client = cls.app.test_client()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down testing database."""
+        with cls.app.app_context():
+            db.drop_all()
+
+    def tearDown(self):
+        """Discard the indexes and caches built by a request."""
+        for key in DERIVED_EXTENSIONS:
+            self.app.extensions.pop(key, None)
+
+    def test_generate_quizzes_seeded_filter(self):
+        """Verify that a seeded batch of quizzes with a verb filter is the
+        same on every request."""
+        data = {"filter": "regular or irregular", "tenses": ["present"],
+                "pronouns": ["yo", "tú"], "count": 3, "seeds": [4, 5, 6]}
+        first = self.client.post('/api/generate_quizzes', json=data)
+        second = self.client.post('/api/generate_quizzes', json=data)
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(len(first.get_json()), 3)
+        self.assertEqual(first.get_json(), second.get_json())
+
+
+    def test_search_forms(self):
+        """Verify that form search returns matching forms with their cells,
+        and that a missing or letterless pattern or a bad page gives a
+        400."""
+        response = self.client.get('/api/forms/search?pattern=hag*')
+        self.assertEqual(response.status_code, 200)
+        forms = {form['form']: form['cells']
+                 for form in response.get_json()['forms']}
+        self.assertIn({'verb': "hacer", 'tense': "present", 'pronoun': "yo"},
+                      forms["hago"])
+        for query in ["", "?pattern=*", "?pattern=**",
+                      "?pattern=hag*&page=0", "?pattern=hag*&per_page=201"]:
+            response = self.client.get(f'/api/forms/search{query}')
+            self.assertEqual(response.status_code, 400, query)
+            self.assertIn('error', response.get_json())
+
+
+    def test_similar_verbs(self):
+        """Verify that similar verbs leave out the verb itself, and that an
+        unknown verb or a bad limit gives a 400."""
+        response = self.client.get('/api/verbs/Hacer/similar?limit=3')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("hacer", [verb['verb']
+                                   for verb in response.get_json()])
+        for path in ['/api/verbs/abcd/similar',
+                     '/api/verbs/hacer/similar?limit=0',
+                     '/api/verbs/hacer/similar?limit=51']:
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 400, path)
+            self.assertIn('error', response.get_json())
+
+
+    def test_complete_verbs(self):
+        """Verify that completion ranks verbs by their conjugation table
+        requests, and that a bad limit gives a 400."""
+        response = self.client.get('/api/verbs/complete?prefix=H')
+        self.assertEqual(response.get_json(), ["hacer", "hablar"])
+        try:
+            self.client.get('/api/conjugate/hablar')
+            response = self.client.get('/api/verbs/complete?prefix=h')
+            self.assertEqual(response.get_json(), ["hablar", "hacer"])
+        finally:
+            self.app.extensions.pop('verb_popularity', None)
+        for limit in [0, 51]:
+            response = self.client.get(
+                f'/api/verbs/complete?prefix=h&limit={limit}')
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('error', response.get_json())
+
+
+    def test_generate_quizzes_invalid(self):
+        """Verify that a batch with missing lists, a bad count, or malformed
+        seeds gives a 400."""
+        data = {"verbs": ["hacer"], "tenses": ["present"],
+                "pronouns": ["yo"]}
+        for invalid in [{"tenses": ["present"], "pronouns": ["yo"]},
+                        dict(data, count=0), dict(data, count=301),
+                        dict(data, count=True),
+                        dict(data, count=2, seeds=5),
+                        dict(data, count=2, seeds=[1]),
+                        dict(data, count=2, seeds=[1, "2"]),
+                        dict(data, count=2, seeds=[1, False]),
+                        dict(data, verbs=["abcd"])]:
+            response = self.client.post('/api/generate_quizzes',
+                                        json=invalid)
+            self.assertEqual(response.status_code, 400, invalid)
+            self.assertIn('Error', response.get_json(force=True))
+
+    def test_seeded_quiz_cache(self):
+        """Verify that a seeded quiz is served with an ETag, that a POST
+        with a matching If-None-Match still gets its body with a 201, and
+        that a GET with a matching If-None-Match gets an empty 304."""
+        data = {"verbs": ["hacer", "ser"], "tenses": ["present"],
+                "pronouns": ["yo", "tú"], "seed": 7}
+        first = self.client.post('/api/generate_quiz', json=data)
+        self.assertEqual(first.status_code, 201)
+        etag = first.headers['ETag']
+        second = self.client.post('/api/generate_quiz', json=data,
+                                  headers={'If-None-Match': etag})
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second.get_json(), first.get_json())
+        self.assertEqual(second.headers['ETag'], etag)
+
+        path = '/api/generate_random_quiz?num_items=5&seed=7'
+        first = self.client.get(path)
+        self.assertEqual(first.status_code, 200)
+        second = self.client.get(path, headers={
+            'If-None-Match': first.headers['ETag']})
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.data, b"")
+        response = self.client.get('/api/generate_random_quiz?seed=x')
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
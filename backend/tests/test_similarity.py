@@ -0,0 +1,96 @@
+import unittest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from backend.app.extensions import db
+from backend.app.verb_index import (get_similarity_index,
+                                    init_similarity_index)
+from backend.core import DictSource
+from backend.core.similarity import SimilarityIndex, get_paradigm_features
+from backend.tests.setup_tests import setup_testing_db
+
+TENER = {
+    "present": ["tengo", "tienes", "tiene", "tenemos", "tenéis", "tienen"],
+    "preterite": ["tuve", "tuviste", "tuvo", "tuvimos", "tuvisteis",
+                  "tuvieron"],
+    "participles": ["teniendo", "tenido"],
+}
+
+
+def prefixed(prefix: str, conjugations: dict) -> dict:
+    """Return the conjugations of a verb with a prefix added to each
+    form."""
+    return {tense: [prefix + form for form in forms]
+            for tense, forms in conjugations.items()}
+
+
+class TestSimilarity(unittest.TestCase):
+    app: Flask
+    db: SQLAlchemy
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up testing database."""
+        setup_testing_db(cls)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down testing database."""
+        with cls.app.app_context():
+            db.drop_all()
+
+    def test_features(self):
+        """Verify that paradigm features are relative to the verb's stem,
+        so prefixed verbs share them."""
+        table = {"preterite": {"yo": "tuve"},
+                 "present_perfect": {"yo": "he tenido", "tú": "has tenido"}}
+        self.assertEqual(get_paradigm_features("tener", table),
+                         {"preterite:yo:2:uve", "participle:past:0:ido"})
+        self.assertEqual(get_paradigm_features(
+            "mantener", {"preterite": {"yo": "mantuve"}}),
+            {"preterite:yo:2:uve"})
+
+    def test_similar(self):
+        """Verify that verbs conjugated alike rank first, and that an
+        unknown verb raises a ValueError."""
+        source = DictSource({"tener": TENER,
+                             "mantener": prefixed("man", TENER),
+                             "obtener": prefixed("ob", TENER)},
+                            ["hablar", "cantar", "vivir"])
+        index = SimilarityIndex.from_source(source)
+        self.assertEqual(index.similar("tener", 2),
+                         [("mantener", 1.0), ("obtener", 1.0)])
+        self.assertEqual(index.similar("hablar", 1), [("cantar", 1.0)])
+        self.assertLess(len(index.signatures), len(index.verbs))
+        with self.assertRaises(ValueError):
+            index.similar("comer")
+
+    def test_app_index(self):
+        """Verify that the app builds its similarity index once."""
+        with self.app.app_context():
+            self.app.extensions.pop('similarity_index', None)
+            try:
+                index = get_similarity_index()
+                self.assertIs(get_similarity_index(), index)
+                self.assertNotIn("hacer", [
+                    infinitive for infinitive, _ in index.similar("hacer")])
+            finally:
+                self.app.extensions.pop('similarity_index', None)
+
+    def test_app_index_preload(self):
+        """Verify that the similarity index is only built at startup when
+        the app sets SIMILARITY_INDEX_PRELOAD."""
+        init_similarity_index(self.app)
+        self.assertNotIn('similarity_index', self.app.extensions)
+        self.app.config['SIMILARITY_INDEX_PRELOAD'] = True
+        try:
+            init_similarity_index(self.app)
+            self.assertIsInstance(self.app.extensions['similarity_index'],
+                                  SimilarityIndex)
+        finally:
+            self.app.config.pop('SIMILARITY_INDEX_PRELOAD')
+            self.app.extensions.pop('similarity_index', None)
+
+
+if __name__ == "__main__":
+    unittest.main()
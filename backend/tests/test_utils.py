@@ -4,8 +4,11 @@ from flask_sqlalchemy import SQLAlchemy
 
 from backend.app.extensions import db
 from backend.app.resources.verb import Verb
-from backend.app.utils import (is_valid_tense, is_valid_pronoun,
-                       get_present_participle, get_past_participle)
+from backend.core.utils import (is_valid_tense, is_valid_pronoun,
+                       get_present_participle, get_past_participle, PRONOUNS,
+                       TENSE_DESCRIPTORS, get_tense)
+from backend.core.utils.conjugate import (ALL_TENSES, conjugate_paradigm,
+                                         conjugate_many)
 from backend.tests.setup_tests import setup_testing_db
 
 
@@ -43,6 +46,29 @@ class TestUtils(unittest.TestCase):
         empty string tense."""
         self.assertFalse(is_valid_tense(""))
 
+    def test_is_valid_tense5(self):
+        """Verify that is_valid_tense returns False given an unhashable
+        value."""
+        self.assertFalse(is_valid_tense(["present"]))
+
+    def test_tense_descriptors(self):
+        """Verify that every tense has a descriptor whose id is its index
+        and whose function conjugates the tense."""
+        self.assertEqual([tense.name for tense in TENSE_DESCRIPTORS],
+                         list(ALL_TENSES))
+        for tense_id, descriptor in enumerate(TENSE_DESCRIPTORS):
+            self.assertEqual(descriptor.id, tense_id)
+            self.assertIs(get_tense(descriptor.name), descriptor)
+            self.assertEqual(descriptor.compound,
+                             descriptor.auxiliary_forms is not None)
+        with self.app.app_context():
+            verb = Verb("hablar")
+            self.assertEqual(get_tense("present").function(verb, "yo"),
+                             "hablo")
+        self.assertEqual(get_tense("past_progressive").participle, "present")
+        self.assertEqual(get_tense("pluperfect").participle, "past")
+        self.assertIsNone(get_tense("abcd"))
+
     def test_is_valid_pronoun1(self):
         """Verify that is_valid_pronoun returns True given a valid pronoun."""
         self.assertTrue(is_valid_pronoun("yo"))
@@ -108,6 +134,51 @@ class TestUtils(unittest.TestCase):
             verb = Verb("vivir")
             self.assertEqual(get_past_participle(verb), "vivido")
 
+    def test_conjugate_paradigm1(self):
+        """Verify that conjugate_paradigm returns the same forms as
+        conjugating a regular verb one tense and pronoun at a time."""
+        with self.app.app_context():
+            for infinitive in ["hablar", "beber", "vivir"]:
+                verb = Verb(infinitive)
+                table = conjugate_paradigm(verb)
+                self.assertEqual(list(table), list(ALL_TENSES))
+                for tense in ALL_TENSES:
+                    for pronoun in PRONOUNS:
+                        if pronoun == "yo" and "imperative" in tense:
+                            self.assertIsNone(table[tense][pronoun])
+                        else:
+                            self.assertEqual(table[tense][pronoun],
+                                             verb.conjugate(tense, pronoun))
+
+    def test_conjugate_paradigm2(self):
+        """Verify that conjugate_paradigm returns only the requested tenses
+        and pronouns."""
+        with self.app.app_context():
+            verb = Verb("vivir")
+            self.assertEqual(
+                conjugate_paradigm(verb, ["preterite", "present_perfect"],
+                                   ["yo", "vosotros"]),
+                {"preterite": {"yo": "viví", "vosotros": "vivisteis"},
+                 "present_perfect": {"yo": "he vivido",
+                                     "vosotros": "habéis vivido"}})
+
+    def test_conjugate_paradigm3(self):
+        """Verify that conjugate_paradigm raises a ValueError given an
+        invalid tense."""
+        with self.app.app_context():
+            verb = Verb("hablar")
+            with self.assertRaises(ValueError):
+                conjugate_paradigm(verb, ["abcd"])
+
+    def test_conjugate_many(self):
+        """Verify that conjugate_many returns a table for each verb in
+        order."""
+        with self.app.app_context():
+            verbs = [Verb("hablar"), Verb("beber")]
+            tables = conjugate_many(verbs, ["present"], ["nosotros"])
+            self.assertEqual(tables, [{"present": {"nosotros": "hablamos"}},
+                                      {"present": {"nosotros": "bebemos"}}])
+
 
 if __name__ == "__main__":
     unittest.main()
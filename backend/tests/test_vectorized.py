@@ -0,0 +1,111 @@
+import unittest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from backend.app.extensions import db
+from backend.app.paradigm_store import ParadigmStore
+from backend.app.resources.verb import Verb
+from backend.core import DictSource, Verb as CoreVerb
+from backend.core.utils import PRONOUNS
+from backend.core.utils.conjugate import ALL_TENSES
+from backend.core.utils.vectorized import (np, conjugate_matrix,
+                                          apply_overrides)
+from backend.tests.setup_tests import setup_testing_db
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestVectorized(unittest.TestCase):
+    app: Flask
+    db: SQLAlchemy
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up testing database."""
+        setup_testing_db(cls)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down testing database."""
+        with cls.app.app_context():
+            db.drop_all()
+
+    def test_conjugate_matrix_shape(self):
+        """Verify that conjugate_matrix returns a verb by tense by pronoun
+        array."""
+        matrix = conjugate_matrix(["habl", "beb"], ["ar", "er"],
+                                  ["present", "future"])
+        self.assertEqual(matrix.shape, (2, 2, 6))
+
+    def test_conjugate_matrix_regular(self):
+        """Verify that conjugate_matrix returns the same forms as the
+        conjugate method for regular verbs."""
+        with self.app.app_context():
+            verbs = [Verb("hablar"), Verb("beber"), Verb("vivir")]
+            matrix = conjugate_matrix([verb.stem for verb in verbs],
+                                      [verb.ending for verb in verbs])
+            for v, verb in enumerate(verbs):
+                for t, tense in enumerate(ALL_TENSES):
+                    for p, pronoun in enumerate(PRONOUNS):
+                        if pronoun == "yo" and "imperative" in tense:
+                            self.assertEqual(matrix[v, t, p], "")
+                        else:
+                            self.assertEqual(matrix[v, t, p],
+                                             verb.conjugate(tense, pronoun))
+
+    def test_conjugate_matrix_invalid_tense(self):
+        """Verify that conjugate_matrix raises a ValueError given an invalid
+        tense."""
+        with self.assertRaises(ValueError):
+            conjugate_matrix(["habl"], ["ar"], ["abcd"])
+
+    def test_conjugate_matrix_mismatched_lengths(self):
+        """Verify that conjugate_matrix raises a ValueError given more stems
+        than endings."""
+        with self.assertRaises(ValueError):
+            conjugate_matrix(["habl", "beb"], ["ar"])
+
+    def test_apply_overrides(self):
+        """Verify that applying the stored irregular forms gives the same
+        forms as the conjugate method for every verb."""
+        store = ParadigmStore(self.app)
+        try:
+            with self.app.app_context():
+                infinitives = ["hacer", "ser", "decir", "ir", "hablar",
+                               "beber", "vivir"]
+                matrix = conjugate_matrix(
+                    [infinitive[:-2] for infinitive in infinitives],
+                    [infinitive[-2:] for infinitive in infinitives])
+                matrix = apply_overrides(matrix, infinitives,
+                                         store.conjugations,
+                                         store.participles)
+                for v, infinitive in enumerate(infinitives):
+                    verb = Verb(infinitive)
+                    for t, tense in enumerate(ALL_TENSES):
+                        for p, pronoun in enumerate(PRONOUNS):
+                            if pronoun == "yo" and "imperative" in tense:
+                                continue
+                            self.assertEqual(matrix[v, t, p],
+                                             verb.conjugate(tense, pronoun))
+        finally:
+            self.app.extensions.pop('paradigm_store')
+
+    def test_apply_overrides_stored_compound(self):
+        """Verify that stored compound tense forms win over the forms built
+        from stored participles, as in the conjugate method."""
+        present_perfect = ("he vuelto", "has vuelto", "ha vuelto",
+                           "hemos vuelto", "habéis vuelto", "han vuelto")
+        source = DictSource({"volver": {
+            "present_perfect": present_perfect,
+            "participles": ("volviendo", "volvido")}})
+        verb = CoreVerb("volver", source)
+        tenses = ["present_perfect", "pluperfect"]
+        matrix = apply_overrides(
+            conjugate_matrix(["volv"], ["er"], tenses), ["volver"],
+            {("volver", "present_perfect"): present_perfect},
+            {"volver": ("volviendo", "volvido")}, tenses)
+        for t, tense in enumerate(tenses):
+            for p, pronoun in enumerate(PRONOUNS):
+                self.assertEqual(matrix[0, t, p],
+                                 verb.conjugate(tense, pronoun))
+        self.assertEqual(matrix[0, 0, 0], "he vuelto")
+        self.assertEqual(matrix[0, 1, 0], "había volvido")
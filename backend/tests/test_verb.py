@@ -1,9 +1,12 @@
 import unittest
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 
 from backend.app.extensions import db
+from backend.app.models import IrregularVerb, RegularVerb
 from backend.app.resources.verb import Verb
+from backend.core.utils import PRONOUNS, COMPOUND_TENSES
 from backend.tests.setup_tests import setup_testing_db
 
 
@@ -1450,6 +1453,271 @@ class TestVerbs(unittest.TestCase):
             self.assertEqual(verb.conjugate("pluperfect_subjunctive_se", "tú"),
                              "hubieses dicho")
 
+    def test_verb_get1(self):
+        """Verify that Verb.get returns the same Verb object for repeated
+        calls with the same infinitive."""
+        with self.app.app_context():
+            self.assertIs(Verb.get("hacer"), Verb.get("hacer"))
+            self.assertIs(Verb.get("HABLAR"), Verb.get("hablar"))
+
+    def test_verb_get2(self):
+        """Verify that Verb.get raises a ValueError given an invalid verb
+        or a value that is not a string."""
+        with self.app.app_context():
+            for infinitive in ["abcd", None, 1]:
+                with self.assertRaises(ValueError):
+                    Verb.get(infinitive)
+
+    def test_verb_get3(self):
+        """Verify that repeated calls to Verb.get do not query the
+        database."""
+        statements = []
+
+        def count(*args):
+            statements.append(args[2])
+
+        with self.app.app_context():
+            Verb.get("vivir")
+            engine = db.engine
+            event.listen(engine, 'before_cursor_execute', count)
+            try:
+                Verb.get("vivir")
+            finally:
+                event.remove(engine, 'before_cursor_execute', count)
+        self.assertEqual(statements, [])
+
+    def test_verb_id(self):
+        """Verify that the id property returns the database id of the verb
+        from its table."""
+        with self.app.app_context():
+            self.assertEqual(Verb("beber").id, RegularVerb.query.filter_by(
+                infinitive="beber").first().id)
+            self.assertEqual(Verb("decir").id, IrregularVerb.query.filter_by(
+                infinitive="decir").first().id)
+
+    def test_verb_immutable(self):
+        """Verify that the properties of a Verb object cannot be set."""
+        with self.app.app_context():
+            verb = Verb.get("hablar")
+            with self.assertRaises(AttributeError):
+                verb.infinitive = "beber"
+            with self.assertRaises(AttributeError):
+                verb.translation = "to speak"
+
+    def test_from_infinitives1(self):
+        """Verify that from_infinitives returns the shared Verb objects in
+        order without duplicates."""
+        with self.app.app_context():
+            verbs = Verb.from_infinitives(["ser", "hablar", "SER", "ir"])
+            self.assertEqual([verb.infinitive for verb in verbs],
+                             ["ser", "hablar", "ir"])
+            self.assertIs(verbs[0], Verb.get("ser"))
+            self.assertTrue(verbs[1].is_regular)
+            self.assertFalse(verbs[2].is_regular)
+
+    def test_from_infinitives2(self):
+        """Verify that from_infinitives raises a single ValueError listing
+        every invalid verb."""
+        with self.app.app_context():
+            with self.assertRaises(ValueError) as context:
+                Verb.from_infinitives(["abcd", "hablar", "efgh"])
+            self.assertEqual(str(context.exception),
+                             "Invalid verbs: abcd, efgh")
+
+    def test_from_infinitives3(self):
+        """Verify that from_infinitives raises a ValueError given a list
+        that contains a non-string."""
+        with self.app.app_context():
+            with self.assertRaises(ValueError) as context:
+                Verb.from_infinitives(["hablar", 1])
+            self.assertEqual(str(context.exception),
+                             "verbs must be a list of strings")
+
+    def test_from_infinitives4(self):
+        """Verify that from_infinitives resolves new verbs with one query
+        per verb table."""
+        statements = []
+
+        def count(*args):
+            statements.append(args[2])
+
+        with self.app.app_context():
+            self.app.extensions.pop('verb_registry', None)
+            engine = db.engine
+            event.listen(engine, 'before_cursor_execute', count)
+            try:
+                Verb.from_infinitives(["hacer", "ser", "decir", "ir",
+                                       "hablar", "beber", "vivir"])
+            finally:
+                event.remove(engine, 'before_cursor_execute', count)
+        self.assertEqual(len(statements), 2)
+
+    def test_paradigm_cached(self):
+        """Verify that an irregular verb loads its stored forms in one query
+        and conjugates every simple and compound tense without further
+        queries."""
+        statements = []
+
+        def count(*args):
+            statements.append(args[2])
+
+        with self.app.app_context():
+            self.app.extensions.pop('verb_source', None)
+            verb = Verb("hacer")
+            engine = db.engine
+            event.listen(engine, 'before_cursor_execute', count)
+            try:
+                for tense in ["present", "preterite", "present_perfect",
+                              "present_progressive"]:
+                    for pronoun in PRONOUNS:
+                        verb.conjugate(tense, pronoun)
+                self.assertEqual(verb.conjugate("present_perfect", "yo"),
+                                 "he hecho")
+            finally:
+                event.remove(engine, 'before_cursor_execute', count)
+        self.assertEqual(len(statements), 1)
+
+    def test_participles(self):
+        """Verify that the participles property returns the stored irregular
+        participles or the regular ones."""
+        with self.app.app_context():
+            self.assertEqual(Verb("decir").participles, ("diciendo", "dicho"))
+            self.assertEqual(Verb("vivir").participles, ("viviendo", "vivido"))
+
+    def test_compound_block_queries(self):
+        """Verify that conjugating every compound tense of a verb issues at
+        most one query."""
+        statements = []
+
+        def count(*args):
+            statements.append(args[2])
+
+        with self.app.app_context():
+            for infinitive in ["hablar", "ser"]:
+                verb = Verb(infinitive)
+                statements.clear()
+                engine = db.engine
+                event.listen(engine, 'before_cursor_execute', count)
+                try:
+                    for tense in COMPOUND_TENSES:
+                        for pronoun in PRONOUNS:
+                            verb.conjugate(tense, pronoun)
+                finally:
+                    event.remove(engine, 'before_cursor_execute', count)
+                self.assertLessEqual(len(statements), 1)
+
+    def test_open_vocabulary1(self):
+        """Verify that an unknown verb raises a ValueError unless open
+        vocabulary is enabled."""
+        with self.app.app_context():
+            with self.assertRaises(ValueError):
+                Verb.get("caminar")
+            self.app.config['OPEN_VOCABULARY_ENABLED'] = True
+            try:
+                verb = Verb.get("caminar")
+                self.assertFalse(verb.is_verified)
+                self.assertIsNone(verb.id)
+                self.assertEqual(verb.conjugate("preterite", "yo"), "caminé")
+                self.assertIs(Verb.get("CAMINAR"), verb)
+                self.assertTrue(Verb.get("hablar").is_verified)
+                with self.assertRaises(ValueError):
+                    Verb.get("abcd")
+            finally:
+                self.app.config.pop('OPEN_VOCABULARY_ENABLED')
+                self.app.extensions.pop('unverified_verbs', None)
+
+    def test_open_vocabulary2(self):
+        """Verify that from_infinitives caches unverified verbs and still
+        lists every malformed verb."""
+        statements = []
+
+        def count(*args):
+            statements.append(args[2])
+
+        with self.app.app_context():
+            self.app.config['OPEN_VOCABULARY_ENABLED'] = True
+            self.app.config['OPEN_VOCABULARY_CACHE_SIZE'] = 2
+            try:
+                verbs = Verb.from_infinitives(["hablar", "correr", "partir",
+                                               "subir"])
+                self.assertEqual([verb.is_verified for verb in verbs],
+                                 [True, False, False, False])
+                self.assertEqual(len(self.app.extensions['unverified_verbs']),
+                                 2)
+                engine = db.engine
+                event.listen(engine, 'before_cursor_execute', count)
+                try:
+                    Verb.from_infinitives(["hablar", "subir"])
+                finally:
+                    event.remove(engine, 'before_cursor_execute', count)
+                self.assertEqual(statements, [])
+                with self.assertRaises(ValueError) as context:
+                    Verb.from_infinitives(["abcd", "x1ar"])
+                self.assertEqual(str(context.exception),
+                                 "Invalid verbs: abcd, x1ar")
+            finally:
+                self.app.config.pop('OPEN_VOCABULARY_ENABLED')
+                self.app.config.pop('OPEN_VOCABULARY_CACHE_SIZE')
+                self.app.extensions.pop('unverified_verbs', None)
+
+    def test_reflexive1(self):
+        """Verify that a reflexive infinitive is conjugated from its base
+        irregular verb with reflexive pronouns."""
+        with self.app.app_context():
+            verb = Verb("irse")
+            self.assertTrue(verb.is_reflexive)
+            self.assertEqual(verb.infinitive, "irse")
+            self.assertEqual(verb.ending, "ir")
+            self.assertEqual(verb.conjugate("present", "yo"), "me voy")
+            self.assertEqual(verb.conjugate("present_perfect", "nosotros"),
+                             "nos hemos ido")
+            self.assertEqual(verb.conjugate("negative_imperative", "tú"),
+                             "no te vayas")
+            self.assertEqual(
+                [verb.conjugate("affirmative_imperative", pronoun)
+                 for pronoun in PRONOUNS[1:]],
+                ["vete", "váyase", "vámonos", "idos", "váyanse"])
+
+    def test_reflexive2(self):
+        """Verify that affirmative imperatives of a reflexive regular verb
+        attach the pronoun and keep the stress with a written accent."""
+        with self.app.app_context():
+            verb = Verb.get("Beberse")
+            self.assertIs(Verb.get("beberse"), verb)
+            self.assertFalse(Verb.get("beber").is_reflexive)
+            self.assertEqual(
+                [verb.conjugate("affirmative_imperative", pronoun)
+                 for pronoun in PRONOUNS[1:]],
+                ["bébete", "bébase", "bebámonos", "bebeos", "bébanse"])
+            self.assertEqual(Verb("vivirse").conjugate(
+                "affirmative_imperative", "vosotros"), "vivíos")
+            with self.assertRaises(ValueError):
+                Verb("comerse")
+
+    def test_reflexive_cached(self):
+        """Verify that a reflexive verb costs the same queries as its base
+        verb and reuses its derived forms."""
+        statements = []
+
+        def count(*args):
+            statements.append(args[2])
+
+        with self.app.app_context():
+            self.app.extensions.pop('verb_source', None)
+            verb = Verb("hacerse")
+            engine = db.engine
+            event.listen(engine, 'before_cursor_execute', count)
+            try:
+                for _ in range(2):
+                    for pronoun in PRONOUNS[1:]:
+                        verb.conjugate("preterite", pronoun)
+                        verb.conjugate("affirmative_imperative", pronoun)
+                self.assertEqual(verb.conjugate("present_perfect", "yo"),
+                                 "me he hecho")
+            finally:
+                event.remove(engine, 'before_cursor_execute', count)
+        self.assertEqual(len(statements), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
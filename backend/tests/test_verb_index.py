@@ -0,0 +1,141 @@
+import unittest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from backend.app.extensions import db
+from backend.app.sources import get_verb_source
+from backend.app.verb_index import (get_verb_completer, get_verb_index,
+                                    record_verb_use)
+from backend.core import DictSource, Verb, VerbIndex
+from backend.core.completion import VerbCompleter
+from backend.core.verb_index import get_verb_properties, parse_filter
+from backend.tests.setup_tests import setup_testing_db
+
+
+class TestVerbIndex(unittest.TestCase):
+    app: Flask
+    db: SQLAlchemy
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up testing database."""
+        setup_testing_db(cls)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down testing database."""
+        with cls.app.app_context():
+            db.drop_all()
+
+    def test_verb_properties(self):
+        """Verify that a verb's properties name its ending, the tenses its
+        stored forms differ from the rules in, and its pattern's rules."""
+        present = ("pido", "pides", "pide", "pedimos", "pedís", "piden")
+        properties = get_verb_properties(
+            "pedir", False, {"present": present}, ("pidiendo", "pedido"))
+        self.assertEqual(properties, {
+            "ending:ir", "irregular", "irregular:present", "stem:e>i",
+            "irregular:present_progressive", "irregular:past_progressive"})
+        self.assertEqual(get_verb_properties("hablar", True),
+                         {"ending:ar", "regular"})
+        self.assertEqual(get_verb_properties("sonreír", False),
+                         {"ending:ir", "irregular"})
+
+    def test_search(self):
+        """Verify that filter expressions combine properties with and, or,
+        not, and parentheses, and that accented -ír verbs are -ir verbs."""
+        index = VerbIndex([
+            ("hablar", {"ending:ar", "regular"}),
+            ("vivir", {"ending:ir", "regular"}),
+            ("pedir", {"ending:ir", "irregular", "irregular:preterite"}),
+            ("ser", {"ending:er", "irregular", "irregular:present"}),
+            ("sonreír", get_verb_properties("sonreír", False))])
+        self.assertEqual(index.search("ending:ir AND irregular:preterite"),
+                         ["pedir"])
+        self.assertEqual(index.search("not (irregular:present or "
+                                      "irregular:preterite)"),
+                         ["hablar", "sonreír", "vivir"])
+        self.assertEqual(index.search("ending:ir"),
+                         ["pedir", "sonreír", "vivir"])
+        self.assertEqual(index.search("ending:ar or ending:er and regular"),
+                         ["hablar"])
+        self.assertEqual(index.search("stem:o>ue"), [])
+
+    def test_invalid_filter(self):
+        """Verify that malformed filters and unknown properties raise a
+        ValueError."""
+        index = VerbIndex([("hablar", {"ending:ar", "regular"})])
+        for expression in ["", "regular and", "(regular", "regular)",
+                           "ending:xx", "not"]:
+            with self.assertRaises(ValueError):
+                index.search(expression)
+        with self.assertRaises(ValueError):
+            index.search(["regular"])
+        self.assertEqual(parse_filter("NOT regular"), ("not", "regular"))
+
+    def test_from_source(self):
+        """Verify that an index built from a source matches the source's
+        stored irregular forms."""
+        source = DictSource({"ser": {"present": [
+            "soy", "eres", "es", "somos", "sois", "son"]}},
+            ["hablar", "comer"])
+        index = VerbIndex.from_source(source)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.search("irregular:present"), ["ser"])
+        self.assertEqual(index.search("regular and not ending:ir"),
+                         ["comer", "hablar"])
+
+    def test_app_index(self):
+        """Verify that the app builds its verb index once from its verb
+        source."""
+        with self.app.app_context():
+            self.app.extensions.pop('verb_index', None)
+            try:
+                index = get_verb_index()
+                self.assertIs(get_verb_index(), index)
+                self.assertEqual(index.search("ending:ir and "
+                                              "irregular:preterite"),
+                                 ["decir", "ir"])
+                self.assertEqual(index.search("regular"),
+                                 ["beber", "hablar", "vivir"])
+            finally:
+                self.app.extensions.pop('verb_index', None)
+
+    def test_complete(self):
+        """Verify that completion ignores accents and ranks popular verbs,
+        then irregular verbs, first."""
+        completer = VerbCompleter([("sonreír", False), ("sonar", True),
+                                   ("soñar", False), ("sentir", False),
+                                   ("sobrar", True)])
+        self.assertEqual(completer.complete("sonre"), ["sonreír"])
+        self.assertEqual(completer.complete("SON"),
+                         ["sonreír", "soñar", "sonar"])
+        self.assertEqual(completer.complete("so", 2, {"sobrar": 3}),
+                         ["sobrar", "sonreír"])
+        self.assertEqual(completer.complete("x"), [])
+        self.assertEqual(len(completer.complete("")), 5)
+        with self.assertRaises(ValueError):
+            completer.complete(None)
+
+    def test_app_completer(self):
+        """Verify that the app's completer ranks verbs by their conjugation
+        table requests, counting only verbs in the catalog."""
+        with self.app.app_context():
+            self.app.extensions.pop('verb_completer', None)
+            try:
+                completer = get_verb_completer()
+                self.assertIs(get_verb_completer(), completer)
+                self.assertEqual(completer.complete("h"), ["hacer", "hablar"])
+                source = get_verb_source()
+                for infinitive in ["Hablar", "hablarse", "xyzar"]:
+                    record_verb_use(Verb(infinitive, source,
+                                         open_vocabulary=True))
+                self.assertEqual(self.app.extensions['verb_popularity'],
+                                 {"hablar": 1})
+            finally:
+                self.app.extensions.pop('verb_completer', None)
+                self.app.extensions.pop('verb_popularity', None)
+
+
+if __name__ == "__main__":
+    unittest.main()
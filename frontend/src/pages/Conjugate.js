@@ -19,9 +19,13 @@ import {
 } from '@mui/material';
 import CloseIcon from '@mui/icons-material/Close';
 
+// Delay after the last keystroke before fetching verb completions
+const COMPLETION_DELAY_MS = 250;
+
 function Conjugate() {
   const [verb, setVerb] = useState('');
-  const [allVerbs, setAllVerbs] = useState([]);
+  const [verbInput, setVerbInput] = useState('');
+  const [verbOptions, setVerbOptions] = useState([]);
   const [conjugations, setConjugations] = useState({});
   const hasConjugations = Object.keys(conjugations).length > 0;
   const [isLoading, setIsLoading] = useState(false);
@@ -64,13 +68,18 @@ function Conjugate() {
   };
 
   useEffect(() => {
+    const controller = new AbortController();
     const fetchVerbs = async () => {
       try {
-        const response = await fetch("https://conjuga-coach-app.uk.r.appspot.com/api/verbs");
+        const prefix = encodeURIComponent(verbInput);
+        const response = await fetch(`https://conjuga-coach-app.uk.r.appspot.com/api/verbs/complete?prefix=${prefix}&limit=20`, { signal: controller.signal });
         if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
         const data = await response.json();
-        setAllVerbs(data);
+        // Ignore results of a request superseded by newer input
+        if (controller.signal.aborted) return;
+        setVerbOptions(data);
       } catch (error) {
+        if (error.name === 'AbortError') return;
         console.error("Error fetching verbs:", error);
         let errorMessage = 'Sorry, there was a problem fetching verbs.';
         if (error.message === 'Timeout') {
@@ -83,8 +92,14 @@ function Conjugate() {
       }
     };
   
-    fetchVerbs();
-  }, []);
+    // Wait for a pause in typing before fetching, and cancel the pending
+    // or in-flight request when the input changes
+    const timer = setTimeout(fetchVerbs, COMPLETION_DELAY_MS);
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [verbInput]);
 
   const pronouns = ["yo", "tú", "él/ella/Ud.", "nosotros", "vosotros", "ellos/ellas/Uds."];
   const tableConfigurations = [
@@ -163,7 +178,7 @@ function Conjugate() {
       <Box sx={{ display: 'flex', flexDirection: 'row', justifyContent: 'center', alignItems: 'center', marginTop: 4, gap: 2 }}>
         <form onSubmit={handleSubmit} style={{ display: 'flex', gap: '10px', alignItems: 'center' }}>
           <Autocomplete
-            options={allVerbs}
+            options={verbOptions}
             getOptionLabel={(option) => option}
             value={verb}
             onChange={(event, newValue) => {
@@ -172,11 +187,9 @@ function Conjugate() {
                 setVerbError('');
               }
             }}
-            filterOptions={(options, { inputValue }) => {
-              return options.filter(option => 
-                option.toLowerCase().startsWith(inputValue.toLowerCase())
-              );
-            }}
+            inputValue={verbInput}
+            onInputChange={(event, newInputValue) => setVerbInput(newInputValue)}
+            filterOptions={(options) => options}
             renderInput={(params) => (
               <TextField 
                 {...params} 
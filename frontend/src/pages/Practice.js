@@ -34,7 +34,8 @@ const PRONOUN_OPTIONS = ["yo", "tú", "él/ella/Ud.", "nosotros", "vosotros", "e
 function Practice() {
   const navigate = useNavigate();
   const location = useLocation();
-  const [allVerbs, setAllVerbs] = useState([]);
+  const [verbInput, setVerbInput] = useState("");
+  const [verbOptions, setVerbOptions] = useState([]);
   const [verbs, setVerbs] = useState([]);
   const [tenses, setTenses] = useState([]);
   const [pronouns, setPronouns] = useState([]);
@@ -235,13 +236,19 @@ function Practice() {
       setSnackbarMessage("No quiz data found. Please start the quiz from this page.")
       setOpenSnackbar(true);
     }
+  }, [location]);
+
+  useEffect(() => {
+    let ignore = false;
     const fetchVerbs = async () => {
       try {
-        const response = await fetchWithTimeout("https://conjuga-coach-app.uk.r.appspot.com/api/verbs");
+        const prefix = encodeURIComponent(verbInput);
+        const response = await fetchWithTimeout(`https://conjuga-coach-app.uk.r.appspot.com/api/verbs/complete?prefix=${prefix}&limit=20`);
         if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
         const data = await response.json();
-        setAllVerbs(data);
+        if (!ignore) setVerbOptions(data);
       } catch (error) {
+        if (ignore) return;
         console.error("Error fetching verbs: ", error);
         let errorMessage = 'Sorry, there was a problem fetching verbs.';
         if (error.message === 'Timeout') {
@@ -255,7 +262,8 @@ function Practice() {
     };
 
     fetchVerbs();
-  }, [location]);
+    return () => { ignore = true; };
+  }, [verbInput]);
 
   const handleSubmit = async (event) => {
     event.preventDefault();
@@ -334,17 +342,15 @@ function Practice() {
             <Box sx={{ maxWidth: '450px', width: '70%' }}>
                 <Autocomplete
                   multiple
-                  options={allVerbs}
+                  options={verbOptions}
                   getOptionLabel={(option) => option}
                   value={verbs}
                   size="small"
                   disableCloseOnSelect
                   onChange={handleVerbsChange}
-                  filterOptions={(options, { inputValue }) => {
-                    return options.filter(option => 
-                      option.toLowerCase().startsWith(inputValue.toLowerCase())
-                    );
-                  }}
+                  inputValue={verbInput}
+                  onInputChange={(event, newInputValue) => setVerbInput(newInputValue)}
+                  filterOptions={(options) => options}
                   renderOption={(props, option, { selected }) => (
                     <li {...props}>
                       <Checkbox